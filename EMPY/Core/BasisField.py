@@ -0,0 +1,76 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: BasisField.py
+Date: 18/10/2026
+Description: Contains the BasisField Class, the fields of groups of sources evaluated once on a set of field points.
+             Superposition is linear in the source strengths, so with positions fixed the field of any
+             strengths is the product of the weights of the groups with the matrix of their fields. A
+             parameter sweep or an animation of many frames then costs one evaluation of every group and a
+             matrix product per frame, with the frames of frames computed together in batches.
+
+Usage: Requires numpy library and EMPY.Core.Tiling.
+'''
+
+import numpy as np
+from EMPY.Core.Tiling import DEFAULT_TILE_BYTES
+
+
+class BasisField:
+    'Fields of groups of sources on fixed field points, superposed with any weights by a matrix product.'
+
+    # basis is the (nGroups, nValues) array of the flattened field of every group at unit weight, weights
+    # the weights of the groups reproducing the system and formatter turns a flattened field into the
+    # result of evaluate, like the evaluation method the BasisField was created from.
+    def __init__(self, basis, weights, formatter):
+        self.basis = basis
+        self.weights = np.array(weights, dtype=np.float64)
+        self._formatter = formatter
+
+    # Number of groups of the basis.
+    def size(self):
+        return self.basis.shape[0]
+
+    def _check(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape[-1] != self.size():
+            raise ValueError("Expected " + str(self.size()) + " weights, got " + str(weights.shape[-1]))
+        return weights
+
+    # Field for the weights of the groups, or for the weights reproducing the system when None.
+    def evaluate(self, weights=None):
+        weights = self.weights if weights is None else self._check(weights)
+        return self._formatter(weights.dot(self.basis))
+
+    # Yield the field for every row of weights, an (nFrames, nGroups) array or any iterable of weights
+    # such as a generator. Frames are computed in batches as a single matrix product, with the batch
+    # results held in memoryBudget bytes.
+    def frames(self, weights, memoryBudget=DEFAULT_TILE_BYTES):
+        batchSize = max(1, memoryBudget // (8 * self.basis.shape[1]))
+        batch = []
+        for w in weights:
+            batch.append(self._check(w))
+            if len(batch) == batchSize:
+                yield from self._batch(batch)
+                batch = []
+        if batch:
+            yield from self._batch(batch)
+
+    def _batch(self, batch):
+        for values in np.array(batch).dot(self.basis):
+            yield self._formatter(values)
@@ -0,0 +1,133 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: FieldCache.py
+Date: 18/10/2026
+Description: Contains the FieldCache Class, a bounded least recently used cache of evaluated fields.
+             System, System3D and LoopSystem keep a FieldCache keyed by a version counter of their sources
+             and the field points the fields were evaluated on. Adding sources bumps the version and clears
+             the cache, so a stale field is never returned. The cache keeps its total size below a budget
+             in bytes and counts its hits and misses.
+
+Usage: Requires hashlib, collections and numpy libraries.
+'''
+
+import hashlib
+from collections import OrderedDict
+import numpy as np
+
+# Default eviction budget of a FieldCache, in bytes.
+DEFAULT_CACHE_BYTES = 128 * 1024 * 1024
+
+
+# Key describing the contents of a set of arrays: their shapes, dtypes and a digest of their data.
+# Two meshgrids built from the same bounds and resolution give the same key.
+def arrayKey(*arrays):
+    digest = hashlib.blake2b(digest_size=16)
+    description = []
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        description.append((a.shape, a.dtype.str))
+        digest.update(a.data)
+    return tuple(description), digest.hexdigest()
+
+
+def _nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(v) for v in value)
+    return 0
+
+
+def _copy(value):
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, (tuple, list)):
+        return type(value)(_copy(v) for v in value)
+    return value
+
+
+class FieldCache:
+    'A least recently used cache of evaluated fields, bounded by maxBytes.'
+
+    def __init__(self, maxBytes=DEFAULT_CACHE_BYTES):
+        self.maxBytes = maxBytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    # Return a copy of the cached value of key, or None. Copies are returned so that callers,
+    # such as the plotting methods which clip the potential in place, cannot corrupt the cache.
+    def get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy(self._entries[key])
+        self.misses += 1
+        return None
+
+    # Store a copy of value under key, evicting the least recently used entries to stay within maxBytes.
+    def put(self, key, value):
+        size = _nbytes(value)
+        if key in self._entries:
+            self.nbytes -= _nbytes(self._entries.pop(key))
+        if size > self.maxBytes:
+            return
+        self._entries[key] = _copy(value)
+        self.nbytes += size
+        self._evict()
+
+    def _evict(self):
+        while self.nbytes > self.maxBytes and self._entries:
+            key, value = self._entries.popitem(last=False)
+            self.nbytes -= _nbytes(value)
+
+    # Change the eviction budget, in bytes.
+    def setMaxBytes(self, maxBytes):
+        self.maxBytes = maxBytes
+        self._evict()
+
+    # Remove every entry; the hit and miss counters are kept.
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries),
+                'nbytes': self.nbytes, 'maxBytes': self.maxBytes}
+
+
+# Evaluate the (E, V) pair of a system on a (dim, m) array of field points through cache.
+# A cached pair holding both the field and the potential also serves requests for only one of them.
+def cachedEvaluate(cache, version, evaluate, points, field, potential):
+    key = (version, arrayKey(points))
+    full = key + (True, True)
+    cached = cache.get(full if full in cache else key + (field, potential))
+    if cached is None:
+        cached = evaluate(points, field, potential)
+        cache.put(key + (field, potential), cached)
+    E, V = cached
+    return (E if field else None), (V if potential else None)
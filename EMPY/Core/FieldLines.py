@@ -0,0 +1,212 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: FieldLines.py
+Date: 18/10/2026
+Description: Contains the traceFieldLines function and the FieldLines Class, a batch field line tracer.
+             Field lines are integrated along their arc length with the adaptive Dormand-Prince RK45
+             scheme, with thousands of seed points advanced together: every stage evaluates the field at
+             all active lines in a single call, and every line keeps its own step size. Lines stop at the
+             domain boundary, near sources, where the field vanishes, when they close on their seed or
+             after a maximum number of steps.
+             The traced polylines are returned packed into a single array of vertices with offsets.
+
+Usage: Requires numpy, scipy libraries.
+'''
+
+import numpy as np
+
+DIRECTIONS = ('forward', 'backward', 'both')
+# Reasons a line stops, indexed by the stop codes of FieldLines.
+STOP_REASONS = ('steps', 'boundary', 'source', 'null', 'stalled', 'closed')
+# Dormand-Prince RK45 tableau: stage nodes, stage weights, 5th order weights and 5th - 4th order error weights.
+_A = ((),
+      (1 / 5,),
+      (3 / 40, 9 / 40),
+      (44 / 45, -56 / 15, 32 / 9),
+      (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+      (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+      (35 / 384, 0., 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84))
+_B = (35 / 384, 0., 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.)
+_E = (35 / 384 - 5179 / 57600, 0., 500 / 1113 - 7571 / 16695, 125 / 192 - 393 / 640,
+      -2187 / 6784 + 92097 / 339200, 11 / 84 - 187 / 2100, -1 / 40)
+
+
+# Bounds of the box around the (n, dim) points, padded on every side by pad times its largest extent.
+def boundsAround(points, pad=1.):
+    points = np.asarray(points, dtype=np.float64)
+    lo, hi = points.min(axis=0), points.max(axis=0)
+    margin = pad * (np.max(hi - lo) or 1.)
+    return list(zip(lo - margin, hi + margin))
+
+
+class FieldLines:
+    'Polylines packed into arrays: the vertices of line i are vertices[:, offsets[i]:offsets[i + 1]].'
+
+    # stops holds the index into STOP_REASONS of why every line stopped, with a column per traced direction.
+    def __init__(self, vertices, offsets, stops):
+        self.vertices = vertices
+        self.offsets = offsets
+        self.stops = stops
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    # Vertices of line i as a (dim, k) array.
+    def line(self, i):
+        return self.vertices[:, self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self):
+        return (self.line(i) for i in range(len(self)))
+
+    # Names of the reasons every line stopped, shaped like stops.
+    def stopReasons(self):
+        return np.array(STOP_REASONS)[self.stops]
+
+    # Arc length of every line.
+    def lengths(self):
+        segments = np.linalg.norm(np.diff(self.vertices, axis=1), axis=0)
+        # Drop the segments joining the last vertex of a line to the first vertex of the next
+        segments[self.offsets[1:-1] - 1] = 0.
+        return np.add.reduceat(np.append(segments, 0.), self.offsets[:-1]) if len(self) else np.empty(0)
+
+    # (k, 2) array of the indices of the end vertices of every segment of every line, for drawing all
+    # lines in a single call.
+    def connections(self):
+        start = np.arange(self.vertices.shape[1] - 1)
+        keep = np.ones(len(start), dtype=bool)
+        keep[self.offsets[1:-1] - 1] = False
+        start = start[keep]
+        return np.array([start, start + 1]).T
+
+
+# Unit vectors along the (dim, m) field F times sign, and whether they are defined.
+def _tangent(F, sign):
+    norm = np.sqrt(np.einsum('ij,ij->j', F, F))
+    valid = np.isfinite(norm) & (norm > 0)
+    return np.divide(F * sign, norm, out=np.zeros(F.shape), where=valid), valid
+
+
+# Trace the field lines of evaluate, which returns the (dim, m) field at a (dim, m) array of points, from
+# the (dim, n) seeds within the box bounds = [(min, max), ...]. direction is 'forward' along the field,
+# 'backward' against it or 'both', joining the two halves into one line through the seed. step is the
+# initial and largest step and tolerance the local error allowed per step, both in units of length.
+# Lines also stop within stopRadius of any of the (k, dim) source points. Returns a FieldLines.
+def traceFieldLines(evaluate, seeds, bounds, direction='both', step=None, tolerance=None, maxSteps=2000,
+                    sources=None, stopRadius=0.):
+    import scipy.spatial
+    if direction not in DIRECTIONS:
+        raise ValueError("Unknown direction " + str(direction) + "; expected 'forward', 'backward' or 'both'")
+    seeds = np.asarray(seeds, dtype=np.float64)
+    dim, n = seeds.shape
+    lo, hi = np.array(bounds, dtype=np.float64).T
+    if step is None:
+        step = np.max(hi - lo) / 100.
+    if tolerance is None:
+        tolerance = step * 1e-3
+    tree = None
+    if sources is not None and len(sources) and stopRadius > 0:
+        tree = scipy.spatial.cKDTree(np.asarray(sources, dtype=np.float64))
+    signs = {'forward': [1.], 'backward': [-1.], 'both': [-1., 1.]}[direction]
+    sign = np.repeat(signs, n)
+    x = np.tile(seeds, len(signs))
+    origin = x.copy()
+    lines = len(sign)
+    # Whether a line has left its seed, so that coming back to it closes the line
+    left = np.zeros(lines, dtype=bool)
+    h = np.full(lines, float(step))
+    steps = np.zeros(lines, dtype=np.intp)
+    stops = np.zeros(lines, dtype=np.intp)
+    # Accepted vertices as (line, point) batches, the seeds first
+    recordedLines, recordedPoints = [np.arange(lines)], [x.copy()]
+
+    k1, valid = _tangent(evaluate(x), sign)
+    active = np.nonzero(valid)[0]
+    stops[~valid] = STOP_REASONS.index('null')
+    while len(active):
+        X, H, S = x[:, active], h[active], sign[active]
+        K = [k1[:, active]]
+        finite = np.ones(len(active), dtype=bool)
+        for a in _A[1:]:
+            k, valid = _tangent(evaluate(X + H * sum(ai * Ki for ai, Ki in zip(a, K) if ai)), S)
+            finite &= valid
+            K.append(k)
+        x5 = X + H * sum(b * Ki for b, Ki in zip(_B, K) if b)
+        error = np.where(finite, H * np.linalg.norm(sum(e * Ki for e, Ki in zip(_E, K) if e), axis=0), np.inf)
+        accept = error <= tolerance
+        with np.errstate(divide='ignore'):
+            factor = np.clip(0.9 * (tolerance / error) ** 0.2, 0.2, 5.)
+        h[active] = np.minimum(H * factor, step)
+
+        done = np.zeros(len(active), dtype=bool)
+        # Lines whose step shrinks to nothing without being accepted
+        stalled = ~accept & (h[active] < 1e-12 * step)
+        stops[active[stalled]] = STOP_REASONS.index('stalled')
+        done |= stalled
+
+        a = np.nonzero(accept)[0]
+        new = x5[:, a]
+        # Lines leaving the box end on its boundary
+        outside = np.any((new < lo[:, np.newaxis]) | (new > hi[:, np.newaxis]), axis=0)
+        if outside.any():
+            start, end = X[:, a[outside]], new[:, outside]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = np.where(end < lo[:, np.newaxis], (lo[:, np.newaxis] - start) / (end - start),
+                             np.where(end > hi[:, np.newaxis], (hi[:, np.newaxis] - start) / (end - start), 1.))
+            new[:, outside] = start + np.nanmin(t, axis=0) * (end - start)
+            stops[active[a[outside]]] = STOP_REASONS.index('boundary')
+            done[a[outside]] = True
+        if tree is not None:
+            distance, index = tree.query(new.T, distance_upper_bound=stopRadius)
+            near = np.isfinite(distance) & ~outside
+            stops[active[a[near]]] = STOP_REASONS.index('source')
+            done[a[near]] = True
+        # Lines passing their seed again after leaving it are closed, ending on the seed
+        seed, previous = origin[:, active[a]], X[:, a]
+        chord = new - previous
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.clip(np.einsum('ij,ij->j', seed - previous, chord) / np.einsum('ij,ij->j', chord, chord), 0., 1.)
+        closed = left[active[a]] & ~done[a] & \
+            (np.linalg.norm(np.nan_to_num(previous + t * chord) - seed, axis=0) <= 0.1 * step)
+        new[:, closed] = seed[:, closed]
+        stops[active[a[closed]]] = STOP_REASONS.index('closed')
+        done[a[closed]] = True
+        left[active[a]] |= np.linalg.norm(new - seed, axis=0) > 2. * step
+        recordedLines.append(active[a])
+        recordedPoints.append(new)
+        x[:, active[a]] = new
+        # First same as last: the last stage is the tangent at the new point
+        k1[:, active[a]] = K[-1][:, a]
+        steps[active[a]] += 1
+        exhausted = np.zeros(len(active), dtype=bool)
+        exhausted[a] = steps[active[a]] >= maxSteps
+        stops[active[exhausted & ~done]] = STOP_REASONS.index('steps')
+        active = active[~(done | exhausted)]
+
+    lineIndex = np.concatenate(recordedLines)
+    order = np.argsort(lineIndex, kind='stable')
+    vertices = np.concatenate(recordedPoints, axis=1)[:, order]
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(lineIndex, minlength=lines))])
+    if direction != 'both':
+        return FieldLines(vertices, offsets, stops[:, np.newaxis])
+    # Join the backward half, reversed, and the forward half without its copy of the seed
+    index = np.concatenate([np.r_[np.arange(offsets[i + 1] - 1, offsets[i] - 1, -1),
+                                  np.arange(offsets[n + i] + 1, offsets[n + i + 1])] for i in range(n)])
+    counts = (offsets[1:n + 1] - offsets[:n]) + (offsets[n + 1:] - offsets[n:-1]) - 1
+    return FieldLines(vertices[:, index], np.concatenate([[0], np.cumsum(counts)]),
+                      np.array([stops[:n], stops[n:]]).T)
@@ -0,0 +1,208 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: FieldSampler.py
+Date: 18/10/2026
+Description: Contains the FieldSampler Class, an interpolating sampler of a field tabulated on a Grid.
+             The field is evaluated once on the nodes of a Grid and then interpolated at any points with
+             trilinear (order 1) or tricubic spline (order 3) interpolation, at a cost independent of the
+             number of sources. With a tolerance, the interpolant of every block of cells is checked
+             against the exact field the first time a query reaches it, and blocks where it is not
+             accurate enough are refined lazily onto finer tables. Points outside the Grid, or within an
+             exclusion radius of the sources where the field is singular, are evaluated exactly.
+
+Usage: Requires numpy, scipy libraries and EMPY.Core.Tiling.
+'''
+
+import numpy as np
+from EMPY.Core.Tiling import Grid, DEFAULT_TILE_BYTES
+
+ORDERS = (1, 3)
+# Number of cells along every axis of the blocks checked and refined by a FieldSampler.
+BLOCK_CELLS = 8
+# Number of random points of a block at which its interpolant is compared with the exact field.
+CHECK_POINTS = 32
+
+# Nodes tabulated past every side of a Grid for tricubic interpolation. The spline boundary conditions spoil
+# the interpolant within a few cells of the edges of its table, by a factor of about 0.27 less every cell.
+SPLINE_PAD = 4
+
+
+# Points along the polyline through vertices, at most spacing apart, for the sources of a FieldSampler.
+def polylinePoints(vertices, spacing):
+    vertices = np.asarray(vertices, dtype=np.float64)
+    points = [vertices[:1]]
+    for a, b in zip(vertices[:-1], vertices[1:]):
+        n = max(1, int(np.ceil(np.linalg.norm(b - a) / spacing)))
+        points.append(a + np.outer(np.arange(1, n + 1) / n, b - a))
+    return np.vstack(points)
+
+
+class _Table:
+    'Values of a field on the nodes of a Grid, interpolated at (dim, m) points.'
+
+    # values holds pad more nodes past every side of the grid along its axes of more than one node.
+    def __init__(self, grid, values, order, pad=0):
+        import scipy.ndimage
+        self.lo = np.array([lo for lo, hi in grid.bounds])
+        self.spacing = np.array([(hi - lo) / (n - 1) if n > 1 else 1. for (lo, hi), n in zip(grid.bounds, grid.shape)])
+        self.order = order
+        self.pad = np.array([pad if n > 1 else 0 for n in grid.shape])
+        # Nodes on a source, where the field is infinite, are zeroed so that they only spoil the interpolant
+        # within a few cells instead of across the whole spline; keep them within the exclusion radius.
+        values = np.nan_to_num(values, nan=0., posinf=0., neginf=0.)
+        # Cubic splines interpolate their prefiltered coefficients, computed once here.
+        self.coefficients = values if order == 1 else \
+            np.array([scipy.ndimage.spline_filter(v, order=3, mode='nearest') for v in values])
+
+    # Node coordinates of the (dim, m) points.
+    def nodeCoordinates(self, points):
+        return (points - self.lo[:, np.newaxis]) / self.spacing[:, np.newaxis]
+
+    def interpolate(self, points):
+        import scipy.ndimage
+        u = self.nodeCoordinates(points) + self.pad[:, np.newaxis]
+        return np.array([scipy.ndimage.map_coordinates(c, u, order=self.order, mode='nearest', prefilter=False)
+                         for c in self.coefficients])
+
+
+class FieldSampler:
+    'Interpolated field of a system on a Grid, refined lazily, with the exact field near sources and off the Grid.'
+
+    # evaluate(points) is the exact field as a (k, m) array of k components at the (dim, m) points.
+    # With a tolerance, blocks of BLOCK_CELLS cells whose interpolant differs from the exact field by more
+    # than tolerance times the largest field at the check points are refined, doubling their resolution
+    # up to maxLevel times. Points within exclusionRadius of any of the (n, dim) source points are always
+    # evaluated exactly; wires and surfaces can be given as points sampled along them, see polylinePoints.
+    def __init__(self, evaluate, grid, order=3, tolerance=None, maxLevel=2, sources=None, exclusionRadius=0.,
+                 memoryBudget=DEFAULT_TILE_BYTES):
+        import scipy.spatial
+        if order not in ORDERS:
+            raise ValueError("Unknown interpolation order " + str(order) + "; expected 1 or 3")
+        self._evaluate = evaluate
+        self.grid = grid
+        self.order = order
+        self.tolerance = tolerance
+        self.maxLevel = maxLevel
+        self.exclusionRadius = exclusionRadius
+        self.memoryBudget = memoryBudget
+        self._sourceTree = None
+        if sources is not None and len(sources) and exclusionRadius > 0:
+            self._sourceTree = scipy.spatial.cKDTree(np.asarray(sources, dtype=np.float64))
+        self._table = self._tabulate(grid)
+        self.blockShape = tuple(max(1, -(-(n - 1) // BLOCK_CELLS)) for n in grid.shape)
+        # Table of every checked block, None where the Grid table is accurate enough, and its error.
+        self._patches = {}
+        self._errors = {}
+
+    # _Table of the exact field on the nodes of grid, and SPLINE_PAD nodes past it for tricubic interpolation,
+    # evaluated tile by tile.
+    def _tabulate(self, grid):
+        pad = SPLINE_PAD if self.order == 3 else 0
+        nodes = grid
+        if pad:
+            spacing = [(hi - lo) / (n - 1) if n > 1 else 0. for (lo, hi), n in zip(grid.bounds, grid.shape)]
+            nodes = Grid([(lo - pad * h, hi + pad * h) for (lo, hi), h in zip(grid.bounds, spacing)],
+                         [n + 2 * pad if n > 1 else n for n in grid.shape])
+        values = None
+        for tile in nodes.tiles(nodes.tileShape(self.memoryBudget, 8 * 16)):
+            v = self._evaluate(nodes.tilePoints(tile))
+            if values is None:
+                values = np.empty((len(v),) + nodes.shape)
+            values[(slice(None),) + tile] = v.reshape((len(v),) + nodes.sliceShape(tile))
+        return _Table(grid, values, self.order, pad)
+
+    # Whether each of the (dim, m) points lies within exclusionRadius of a source.
+    def _excluded(self, points):
+        if self._sourceTree is None:
+            return np.zeros(points.shape[1], dtype=bool)
+        distance, index = self._sourceTree.query(points.T, distance_upper_bound=self.exclusionRadius)
+        return np.isfinite(distance)
+
+    # Field at the (dim, m) points as a (k, m) array.
+    def sample(self, points):
+        points = np.asarray(points, dtype=np.float64)
+        u = self._table.nodeCoordinates(points)
+        shape = np.array(self.grid.shape)[:, np.newaxis]
+        exact = np.any((u < 0) | (u > shape - 1), axis=0) | self._excluded(points)
+        inside = np.nonzero(~exact)[0]
+        values = None
+        if len(inside):
+            values = self._interpolate(points[:, inside], u[:, inside])
+        outside = np.nonzero(exact)[0]
+        if len(outside):
+            exactValues = self._evaluate(points[:, outside])
+            if values is None:
+                return exactValues
+            result = np.empty((len(values), points.shape[1]))
+            result[:, inside] = values
+            result[:, outside] = exactValues
+            return result
+        return values
+
+    def _interpolate(self, points, u):
+        if self.tolerance is None:
+            return self._table.interpolate(points)
+        block = np.minimum((u // BLOCK_CELLS).astype(np.intp), np.array(self.blockShape)[:, np.newaxis] - 1)
+        blocks, inverse = np.unique(np.ravel_multi_index(tuple(block), self.blockShape), return_inverse=True)
+        patches = [self._patch(b) for b in blocks]
+        refined = np.array([patch is not None for patch in patches])[inverse]
+        values = np.empty((len(self._table.coefficients), points.shape[1]))
+        coarse = np.nonzero(~refined)[0]
+        if len(coarse):
+            values[:, coarse] = self._table.interpolate(points[:, coarse])
+        for i, patch in enumerate(patches):
+            if patch is not None:
+                sel = np.nonzero(inverse == i)[0]
+                values[:, sel] = patch.interpolate(points[:, sel])
+        return values
+
+    # Table of the block with flat index b, checking and refining it the first time it is reached.
+    def _patch(self, b):
+        if b in self._patches:
+            return self._patches[b]
+        start = np.array(np.unravel_index(b, self.blockShape)) * BLOCK_CELLS
+        cells = np.minimum(start + BLOCK_CELLS, np.array(self.grid.shape) - 1) - start
+        lo = self._table.lo + start * self._table.spacing
+        hi = lo + cells * self._table.spacing
+        rng = np.random.default_rng(b)
+        check = lo[:, np.newaxis] + (hi - lo)[:, np.newaxis] * rng.random((len(lo), CHECK_POINTS))
+        check = check[:, ~self._excluded(check)]
+        patch, error = None, 0.
+        if check.shape[1]:
+            exact = self._evaluate(check)
+            scale = np.abs(exact).max() or 1.
+            error = np.abs(self._table.interpolate(check) - exact).max() / scale
+            level = 0
+            while error > self.tolerance and level < self.maxLevel:
+                level += 1
+                # The refined table extends one Grid cell past the block so that its splines are accurate at the edges.
+                grid = Grid(list(zip(lo - self._table.spacing, hi + self._table.spacing)),
+                            np.maximum(cells + 2, 1) * 2 ** level + 1)
+                patch = self._tabulate(grid)
+                error = np.abs(patch.interpolate(check) - exact).max() / scale
+        self._patches[b] = patch
+        self._errors[b] = error
+        return patch
+
+    # Summary of the lazy refinement so far: the number of blocks checked and refined, and the largest
+    # relative error left at the check points.
+    def refinement(self):
+        return {'blocks': int(np.prod(self.blockShape)), 'checked': len(self._patches),
+                'refined': sum(patch is not None for patch in self._patches.values()),
+                'maxError': float(max(self._errors.values(), default=0.))}
@@ -0,0 +1,98 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: FieldStore.py
+Date: 18/10/2026
+Description: Contains the StoredField Class and the writeField and openField functions.
+             Fields evaluated over a Grid are written tile by tile straight into memory-mapped .npy
+             files, one per component, inside a directory. The grid bounds, shape and component names
+             are stored next to them in grid.json. openField re-opens such a directory instantly without
+             reading the data; the components are numpy memmaps which are only read when sliced.
+
+Usage: Requires os, json and numpy libraries, and EMPY.Core.Tiling.
+'''
+
+import os
+import json
+import numpy as np
+from EMPY.Core.Tiling import Grid
+
+METADATA_FILE = 'grid.json'
+
+
+def _writeMetadata(directory, grid, names, metadata, complete):
+    description = {'bounds': grid.bounds, 'shape': list(grid.shape), 'components': list(names),
+                   'complete': complete, 'metadata': metadata or {}}
+    with open(os.path.join(directory, METADATA_FILE), 'w') as f:
+        json.dump(description, f, indent=2)
+
+
+# Write the field components names of grid into memory-mapped .npy files in directory.
+# tiles yields (tile, values) pairs, tile being a tuple of slices of the grid and values a dict
+# mapping every component name to its values on that tile. Returns the StoredField of directory.
+def writeField(directory, grid, names, tiles, metadata=None):
+    os.makedirs(directory, exist_ok=True)
+    # grid.json is first written as incomplete, so an interrupted evaluation can be recognized.
+    _writeMetadata(directory, grid, names, metadata, False)
+    arrays = {}
+    for name in names:
+        arrays[name] = np.lib.format.open_memmap(os.path.join(directory, name + '.npy'), mode='w+',
+                                                 dtype=np.float64, shape=grid.shape)
+    for tile, values in tiles:
+        for name in names:
+            arrays[name][tile] = values[name]
+    for array in arrays.values():
+        array.flush()
+    del arrays
+    _writeMetadata(directory, grid, names, metadata, True)
+    return openField(directory)
+
+
+# Open a directory written by writeField without reading its data.
+def openField(directory, mode='r'):
+    return StoredField(directory, mode)
+
+
+class StoredField:
+    'A field stored on disk by writeField, with its components as memory-mapped arrays.'
+
+    def __init__(self, directory, mode='r'):
+        self.directory = directory
+        with open(os.path.join(directory, METADATA_FILE)) as f:
+            description = json.load(f)
+        self.grid = Grid(description['bounds'], description['shape'])
+        self.names = description['components']
+        self.complete = description['complete']
+        self.metadata = description['metadata']
+        self.arrays = {}
+        for name in self.names:
+            self.arrays[name] = np.load(os.path.join(directory, name + '.npy'), mmap_mode=mode)
+
+    # Memory-mapped array of the component name, e.g. stored['V'][::4, ::4] only reads every 4th point.
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def __contains__(self, name):
+        return name in self.arrays
+
+    # Coordinate arrays of the grid restricted to the tuple of slices tile, for plotting a slice of the field.
+    def coordinates(self, tile=None):
+        axes = self.grid.axes()
+        if tile is not None:
+            axes = [axis[s] for axis, s in zip(axes, tile)]
+        return np.meshgrid(*axes, indexing='ij')
@@ -0,0 +1,80 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Glyphs.py
+Date: 18/10/2026
+Description: Contains functions drawing the sources of a system in a single collection or glyph call.
+             Discs of charges and wires are one matplotlib EllipseCollection, points in 3D one
+             mayavi points3d coloured by a scalar and polylines one mayavi line source, so the
+             time to draw a system does not grow with the number of Python plotting calls.
+
+Usage: Requires numpy, matplotlib and mayavi libraries.
+'''
+
+import numpy as np
+
+
+# Draw discs of the given radius, a scalar or one per disc, centred on the (m, 2) centers on the matplotlib
+# axes ax as a single EllipseCollection sized in data units. Returns the collection.
+def drawDiscs(ax, centers, radius, color='k', zorder=20):
+    from matplotlib.collections import EllipseCollection
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    diameters = np.broadcast_to(2. * np.asarray(radius, dtype=np.float64), len(centers))
+    collection = EllipseCollection(diameters, diameters, np.zeros(len(centers)), units='xy', offsets=centers,
+                                   transOffset=ax.transData, facecolors=color, edgecolors=color, zorder=zorder)
+    ax.add_collection(collection)
+    return collection
+
+
+# Draw spheres at the (3, m) positions with a single mayavi points3d, coloured by the scalars through colormap
+# between vmin and vmax. All spheres have the diameter scale_factor.
+def drawPoints3D(positions, scalars, colormap='bwr', vmin=-1., vmax=1., scale_factor=1):
+    from mayavi import mlab
+    x, y, z = np.asarray(positions, dtype=np.float64).reshape(3, -1)
+    return mlab.points3d(x, y, z, np.asarray(scalars, dtype=np.float64).ravel(), scale_mode='none',
+                         scale_factor=scale_factor, colormap=colormap, vmin=vmin, vmax=vmax)
+
+
+# Draw the polylines given by their (3, total) vertices and the offsets of every polyline into them, as for a
+# FieldLines, as a single mayavi line source. scalars of the vertices colour the lines through colormap, else
+# they are drawn in color; tube_radius draws them as tubes instead of lines.
+def drawPolylines3D(vertices, offsets, scalars=None, colormap='Spectral', color=None, line_width=1, tube_radius=None):
+    from mayavi import mlab
+    x, y, z = vertices
+    # Every vertex is joined to the next one except the last vertex of every polyline.
+    index = np.arange(max(len(x) - 1, 0))
+    ends = np.asarray(offsets)[1:-1] - 1
+    keep = np.ones(len(index), dtype=bool)
+    keep[ends[(ends >= 0) & (ends < len(index))]] = False
+    index = index[keep]
+    source = mlab.pipeline.scalar_scatter(x, y, z, np.zeros(len(x)) if scalars is None else scalars)
+    source.mlab_source.dataset.lines = np.stack([index, index + 1], axis=1)
+    source.update()
+    source = mlab.pipeline.stripper(source)
+    if tube_radius is not None:
+        source = mlab.pipeline.tube(source, tube_radius=tube_radius)
+    if color is None:
+        return mlab.pipeline.surface(source, line_width=line_width, colormap=colormap)
+    return mlab.pipeline.surface(source, line_width=line_width, color=color)
+
+
+# Vertices and offsets packing a list of (k, 3) polylines for drawPolylines3D.
+def packPolylines(polylines):
+    polylines = [np.asarray(p, dtype=np.float64).reshape(-1, 3) for p in polylines]
+    offsets = np.concatenate([[0], np.cumsum([len(p) for p in polylines])]).astype(np.intp)
+    return np.vstack([np.empty((0, 3))] + polylines).T, offsets
@@ -0,0 +1,65 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: LiveField.py
+Date: 18/10/2026
+Description: Contains the LiveField Class, a field grid that follows the sources of its system.
+             Superposition is linear, so when a source is added to or removed from a system, every
+             LiveField of that system is patched with the (negated) contribution of that single source
+             instead of being evaluated again. Editing a system of N sources then costs O(M) per change
+             on a grid of M points instead of O(N M). Systems evaluated with an approximate backend, such as
+             a particle mesh or a tree, refresh their LiveFields instead, since those are not patched exactly.
+
+Usage: Requires numpy library.
+'''
+
+import numpy as np
+
+
+class LiveField:
+    'A field evaluated once on a set of field points and patched incrementally as sources change.'
+
+    # values is the tuple of arrays evaluated by the system on points, formatter turns them into
+    # the tuple returned by get, and evaluate re-evaluates them from scratch.
+    def __init__(self, points, values, formatter, evaluate):
+        self.points = points
+        self.values = tuple(None if v is None else np.array(v, dtype=np.float64) for v in values)
+        self.updates = 0
+        self._formatter = formatter
+        self._evaluate = evaluate
+
+    # Add sign * delta, the contribution of a single source, to the values.
+    def patch(self, delta, sign=1):
+        for value, d in zip(self.values, delta):
+            if value is not None and d is not None:
+                if sign > 0:
+                    value += d
+                else:
+                    value -= d
+        self.updates += 1
+
+    # Current field, formatted like the evaluation method the LiveField was created from.
+    def get(self):
+        return self._formatter(self.values)
+
+    # Evaluate the field again from scratch, discarding the rounding errors accumulated by many patches.
+    def refresh(self):
+        for value, fresh in zip(self.values, self._evaluate(self.points)):
+            if value is not None:
+                value[...] = fresh
+        self.updates = 0
@@ -0,0 +1,143 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Parallel.py
+Date: 18/10/2026
+Description: Contains the parallelEvaluate function and the setDefaultWorkers and parallel settings.
+             parallelEvaluate splits a set of field points into tiles of a fixed number of points and
+             evaluates them on a pool of threads or of forked processes. Every tile writes its results
+             straight into its slice of the output arrays; with processes the output arrays live in shared
+             memory, so no result is ever pickled back. As the tiles do not depend on the number of workers,
+             the results are the same for any number of workers and either backend.
+
+Usage: Requires os, contextlib, multiprocessing, concurrent.futures and numpy libraries.
+'''
+
+import os
+import contextlib
+import numpy as np
+
+# Number of field points evaluated by a single task.
+DEFAULT_TILE_POINTS = 16384
+BACKENDS = ('thread', 'process')
+
+# Workers and backend used when a call does not give its own; a single worker evaluates serially.
+_defaults = {'workers': 1, 'backend': 'thread'}
+# Evaluation shared with the forked worker processes, which inherit it instead of receiving it pickled.
+_task = None
+
+
+# Set the number of workers and the backend used by every evaluation that does not give its own.
+# workers <= 0 uses every core of the machine.
+def setDefaultWorkers(workers, backend='thread'):
+    if backend not in BACKENDS:
+        raise ValueError("Unknown backend " + str(backend) + "; expected 'thread' or 'process'")
+    _defaults['workers'] = workers
+    _defaults['backend'] = backend
+
+
+# Getter Method for the default (workers, backend).
+def getDefaultWorkers():
+    return _defaults['workers'], _defaults['backend']
+
+
+# Context manager setting the default workers and backend for the evaluations inside its block, e.g.
+# with parallel(8, 'process'): system.E_Total([x, y, z])
+@contextlib.contextmanager
+def parallel(workers, backend='thread'):
+    previous = getDefaultWorkers()
+    setDefaultWorkers(workers, backend)
+    try:
+        yield
+    finally:
+        setDefaultWorkers(*previous)
+
+
+# Number of workers to use for the workers argument of a call, None meaning the default.
+def resolveWorkers(workers=None):
+    if workers is None:
+        workers = _defaults['workers']
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return int(workers)
+
+
+def _store(outputs, lo, hi, values):
+    for out, value in zip(outputs, values):
+        if out is not None:
+            out[..., lo:hi] = value
+
+
+def _runTile(lo):
+    evaluate, points, outputs, tilePoints = _task
+    hi = min(lo + tilePoints, points.shape[-1])
+    _store(outputs, lo, hi, evaluate(points[..., lo:hi]))
+
+
+# Evaluate evaluate(points) on workers threads or processes. points holds one field point per entry of its
+# last axis and evaluate returns a tuple of arrays, or None, with one entry per field point along their last
+# axis. The first tile is evaluated in the calling thread to size the outputs, which also builds anything
+# evaluate creates lazily before the workers start.
+def parallelEvaluate(evaluate, points, workers=None, backend=None, tilePoints=DEFAULT_TILE_POINTS):
+    global _task
+    workers = resolveWorkers(workers)
+    backend = backend or _defaults['backend']
+    if backend not in BACKENDS:
+        raise ValueError("Unknown backend " + str(backend) + "; expected 'thread' or 'process'")
+    m = points.shape[-1]
+    if workers == 1 or m <= tilePoints:
+        return evaluate(points)
+    first = evaluate(points[..., :tilePoints])
+    shapes = [None if value is None else (value.shape[:-1] + (m,), value.dtype) for value in first]
+    starts = range(tilePoints, m, tilePoints)
+
+    if backend == 'thread':
+        from concurrent.futures import ThreadPoolExecutor
+        outputs = [None if s is None else np.empty(*s) for s in shapes]
+        _store(outputs, 0, tilePoints, first)
+
+        def run(lo):
+            hi = min(lo + tilePoints, m)
+            _store(outputs, lo, hi, evaluate(points[..., lo:hi]))
+
+        with ThreadPoolExecutor(min(workers, len(starts))) as pool:
+            list(pool.map(run, starts))
+        return tuple(outputs)
+
+    import multiprocessing
+    from multiprocessing.shared_memory import SharedMemory
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        raise ValueError("The process backend requires the fork start method")
+    memories = [None if s is None else SharedMemory(create=True, size=max(1, int(np.prod(s[0])) * s[1].itemsize))
+                for s in shapes]
+    try:
+        outputs = [None if s is None else np.ndarray(s[0], s[1], buffer=memory.buf)
+                   for s, memory in zip(shapes, memories)]
+        _store(outputs, 0, tilePoints, first)
+        _task = (evaluate, points, outputs, tilePoints)
+        with multiprocessing.get_context('fork').Pool(min(workers, len(starts))) as pool:
+            pool.map(_runTile, starts)
+        result = tuple(None if out is None else out.copy() for out in outputs)
+    finally:
+        _task = None
+        outputs = None
+        for memory in memories:
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+    return result
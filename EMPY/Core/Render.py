@@ -0,0 +1,179 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Render.py
+Date: 18/10/2026
+Description: Contains the settings of where figures go and the renderBatch function for headless rendering.
+             By default every plotting method of EMPY ends by showing its figure interactively. With a
+             render output set, matplotlib switches to the Agg backend and mayavi renders offscreen, and
+             the plotting methods write their figures as PNG and/or SVG files, and the arrays they plotted
+             as NPZ files, into the output directory instead. renderBatch renders many scenarios in
+             parallel worker processes, keeping the scenarios of one system in one worker so that the
+             fields cached by the system are evaluated only once.
+
+Usage: Requires os, contextlib, multiprocessing, numpy, matplotlib libraries, mayavi for 3D scenes and EMPY.Core.Parallel.
+'''
+
+import os
+import contextlib
+import numpy as np
+from EMPY.Core.Parallel import resolveWorkers
+
+FORMATS = ('png', 'svg', 'npz')
+
+# Output directory of the plotting methods, None to show figures interactively, with the formats written.
+_settings = {'directory': None, 'formats': ('png',), 'dpi': 150, 'backend': None}
+# Number of figures written so far under every (directory, name), to number the files of repeated plots.
+_counts = {}
+# Groups of scenarios shared with the forked worker processes of renderBatch.
+_batch = None
+
+
+# Write the figures of every plotting method into directory in the given formats instead of showing them.
+# directory=None goes back to showing figures interactively.
+def setRenderOutput(directory, formats=('png',), dpi=150):
+    import matplotlib.pyplot as plt
+    formats = tuple(formats)
+    for f in formats:
+        if f not in FORMATS:
+            raise ValueError("Unknown render format " + str(f) + "; expected 'png', 'svg' or 'npz'")
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+        if _settings['directory'] is None:
+            _settings['backend'] = plt.get_backend()
+            plt.switch_backend('Agg')
+    elif _settings['directory'] is not None and _settings['backend'] is not None:
+        plt.switch_backend(_settings['backend'])
+    _setOffscreen(directory is not None)
+    _settings.update(directory=directory, formats=formats, dpi=dpi)
+
+
+def _setOffscreen(offscreen):
+    try:
+        from mayavi import mlab
+    except ImportError:
+        return
+    mlab.options.offscreen = offscreen
+
+
+# Getter Method for the render output as (directory, formats, dpi), directory None when showing interactively.
+def getRenderOutput():
+    return _settings['directory'], _settings['formats'], _settings['dpi']
+
+
+# Context manager writing the figures of the plotting methods inside its block into directory, e.g.
+# with renderTo('figures', ('png', 'npz')): system.plot_VectField([-5, 5], [-5, 5])
+@contextlib.contextmanager
+def renderTo(directory, formats=('png',), dpi=150):
+    previous = getRenderOutput()
+    setRenderOutput(directory, formats, dpi)
+    try:
+        yield
+    finally:
+        setRenderOutput(*previous)
+
+
+# Path without extension of the next figure called name in the output directory; repeated names are numbered.
+def _nextPath(name):
+    directory = _settings['directory']
+    index = _counts.get((directory, name), 0)
+    _counts[(directory, name)] = index + 1
+    return os.path.join(directory, name if index == 0 else name + '_' + str(index))
+
+
+def _writeData(path, data):
+    if data:
+        np.savez(path + '.npz', **{key: np.asarray(value) for key, value in data.items()})
+        return [path + '.npz']
+    return []
+
+
+# End a matplotlib plotting method: show the current figure, or write it and the arrays in data to the
+# render output and close it. Returns the paths written.
+def showFigure(name, data=None):
+    import matplotlib.pyplot as plt
+    if _settings['directory'] is None:
+        plt.show()
+        return []
+    path = _nextPath(name)
+    written = []
+    for f in _settings['formats']:
+        if f == 'npz':
+            written += _writeData(path, data)
+        else:
+            plt.savefig(path + '.' + f, dpi=_settings['dpi'], bbox_inches='tight')
+            written.append(path + '.' + f)
+    plt.close()
+    return written
+
+
+# End a mayavi plotting method: show the current scene, or write it and the arrays in data to the render
+# output and close it. Returns the paths written.
+def showScene(name, data=None):
+    from mayavi import mlab
+    if _settings['directory'] is None:
+        mlab.show()
+        return []
+    path = _nextPath(name)
+    written = []
+    for f in _settings['formats']:
+        if f == 'npz':
+            written += _writeData(path, data)
+        else:
+            mlab.savefig(path + '.' + f)
+            written.append(path + '.' + f)
+    mlab.close()
+    return written
+
+
+def _renderGroup(index):
+    directory, formats, dpi, groups = _batch
+    written = {}
+    for name, system, plot in groups[index]:
+        with renderTo(os.path.join(directory, name), formats, dpi):
+            plot(system)
+        written[name] = sorted(os.path.join(directory, name, f) for f in os.listdir(os.path.join(directory, name)))
+    return written
+
+
+# Render a batch of scenarios, a list of (name, system, plot) with plot(system) making the plotting calls
+# of the scenario, into the subdirectory name of directory. Scenarios are rendered on workers forked
+# processes, with all scenarios of the same system rendered one after another by the same worker, so
+# fields already evaluated for the system, including those evaluated before the call, are reused from
+# its cache. Returns a dict mapping every scenario name to the paths of its files.
+def renderBatch(scenarios, directory, formats=('png',), dpi=150, workers=None):
+    import multiprocessing
+    global _batch
+    groups = {}
+    for name, system, plot in scenarios:
+        groups.setdefault(id(system), []).append((name, system, plot))
+    groups = list(groups.values())
+    _batch = (directory, tuple(formats), dpi, groups)
+    try:
+        workers = min(resolveWorkers(workers), len(groups))
+        if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            results = [_renderGroup(i) for i in range(len(groups))]
+        else:
+            with multiprocessing.get_context('fork').Pool(workers) as pool:
+                results = pool.map(_renderGroup, range(len(groups)))
+    finally:
+        _batch = None
+    written = {}
+    for result in results:
+        written.update(result)
+    return written
@@ -0,0 +1,81 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Tiling.py
+Date: 18/10/2026
+Description: Contains the Grid Class, a regular grid of field points that can be evaluated tile by tile.
+             A Grid is described by its bounds and number of points along every axis, so it never has to
+             be held in memory as a whole. Grid.tiles splits it into blocks whose field points, together
+             with the fields evaluated on them, fit into a memory budget in bytes. The iterField methods of
+             System, System3D and LoopSystem stream the field over a Grid one tile at a time.
+
+Usage: Requires itertools and numpy libraries.
+'''
+
+import itertools
+import numpy as np
+
+# Default memory budget of a single tile, in bytes.
+DEFAULT_TILE_BYTES = 64 * 1024 * 1024
+
+
+class Grid:
+    'A regular grid of field points with shape[k] points from bounds[k][0] to bounds[k][1] along axis k.'
+
+    def __init__(self, bounds, shape):
+        self.bounds = [(float(lo), float(hi)) for lo, hi in bounds]
+        self.shape = tuple(int(n) for n in shape)
+        if len(self.bounds) != len(self.shape):
+            raise ValueError("Grid requires one (min, max) bound per axis")
+        self.dim = len(self.shape)
+        self.size = int(np.prod(self.shape))
+
+    # Coordinates of the grid points along every axis.
+    def axes(self):
+        return [np.linspace(lo, hi, n) for (lo, hi), n in zip(self.bounds, self.shape)]
+
+    # Shape of the largest tile whose points need at most bytesPerPoint * points <= memoryBudget bytes.
+    # Tiles span the trailing axes completely whenever possible, so that they are contiguous in memory.
+    def tileShape(self, memoryBudget=DEFAULT_TILE_BYTES, bytesPerPoint=8):
+        capacity = max(1, int(memoryBudget // bytesPerPoint))
+        tile = [1] * self.dim
+        for k in reversed(range(self.dim)):
+            tile[k] = max(1, min(self.shape[k], capacity))
+            capacity //= self.shape[k]
+            if capacity < 1:
+                break
+        return tuple(tile)
+
+    # Yield the tuple of slices of every tile of the given tileShape, in C order.
+    def tiles(self, tileShape):
+        starts = [range(0, n, t) for n, t in zip(self.shape, tileShape)]
+        for corner in itertools.product(*starts):
+            yield tuple(slice(c, min(c + t, n)) for c, t, n in zip(corner, tileShape, self.shape))
+
+    # Field points of the tile given by its slices, as a (dim, m) array in the C order of the tile.
+    def tilePoints(self, tile):
+        coords = np.meshgrid(*[axis[s] for axis, s in zip(self.axes(), tile)], indexing='ij')
+        return np.array([c.ravel() for c in coords])
+
+    # Shape of the tile given by its slices.
+    def sliceShape(self, tile):
+        return tuple(s.stop - s.start for s in tile)
+
+    # Full coordinate arrays of the grid, like np.mgrid. Only for grids that fit in memory.
+    def meshgrid(self):
+        return np.meshgrid(*self.axes(), indexing='ij')
@@ -0,0 +1,107 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Transforms.py
+Date: 18/10/2026
+Description: Contains vectorized transforms of evaluated fields applied before plotting.
+             Every transform is built by a function taking its parameters and works in place on a
+             floating point array, returning it, so a grid of a plot is compressed, clipped or
+             normalized without copies or Python loops over its points. Transforms chain by passing
+             a list of them to applyTransform, which every plotting method runs on its grid.
+
+Usage: Requires numpy library.
+'''
+
+import numpy as np
+
+
+# sign(v) |v|^exponent, compressing the range of a potential with both signs, e.g. 1 / 9 near point charges.
+def signedPower(exponent):
+    def transform(values):
+        negative = np.signbit(values)
+        np.abs(values, out=values)
+        np.power(values, exponent, out=values)
+        np.negative(values, out=values, where=negative)
+        return values
+    return transform
+
+
+# sign(v) ln(1 + |v| / linthresh), linear within linthresh of zero and logarithmic beyond.
+def symlog(linthresh=1.):
+    def transform(values):
+        negative = np.signbit(values)
+        np.abs(values, out=values)
+        values /= linthresh
+        np.log1p(values, out=values)
+        np.negative(values, out=values, where=negative)
+        return values
+    return transform
+
+
+# Values clipped to [lower, upper], either bound being None for no bound on that side.
+def clip(lower=None, upper=None):
+    def transform(values):
+        if lower is not None:
+            np.maximum(values, lower, out=values)
+        if upper is not None:
+            np.minimum(values, upper, out=values)
+        return values
+    return transform
+
+
+# Values mapped linearly from the low to high percentiles of the finite values onto [0, 1] and clipped there.
+def percentileNormalize(low=1., high=99.):
+    def transform(values):
+        finite = values[np.isfinite(values)]
+        if len(finite) == 0:
+            return values
+        lower, upper = np.percentile(finite, [low, high])
+        values -= lower
+        if upper > lower:
+            values /= upper - lower
+        np.clip(values, 0., 1., out=values)
+        return values
+    return transform
+
+
+# Apply transform to values: None leaves them unchanged, a list or tuple of transforms is applied in order.
+# values is converted to a float64 array first, which is then transformed in place when already one.
+def applyTransform(values, transform):
+    values = np.asarray(values, dtype=np.float64)
+    if transform is None:
+        return values
+    if isinstance(transform, (list, tuple)):
+        for t in transform:
+            values = t(values)
+        return values
+    return transform(values)
+
+
+# Rescale the vector field with the given components in place so that its magnitude becomes transform of the
+# magnitude, e.g. signedPower(0.5) to keep arrows near sources from swamping a quiver plot.
+def transformMagnitude(components, transform):
+    if transform is None:
+        return components
+    components = [np.asarray(c, dtype=np.float64) for c in components]
+    magnitude = np.sqrt(sum(c * c for c in components))
+    scale = applyTransform(magnitude.copy(), transform)
+    np.divide(scale, magnitude, out=scale, where=magnitude > 0)
+    scale[magnitude == 0] = 0.
+    for c in components:
+        c *= scale
+    return components
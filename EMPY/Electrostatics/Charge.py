@@ -22,15 +22,15 @@ Date: 19/10/2019
 Description: A class to define an Electrically Charged Point Object.
              Charge object requires input a charge q and its source position.
 
-Usage: Requires math, numpy and matplotlib.pyplot libraries.
+Usage: Requires numpy and matplotlib.pyplot libraries, EMPY.Core.Render, EMPY.Core.Glyphs and EMPY.Core.Transforms.
 
 This code and Charge library was inspired by Robert Martin's ElectrodynamicsPy Project.
 https://github.com/robertmartin8/ElectrodynamicsPy
 '''
-import math
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+from EMPY.Core.Transforms import applyTransform, signedPower, clip
+from EMPY.Core.Render import showFigure
+from EMPY.Core.Glyphs import drawDiscs
 
 class Charge:
     'A Charge Object to be constituting of a q coulomb charge, and a source point vector r.'
@@ -43,65 +43,78 @@ class Charge:
     def get_Pos(self):
         return self.pos
 
+    # Separation Vector r - Griffith Page 9, Eqn 27, between the charge and a given position vector fieldPos.
+    def separation(self, fieldPos):
+        dx = np.asarray(fieldPos[0], dtype=np.float64) - self.pos[0]
+        dy = np.asarray(fieldPos[1], dtype=np.float64) - self.pos[1]
+        r = np.sqrt(dx**2 + dy**2)
+        # Setting tolerance for separation vector.
+        r = np.maximum(r, 0.005)
+        return dx, dy, r
+
     # Determine Analytical Electric Field of Point Charge at a given position vector fieldPos.
     def electricField(self, fieldPos):
-        # Separation Vector r - Griffith Page 9, Eqn 27
-        r = np.sqrt((fieldPos[0] - self.pos[0])**2 + (fieldPos[1]-self.pos[1])**2)
-        # Setting tolerance for separation vector.
-        r[r < 0.005] = 0.005
+        dx, dy, r = self.separation(fieldPos)
         # The x and y component of Electric Field E - Griffith Page 61, Eqn 4
-        Ex = self.q * (fieldPos[0] - self.pos[0])/(r**3)
-        Ey = self.q * (fieldPos[1] - self.pos[1]) / (r**3)
+        Ex = self.q * dx / (r**3)
+        Ey = self.q * dy / (r**3)
         return Ex, Ey
 
     # Determine Analytical Electric Potential at a given position vector fieldPos.
     def electricPot(self, fieldPos):
-        # Separation Vector r - Griffith Page 9, Eqn 27
-        r = np.sqrt((fieldPos[0] - self.pos[0]) ** 2 + (fieldPos[1] - self.pos[1]) ** 2)
-        # Setting tolerance for separation vector.
-        r[r < 0.005] = 0.005
+        dx, dy, r = self.separation(fieldPos)
         # Potential of Point Charge - Griffith Page 85, Eqn 26
         V = self.q/r
         return V
 
-    # Plot the Electric Field Generated by the Charge Object
-    def plot_VectField(self, xs, ys, showEField = True, showEPot = False):
+    # Determine the Electric Field and Potential at fieldPos from a single separation computation.
+    # Returns (Ex, Ey, V) or, with magnitude=True, (Ex, Ey, V, |E|).
+    def electricFieldPot(self, fieldPos, magnitude=False):
+        dx, dy, r = self.separation(fieldPos)
+        V = self.q / r
+        w = V / (r**2)
+        result = (w * dx, w * dy, V)
+        if magnitude:
+            result += (np.abs(self.q) / (r**2) * np.sqrt(dx**2 + dy**2) / r,)
+        return result
+
+    # Plot the Electric Field Generated by the Charge Object on a resolution x resolution grid.
+    # transform is applied to the potential before its contours are drawn, see EMPY.Core.Transforms.
+    def plot_VectField(self, xs, ys, showEField = True, showEPot = False, resolution = 100, transform = clip(upper = 10000)):
+        import matplotlib.pyplot as plt
         plt.figure()
 
-        x, y = np.meshgrid(np.linspace(xs[0], xs[1], 100),
-                           np.linspace(ys[0], ys[1], 100))
+        x, y = np.meshgrid(np.linspace(xs[0], xs[1], resolution),
+                           np.linspace(ys[0], ys[1], resolution))
+
+        Ex, Ey, V = self.electricFieldPot([x,y])
 
         if showEField:
-            Ex, Ey = self.electricField([x,y])
             P = (Ex ** 2 + Ey ** 2)
-            plt.streamplot(x, y, Ex, Ey, color=np.log(P), density=0.9 ,linewidth=2, cmap=plt.cm.get_cmap("Spectral"), arrowsize=2.)
+            plt.streamplot(x, y, Ex, Ey, color=np.log(P), density=0.9 ,linewidth=2, cmap="Spectral", arrowsize=2.)
             ax = plt.gca()  # get current axis
-            ax.add_patch(plt.Circle((self.pos[0], self.pos[1]), radius=0.1, color='k', zorder=20))
+            drawDiscs(ax, [self.pos[:2]], 0.1)
             ax.set_aspect('equal')
             plt.colorbar()
             plt.draw()
 
         if showEPot:
-            V = self.electricPot([x,y])
-            V[V > 10000] = 10000
+            V = applyTransform(V, transform)
             plt.contour(x, y, V,250)
 
-        plt.show()
+        showFigure('plot_VectField', {'x': x, 'y': y, 'Ex': Ex, 'Ey': Ey, 'V': V})
 
-    # Draw a 3D Projection of the Charge Object's Electric Potential
-    def plotPotential3D(self, xs, ys, w):
+    # Draw a 3D Projection of the Charge Object's Electric Potential on a resolution x resolution grid,
+    # compressed by transform, by default the signed 9th root.
+    def plotPotential3D(self, xs, ys, w, resolution = 500, transform = signedPower(1. / 9)):
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D
         width = w
         height = (ys[1] - ys[0]/(xs[1]-xs[0])*width)
 
-        x, y = np.meshgrid(np.linspace(xs[0], xs[1], 500),
-                           np.linspace(ys[0], ys[1], 500))
-        total_VField = self.electricPot([x,y])
-        for i in range(len(total_VField)):
-            for j in range(len(total_VField[i])):
-                if total_VField[i][j] < 0:
-                    total_VField[i][j] = -math.pow(-total_VField[i][j], float(1) / 9)
-                else:
-                    total_VField[i][j] = total_VField[i][j] ** (1 / 9)
+        x, y = np.meshgrid(np.linspace(xs[0], xs[1], resolution),
+                           np.linspace(ys[0], ys[1], resolution))
+        total_VField = applyTransform(self.electricPot([x,y]), transform)
         fig = plt.figure(figsize=(width, height))
         ax = plt.axes(projection="3d")
         ax.set_xlabel("x", fontsize=14)
@@ -116,4 +129,4 @@ class Charge:
                         cmap="Spectral", antialiased=True)
 
         plt.colorbar(surf, shrink=0.8)
-        plt.show()
\ No newline at end of file
+        showFigure('plotPotential3D', {'x': x, 'y': y, 'V': total_VField})
\ No newline at end of file
@@ -21,14 +21,16 @@ Date: 19/10/2019
 Description: A class to define an 3 Dimension Electrically Charged Point Object.
              Charge object requires input a charge q and its source position.
 
-Usage: Requires numpy and mayavi libraries.
+Usage: Requires numpy and mayavi libraries, EMPY.Core.Render, EMPY.Core.Glyphs and EMPY.Core.Transforms.
 
 The use of Mayavi Library for 3 Dimensional Scientific Plotting was inspired from danielsjensen1's electrodynamics project.
 https://github.com/danielsjensen1/electrodynamics
 '''
 
-from mayavi import mlab
 import numpy as np
+from EMPY.Core.Render import showScene
+from EMPY.Core.Glyphs import drawPoints3D
+from EMPY.Core.Transforms import transformMagnitude
 
 
 class Charge3D:
@@ -43,41 +45,54 @@ class Charge3D:
     def getPosition(self):
         return self.pos
 
-        # Determine Analytical Electric Field of Point Charge at a given position vector fieldPos.
+    # Separation Vector r - Griffith Page 9, Eqn 27, between the charge and a given position vector fieldPos.
+    def separation(self, fieldPos):
+        dx = np.asarray(fieldPos[0], dtype=np.float64) - self.pos[0]
+        dy = np.asarray(fieldPos[1], dtype=np.float64) - self.pos[1]
+        dz = np.asarray(fieldPos[2], dtype=np.float64) - self.pos[2]
+        r = np.sqrt(dx ** 2 + dy ** 2 + dz ** 2)
+        # Setting tolerance for separation vector.
+        r = np.maximum(r, 0.005)
+        return dx, dy, dz, r
 
+    # Determine Analytical Electric Field of Point Charge at a given position vector fieldPos.
     def electricField(self, fieldPos):
-        # Separation Vector r - Griffith Page 9, Eqn 27
-        r = np.sqrt((fieldPos[0] - self.pos[0]) ** 2 + (fieldPos[1] - self.pos[1]) ** 2 + (fieldPos[2]-self.pos[2])**2)
-        # Setting tolerance for separation vector.
-        r[r < 0.005] = 0.005
-        # The x and y component of Electric Field E - Griffith Page 61, Eqn 4
-        Ex = self.q * (fieldPos[0] - self.pos[0]) / (r ** 3)
-        Ey = self.q * (fieldPos[1] - self.pos[1]) / (r ** 3)
-        Ez = self.q * (fieldPos[2] - self.pos[2]) / (r ** 3)
+        dx, dy, dz, r = self.separation(fieldPos)
+        # The x, y and z component of Electric Field E - Griffith Page 61, Eqn 4
+        Ex = self.q * dx / (r ** 3)
+        Ey = self.q * dy / (r ** 3)
+        Ez = self.q * dz / (r ** 3)
         return Ex, Ey, Ez
 
     def potentialField(self, fieldPos):
-        # Separation Vector r - Griffith Page 9, Eqn 27
-        r = np.sqrt((fieldPos[0] - self.pos[0]) ** 2 + (fieldPos[1] - self.pos[1]) ** 2 + (fieldPos[2]-self.pos[2])**2)
-        # Setting tolerance for separation vector.
-        r[r < 0.005] = 0.005
+        dx, dy, dz, r = self.separation(fieldPos)
         # Potential of Point Charge - Griffith Page 85, Eqn 26
         V = self.q / r
         return V
 
-    def plotField(self, xs, ys, zs):
-        x, y, z = np.mgrid[xs[0]:xs[1]:10j, ys[0]:ys[1]:10j, zs[0]:zs[1]:10j]
+    # Determine the Electric Field and Potential at fieldPos from a single separation computation.
+    # Returns (Ex, Ey, Ez, V) or, with magnitude=True, (Ex, Ey, Ez, V, |E|).
+    def electricFieldPot(self, fieldPos, magnitude=False):
+        dx, dy, dz, r = self.separation(fieldPos)
+        V = self.q / r
+        w = V / (r ** 2)
+        result = (w * dx, w * dy, w * dz, V)
+        if magnitude:
+            result += (np.abs(self.q) / (r ** 2) * np.sqrt(dx ** 2 + dy ** 2 + dz ** 2) / r,)
+        return result
+
+    # Quiver plot of the field on a resolution^3 grid, with the arrow lengths passed through transform, see
+    # EMPY.Core.Transforms.transformMagnitude.
+    def plotField(self, xs, ys, zs, resolution = 10, transform = None):
+        from mayavi import mlab
+        x, y, z = np.mgrid[xs[0]:xs[1]:resolution * 1j, ys[0]:ys[1]:resolution * 1j, zs[0]:zs[1]:resolution * 1j]
 
-        Ex, Ey, Ez = self.electricField([x,y,z])
+        Ex, Ey, Ez = transformMagnitude(self.electricField([x,y,z]), transform)
 
-        if self.getCharge() < 0:
-            color = (0,0,1)
-        else:
-            color = (1,0,0)
         mlab.figure(size=(1000,1000))
-        mlab.points3d(self.getPosition()[0], self.getPosition()[1], self.getPosition()[2], color=color, scale_factor = 1)
+        drawPoints3D(np.reshape(self.getPosition(), (3, 1)), [-1. if self.getCharge() < 0 else 1.])
         mlab.quiver3d(x,y,z, Ex, Ey, Ez, line_width = 2, scale_factor = 1)
 
-        mlab.show()
+        showScene('plotField', {'x': x, 'y': y, 'z': z, 'Ex': Ex, 'Ey': Ey, 'Ez': Ez})
 
 
@@ -0,0 +1,166 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Distributions.py
+Date: 18/10/2026
+Description: Contains array based samplers of charge distributions along curves, over surfaces and through volumes.
+             Every sampler returns (weights, positions): an (n,) array of weights summing to 1 and an
+             (n, dim) array of charge positions, which the builders of ContinuousSystem and ContinuousSystem3D
+             scale by the total charge and write straight into their PackedCharges, without creating a
+             Charge object per sample. Curves and surfaces are sampled at the midpoints of equal cells.
+
+Usage: Requires numpy library, and EMPY.Electrostatics.Elements3D.
+'''
+
+import numpy as np
+from EMPY.Electrostatics.Elements3D import planeBasis
+
+
+# Call a parametric function on the array t. Functions written for scalars, e.g. with math.cos or with
+# branches on t, and functions not returning one value per sample are called once per sample instead.
+def sampleParametric(f, t):
+    try:
+        values = np.asarray(f(t), dtype=np.float64)
+        if values.shape in (t.shape, ()):
+            return np.broadcast_to(values, t.shape)
+    except (TypeError, ValueError):
+        pass
+    return np.array([f(ti) for ti in t], dtype=np.float64).reshape(t.shape)
+
+
+# Equal weights of n samples.
+def _uniform(n):
+    return np.full(n, 1. / n)
+
+
+# n samples along the curve (f_1(t), ..., f_dim(t)) for t from t0 to t1 at the midpoints of n equal
+# steps of t, weighted by the length of the curve over their step.
+def parametricCurve(functions, t0, t1, n):
+    t = t0 + (np.arange(n) + 0.5) * (t1 - t0) / n
+    positions = np.array([sampleParametric(f, t) for f in functions]).T
+    edges = t0 + np.arange(n + 1) * (t1 - t0) / n
+    vertices = np.array([sampleParametric(f, edges) for f in functions]).T
+    lengths = np.linalg.norm(np.diff(vertices, axis=0), axis=1)
+    total = lengths.sum()
+    return (lengths / total if total > 0 else _uniform(n)), positions
+
+
+# n samples uniformly spaced along the straight line from start to end.
+def line(start, end, n):
+    start, end = np.asarray(start, dtype=np.float64), np.asarray(end, dtype=np.float64)
+    t = (np.arange(n) + 0.5) / n
+    return _uniform(n), start + t[:, np.newaxis] * (end - start)
+
+
+# Samples uniformly spaced by about spacing along the polyline through vertices.
+def polyline(vertices, spacing):
+    vertices = np.asarray(vertices, dtype=np.float64)
+    arc = np.concatenate([[0.], np.cumsum(np.linalg.norm(np.diff(vertices, axis=0), axis=1))])
+    n = max(1, int(round(arc[-1] / spacing)))
+    s = (np.arange(n) + 0.5) * arc[-1] / n
+    positions = np.array([np.interp(s, arc, vertices[:, k]) for k in range(vertices.shape[1])]).T
+    return _uniform(n), positions
+
+
+# n samples uniformly spaced around the circle of radius R about center, in the plane perpendicular
+# to normal for a 3D center.
+def ring(center, R, n, normal=(0, 0, 1)):
+    center = np.asarray(center, dtype=np.float64)
+    phi = 2 * np.pi * (np.arange(n) + 0.5) / n
+    if len(center) == 2:
+        return _uniform(n), center + R * np.array([np.cos(phi), np.sin(phi)]).T
+    e1, e2 = planeBasis(normal)
+    return _uniform(n), center + R * (np.cos(phi)[:, np.newaxis] * e1 + np.sin(phi)[:, np.newaxis] * e2)
+
+
+# n samples uniformly spaced along turns turns of a helix of radius R about the axis through center
+# along normal, advancing pitch per turn.
+def helix(center, R, pitch, turns, n, normal=(0, 0, 1)):
+    center = np.asarray(center, dtype=np.float64)
+    normal = np.asarray(normal, dtype=np.float64) / np.linalg.norm(normal)
+    e1, e2 = planeBasis(normal)
+    t = turns * (np.arange(n) + 0.5) / n
+    phi = 2 * np.pi * t
+    positions = center + R * (np.cos(phi)[:, np.newaxis] * e1 + np.sin(phi)[:, np.newaxis] * e2) \
+        + pitch * t[:, np.newaxis] * normal
+    return _uniform(n), positions
+
+
+# Samples about spacing apart over the disk of radius R about center, on concentric rings of equal width,
+# weighted by the area they stand for. For a 3D center the disk is perpendicular to normal.
+def disk(center, R, spacing, normal=(0, 0, 1)):
+    center = np.asarray(center, dtype=np.float64)
+    nRings = max(1, int(round(R / spacing)))
+    width = R / nRings
+    radii = (np.arange(nRings) + 0.5) * width
+    counts = np.maximum(1, np.round(2 * np.pi * radii / width).astype(int))
+    ringIndex = np.repeat(np.arange(nRings), counts)
+    # Angular position of every sample within its ring
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    phi = 2 * np.pi * (k + 0.5) / counts[ringIndex]
+    r = radii[ringIndex]
+    weights = 2 * np.pi * r * width / counts[ringIndex]
+    if len(center) == 2:
+        positions = center + np.array([r * np.cos(phi), r * np.sin(phi)]).T
+    else:
+        e1, e2 = planeBasis(normal)
+        positions = center + (r * np.cos(phi))[:, np.newaxis] * e1 + (r * np.sin(phi))[:, np.newaxis] * e2
+    return weights / weights.sum(), positions
+
+
+# nu x nv samples at the centres of the cells of the parallelogram corner + s edgeU + t edgeV, s, t in [0, 1].
+def rectangle(corner, edgeU, edgeV, nu, nv):
+    corner = np.asarray(corner, dtype=np.float64)
+    s = (np.arange(nu) + 0.5) / nu
+    t = (np.arange(nv) + 0.5) / nv
+    S, T = np.meshgrid(s, t, indexing='ij')
+    positions = corner + S.reshape(-1, 1) * np.asarray(edgeU, dtype=np.float64) \
+        + T.reshape(-1, 1) * np.asarray(edgeV, dtype=np.float64)
+    return _uniform(nu * nv), positions
+
+
+# n samples spread uniformly over the sphere of radius R about center, on a Fibonacci lattice.
+def sphereShell(center, R, n):
+    k = np.arange(n) + 0.5
+    z = 1 - 2 * k / n
+    rho = np.sqrt(1 - z * z)
+    phi = np.pi * (3 - np.sqrt(5)) * k
+    return _uniform(n), np.asarray(center, dtype=np.float64) + R * np.array([rho * np.cos(phi), rho * np.sin(phi), z]).T
+
+
+# nAround x nAlong samples over the lateral surface of the cylinder of radius R and the given length,
+# whose axis starts at center and runs along axis.
+def cylinder(center, R, length, nAround, nAlong, axis=(0, 0, 1)):
+    axis = np.asarray(axis, dtype=np.float64) / np.linalg.norm(axis)
+    e1, e2 = planeBasis(axis)
+    phi = 2 * np.pi * (np.arange(nAround) + 0.5) / nAround
+    h = length * (np.arange(nAlong) + 0.5) / nAlong
+    P, H = np.meshgrid(phi, h, indexing='ij')
+    P, H = P.reshape(-1, 1), H.reshape(-1, 1)
+    positions = np.asarray(center, dtype=np.float64) + R * (np.cos(P) * e1 + np.sin(P) * e2) + H * axis
+    return _uniform(nAround * nAlong), positions
+
+
+# Samples at the centres of the cells of a lattice about spacing apart filling the axis-aligned box
+# from corner to corner + size.
+def box(corner, size, spacing):
+    corner, size = np.asarray(corner, dtype=np.float64), np.asarray(size, dtype=np.float64)
+    counts = np.maximum(1, np.round(size / spacing).astype(int))
+    axes = [c + (np.arange(n) + 0.5) * s / n for c, s, n in zip(corner, size, counts)]
+    positions = np.array([a.ravel() for a in np.meshgrid(*axes, indexing='ij')]).T
+    return _uniform(len(positions)), positions
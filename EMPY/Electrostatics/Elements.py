@@ -0,0 +1,236 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Elements.py
+Date: 18/10/2026
+Description: Contains Element, Polyline(Element), Segment(Polyline), Arc(Polyline), Panel(Element) and PackedElements Classes.
+             Elements are uniformly charged continuous sources with a closed form field and potential.
+             They replace the point charge discretization of ContinuousSystem, so a straight wire is a
+             single Segment instead of hundreds of Charge objects and the field shows no graininess.
+             Polylines are built from straight segments, an Arc is a Polyline whose chords follow the
+             arc within a relative sagitta tolerance, and a Panel is a uniformly charged rectangle.
+
+             Element object requires input a total charge Q and its geometry.
+
+Usage: Requires numpy library and EMPY.Electrostatics.Kernels.
+'''
+
+import numpy as np
+from EMPY.Electrostatics.Kernels import flattenFieldPos, packFieldPotential, segmentKernel, panelKernel
+
+
+def _noSegments(dim):
+    return np.empty(0), np.empty((0, dim)), np.empty((0, dim))
+
+
+def _noPanels(dim):
+    return np.empty(0), np.empty((0, dim)), np.empty((0, dim)), np.empty((0, dim))
+
+
+# An Element object, the base class of all uniformly charged continuous sources.
+# Every element is described by a set of straight segments and a set of rectangular panels.
+class Element:
+
+    def __init__(self, Q, dim):
+        self.Q = Q
+        self.dim = dim
+
+    def getCharge(self):
+        return self.Q
+
+    # Segments of the element as (lam, start, end) arrays, lam being the line charge density.
+    def getSegments(self):
+        return _noSegments(self.dim)
+
+    # Panels of the element as (sigma, origin, edgeU, edgeV) arrays, sigma being the surface charge density.
+    def getPanels(self):
+        return _noPanels(self.dim)
+
+    # Outline of the element as a list of (k, dim) vertex arrays, used for plotting.
+    def getOutline(self):
+        return []
+
+    # Determine Analytical Electric Field of the Element at a given position vector fieldPos.
+    def electricField(self, fieldPos):
+        packed = PackedElements(self.dim)
+        packed.append(self)
+        return packed.electricField(fieldPos)
+
+    # Determine Analytical Electric Potential of the Element at a given position vector fieldPos.
+    def electricPot(self, fieldPos):
+        packed = PackedElements(self.dim)
+        packed.append(self)
+        return packed.electricPot(fieldPos)
+
+    # Determine the Electric Field and Potential of the Element at fieldPos in a single pass.
+    def electricFieldPot(self, fieldPos, magnitude=False):
+        packed = PackedElements(self.dim)
+        packed.append(self)
+        return packed.electricFieldPot(fieldPos, magnitude)
+
+    # Same as electricPot, named as in Charge3D.
+    def potentialField(self, fieldPos):
+        return self.electricPot(fieldPos)
+
+
+# A Polyline of straight segments through vertices carrying a total charge Q.
+# The charge of each segment is proportional to its weight, by default the length of the segment.
+class Polyline(Element):
+
+    def __init__(self, Q, vertices, weights=None):
+        vertices = np.asarray(vertices, dtype=np.float64)
+        Element.__init__(self, Q, vertices.shape[1])
+        if len(vertices) < 2:
+            raise ValueError("Polyline requires at least 2 vertices")
+        self.vertices = vertices
+        lengths = np.linalg.norm(np.diff(vertices, axis=0), axis=1)
+        keep = lengths > 0
+        weights = lengths if weights is None else np.asarray(weights, dtype=np.float64)
+        # Charge of each segment, divided by its length to give the line charge density.
+        charges = Q * weights / weights.sum()
+        self._lam = charges[keep] / lengths[keep]
+        self._start = vertices[:-1][keep]
+        self._end = vertices[1:][keep]
+
+    def getSegments(self):
+        return self._lam, self._start, self._end
+
+    def getOutline(self):
+        return [self.vertices]
+
+
+# A straight Segment from start to end carrying a total charge Q.
+class Segment(Polyline):
+
+    def __init__(self, Q, start, end):
+        Polyline.__init__(self, Q, [start, end])
+        self.start = self.vertices[0]
+        self.end = self.vertices[1]
+
+
+# Vertices of an arc of radius R from angle theta0 to theta1, split into chords such that
+# the sagitta of each chord stays below tolerance * R.
+def arcAngles(theta0, theta1, tolerance):
+    step = 2 * np.arccos(1 - tolerance)
+    n = max(1, int(np.ceil(abs(theta1 - theta0) / step)))
+    return np.linspace(theta0, theta1, n + 1)
+
+
+# A circular Arc in the xy plane of radius R about center, from angle theta0 to theta1, carrying a total charge Q.
+class Arc(Polyline):
+
+    def __init__(self, Q, center, R, theta0=0., theta1=2 * np.pi, tolerance=1e-3):
+        self.center = np.asarray(center, dtype=np.float64)
+        self.R = R
+        t = arcAngles(theta0, theta1, tolerance)
+        Polyline.__init__(self, Q, self.center + R * np.column_stack([np.cos(t), np.sin(t)]),
+                          weights=np.diff(t))
+
+
+# A rectangular Panel in the xy plane of size dim = [width, height] with its lower left vertex
+# at vertex, carrying a total charge Q with uniform surface charge density.
+class Panel(Element):
+
+    def __init__(self, Q, dim, vertex):
+        Element.__init__(self, Q, 2)
+        self.size = np.asarray(dim, dtype=np.float64)
+        self.vertex = np.asarray(vertex, dtype=np.float64)
+        self.sigma = Q / (self.size[0] * self.size[1])
+
+    def getPanels(self):
+        return (np.array([self.sigma]), self.vertex[np.newaxis, :],
+                np.array([[self.size[0], 0.]]), np.array([[0., self.size[1]]]))
+
+    def getOutline(self):
+        w, h = self.size
+        return [self.vertex + np.array([[0, 0], [w, 0], [w, h], [0, h], [0, 0]])]
+
+
+# A PackedElements object to store the segments and panels of a list of Elements in packed arrays,
+# so that all elements of a System are evaluated in one vectorized pass.
+class PackedElements:
+
+    def __init__(self, dim):
+        self.dim = dim
+        self.count = 0
+        self._segments = []
+        self._panels = []
+        self._packed = None
+
+    def __len__(self):
+        return self.count
+
+    # Method to add a single Element
+    def append(self, element):
+        if element.dim != self.dim:
+            raise ValueError("Element of dimension " + str(element.dim) +
+                             " cannot be added to a collection of dimension " + str(self.dim))
+        self._segments.append(element.getSegments())
+        self._panels.append(element.getPanels())
+        self.count += 1
+        self._packed = None
+
+    # Method to remove the element at index
+    def remove(self, index):
+        self._segments.pop(index)
+        self._panels.pop(index)
+        self.count -= 1
+        self._packed = None
+
+    # Getter Method for the concatenated segments and panels of all elements
+    def getPacked(self):
+        if self._packed is None:
+            segments = tuple(np.concatenate([s[k] for s in self._segments]) for k in range(3)) \
+                if self._segments else _noSegments(self.dim)
+            panels = tuple(np.concatenate([p[k] for p in self._panels]) for k in range(4)) \
+                if self._panels else _noPanels(self.dim)
+            self._packed = segments, panels
+        return self._packed
+
+    # Electric Field and Potential of all elements at a (dim, m) array of field points.
+    def evaluate(self, points, field=True, potential=True):
+        segments, panels = self.getPacked()
+        E = np.zeros((self.dim, points.shape[1])) if field else None
+        V = np.zeros(points.shape[1]) if potential else None
+        for kernel, arrays in ((segmentKernel, segments), (panelKernel, panels)):
+            if len(arrays[0]) == 0:
+                continue
+            Ek, Vk = kernel(*arrays, points, field, potential)
+            if field:
+                E += Ek
+            if potential:
+                V += Vk
+        return E, V
+
+    # Total Electric Field of all elements at a given position vector fieldPos.
+    def electricField(self, fieldPos):
+        points, shape = flattenFieldPos(fieldPos, self.dim)
+        E, V = self.evaluate(points, potential=False)
+        return tuple(E[k].reshape(shape) for k in range(self.dim))
+
+    # Total Electric Potential of all elements at a given position vector fieldPos.
+    def electricPot(self, fieldPos):
+        points, shape = flattenFieldPos(fieldPos, self.dim)
+        E, V = self.evaluate(points, field=False)
+        return V.reshape(shape)
+
+    # Total Electric Field and Potential of all elements at fieldPos in a single pass.
+    def electricFieldPot(self, fieldPos, magnitude=False):
+        points, shape = flattenFieldPos(fieldPos, self.dim)
+        E, V = self.evaluate(points)
+        return packFieldPotential(E, V, shape, magnitude)
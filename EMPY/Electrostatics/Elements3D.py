@@ -0,0 +1,97 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Elements3D.py
+Date: 18/10/2026
+Description: Contains Polyline3D(Polyline), Segment3D(Polyline3D), Arc3D(Polyline3D) and Panel3D(Element) Classes.
+             3 Dimensional variants of the uniformly charged source elements of EMPY.Electrostatics.Elements,
+             to be used with System3D in place of clouds of Charge3D objects.
+
+             Element object requires input a total charge Q and its geometry.
+
+Usage: Requires numpy library and EMPY.Electrostatics.Elements.
+'''
+
+import numpy as np
+from EMPY.Electrostatics.Elements import Element, Polyline, arcAngles
+
+
+# A Polyline3D of straight segments through 3D vertices carrying a total charge Q.
+class Polyline3D(Polyline):
+
+    def __init__(self, Q, vertices, weights=None):
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if vertices.ndim != 2 or vertices.shape[1] != 3:
+            raise ValueError("Polyline3D requires an (n, 3) array of vertices")
+        Polyline.__init__(self, Q, vertices, weights)
+
+
+# A straight Segment3D from start to end carrying a total charge Q.
+class Segment3D(Polyline3D):
+
+    def __init__(self, Q, start, end):
+        Polyline3D.__init__(self, Q, [start, end])
+        self.start = self.vertices[0]
+        self.end = self.vertices[1]
+
+
+# Two unit vectors spanning the plane perpendicular to normal.
+def planeBasis(normal):
+    n = np.asarray(normal, dtype=np.float64)
+    n = n / np.linalg.norm(n)
+    helper = np.eye(3)[np.argmin(np.abs(n))]
+    e1 = np.cross(n, helper)
+    e1 /= np.linalg.norm(e1)
+    return e1, np.cross(n, e1)
+
+
+# A circular Arc3D of radius R about center in the plane perpendicular to normal,
+# from angle theta0 to theta1, carrying a total charge Q.
+class Arc3D(Polyline3D):
+
+    def __init__(self, Q, center, R, theta0=0., theta1=2 * np.pi, normal=(0, 0, 1), tolerance=1e-3):
+        self.center = np.asarray(center, dtype=np.float64)
+        self.R = R
+        self.normal = np.asarray(normal, dtype=np.float64) / np.linalg.norm(normal)
+        e1, e2 = planeBasis(self.normal)
+        t = arcAngles(theta0, theta1, tolerance)
+        vertices = self.center + R * (np.cos(t)[:, np.newaxis] * e1 + np.sin(t)[:, np.newaxis] * e2)
+        Polyline3D.__init__(self, Q, vertices, weights=np.diff(t))
+
+
+# A rectangular Panel3D spanned by the orthogonal edges edgeU and edgeV from corner,
+# carrying a total charge Q with uniform surface charge density.
+class Panel3D(Element):
+
+    def __init__(self, Q, corner, edgeU, edgeV):
+        Element.__init__(self, Q, 3)
+        self.corner = np.asarray(corner, dtype=np.float64)
+        self.edgeU = np.asarray(edgeU, dtype=np.float64)
+        self.edgeV = np.asarray(edgeV, dtype=np.float64)
+        a, b = np.linalg.norm(self.edgeU), np.linalg.norm(self.edgeV)
+        if abs(self.edgeU.dot(self.edgeV)) > 1e-9 * a * b:
+            raise ValueError("Panel3D requires orthogonal edges")
+        self.sigma = Q / (a * b)
+
+    def getPanels(self):
+        return (np.array([self.sigma]), self.corner[np.newaxis, :],
+                self.edgeU[np.newaxis, :], self.edgeV[np.newaxis, :])
+
+    def getOutline(self):
+        return [self.corner + np.array([0 * self.edgeU, self.edgeU, self.edgeU + self.edgeV,
+                                        self.edgeV, 0 * self.edgeU])]
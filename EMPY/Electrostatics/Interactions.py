@@ -0,0 +1,113 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Interactions.py
+Date: 18/10/2026
+Description: Pairwise interactions of the packed charges of a System or System3D with each other.
+             The charges are split into blocks and only the blocks on and above the diagonal are
+             evaluated, every pair giving both of its charges their potential and, by Newton's
+             third law, equal and opposite forces. Sums over a block are matrix products, and rows
+             of blocks are shared out over threads with their own accumulators.
+
+Usage: Requires numpy library, concurrent.futures, EMPY.Electrostatics.Kernels and EMPY.Core.Parallel.
+'''
+
+import numpy as np
+from EMPY.Electrostatics.Kernels import CLAMP_RADIUS
+from EMPY.Core.Parallel import resolveWorkers
+
+# Number of charges per block, so a block of pairs is a few hundred kB and stays in cache.
+PAIR_BLOCK = 256
+
+
+# Potentials and forces on the charges of the block rows assigned to one worker, accumulated into phi and F.
+# Positions are taken relative to the centre of the row block, which keeps the cancellation in
+# x_i sum_j w_ij q_j - sum_j w_ij q_j x_j down to the size of the blocks.
+def _rows(q, sourcePos, rows, phi, F, forces, blockSize):
+    n, dim = sourcePos.shape
+    for i0 in rows:
+        i1 = min(i0 + blockSize, n)
+        centre = sourcePos[i0:i1].mean(axis=0)
+        xi = sourcePos[i0:i1] - centre
+        qi = q[i0:i1]
+        # Buffers of the block, reused by every block of the row
+        rBuffer = np.empty((i1 - i0, blockSize))
+        dBuffer = np.empty((i1 - i0, blockSize))
+        for j0 in range(i0, n, blockSize):
+            j1 = min(j0 + blockSize, n)
+            xj = sourcePos[j0:j1] - centre
+            qj = q[j0:j1]
+            r = rBuffer[:, :j1 - j0]
+            d = dBuffer[:, :j1 - j0]
+            np.subtract(xi[:, 0, np.newaxis], xj[:, 0], out=r)
+            r *= r
+            for k in range(1, dim):
+                np.subtract(xi[:, k, np.newaxis], xj[:, k], out=d)
+                d *= d
+                r += d
+            np.maximum(r, CLAMP_RADIUS * CLAMP_RADIUS, out=r)
+            np.sqrt(r, out=r)
+            # 1/r, with a charge not interacting with itself on the diagonal block. The diagonal block holds
+            # both orders of its pairs, so only its rows are accumulated.
+            np.divide(1., r, out=r)
+            diagonal = j0 == i0
+            if diagonal:
+                np.fill_diagonal(r, 0.)
+            # Potential of Point Charge - Griffith Page 85, Eqn 26, for both charges of every pair
+            phi[i0:i1] += r.dot(qj)
+            if not diagonal:
+                phi[j0:j1] += qi.dot(r)
+            if forces:
+                # w = 1 / r^3, and sum_j w_ij q_j (x_i - x_j) from two products with [q, q x]
+                np.multiply(r, r, out=d)
+                r *= d
+                Qj = np.column_stack([qj, qj[:, np.newaxis] * xj])
+                Wi = r.dot(Qj)
+                F[i0:i1] += qi[:, np.newaxis] * (xi * Wi[:, :1] - Wi[:, 1:])
+                if not diagonal:
+                    Qi = np.column_stack([qi, qi[:, np.newaxis] * xi])
+                    Wj = Qi.T.dot(r).T
+                    F[j0:j1] += qj[:, np.newaxis] * (xj * Wj[:, :1] - Wj[:, 1:])
+
+
+# Interactions of the packed charges q at sourcePos of shape (n, dim) with each other. Returns the total
+# energy sum_{i<j} q_i q_j / r_ij, the (n, dim) forces on the charges (None unless forces) and the potential
+# at every charge from all the others. workers > 1 shares the rows of blocks out over threads, see
+# EMPY.Core.Parallel for the default.
+def pairInteractions(q, sourcePos, forces=True, workers=None, blockSize=PAIR_BLOCK):
+    q = np.asarray(q, dtype=np.float64)
+    sourcePos = np.asarray(sourcePos, dtype=np.float64)
+    n, dim = sourcePos.shape
+    starts = list(range(0, n, blockSize))
+    workers = max(1, min(resolveWorkers(workers), len(starts)))
+    # Rows near the top have the most blocks above the diagonal, so rows are dealt out from both ends
+    # in turn to even out the work of the workers.
+    order = [starts[k // 2] if k % 2 == 0 else starts[-1 - k // 2] for k in range(len(starts))]
+    accumulators = [(np.zeros(n), np.zeros((n, dim))) for _ in range(workers)]
+    tasks = [(order[w::workers], phi, F) for w, (phi, F) in enumerate(accumulators)]
+    if workers == 1:
+        _rows(q, sourcePos, tasks[0][0], tasks[0][1], tasks[0][2], forces, blockSize)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as executor:
+            for future in [executor.submit(_rows, q, sourcePos, rows, phi, F, forces, blockSize)
+                           for rows, phi, F in tasks]:
+                future.result()
+    phi = sum(a[0] for a in accumulators)
+    F = sum(a[1] for a in accumulators) if forces else None
+    return 0.5 * q.dot(phi), F, phi
@@ -0,0 +1,264 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Kernels.py
+Date: 18/10/2026
+Description: Vectorized superposition kernels for point charges and analytic source elements.
+             The field points are evaluated against the packed charges of a System in blocks,
+             so the cost depends on the number of charge-point pairs and not on interpreter overhead.
+             Works for both 2 Dimensional (System) and 3 Dimensional (System3D) charges.
+             Uniformly charged straight segments and rectangular panels are evaluated with their
+             closed form field and potential, vectorized over elements and field points.
+
+Usage: Requires numpy library.
+'''
+
+import numpy as np
+
+# Setting tolerance for separation vector, identical to the one used by Charge and Charge3D.
+CLAMP_RADIUS = 0.005
+# Maximum number of charge-point pairs held in a single temporary array. Blocks are kept small
+# enough to stay in cache, which matters more than the number of numpy calls per block.
+BLOCK_ELEMENTS = 1 << 14
+# Maximum number of field points in a single block.
+POINT_BLOCK = 4096
+
+
+# Flatten a fieldPos list of coordinate arrays [x, y(, z)] into a (dim, m) array of field points.
+# Returns the points together with the shape the results have to be reshaped into.
+def flattenFieldPos(fieldPos, dim):
+    components = np.broadcast_arrays(*[np.asarray(fieldPos[k], dtype=np.float64) for k in range(dim)])
+    shape = components[0].shape
+    points = np.empty((dim, components[0].size), dtype=np.float64)
+    for k in range(dim):
+        points[k] = components[k].ravel()
+    return points, shape
+
+
+# Yield (start, stop) slices over the field points and the charges such that each block
+# holds at most BLOCK_ELEMENTS charge-point pairs.
+def _blocks(nCharges, nPoints):
+    pointBlock = max(1, min(nPoints, POINT_BLOCK))
+    chargeBlock = max(1, BLOCK_ELEMENTS // pointBlock)
+    for p0 in range(0, nPoints, pointBlock):
+        p1 = min(p0 + pointBlock, nPoints)
+        for c0 in range(0, nCharges, chargeBlock):
+            yield (p0, p1), (c0, min(c0 + chargeBlock, nCharges))
+
+
+# Separation vectors between a block of source positions and a block of points.
+def _differences(sourcePos, points):
+    return [points[k][np.newaxis, :] - sourcePos[:, k][:, np.newaxis] for k in range(len(points))]
+
+
+# Separation vectors and clamped separation distance between a block of charges and a block of points.
+def _separation(sourcePos, points):
+    d = _differences(sourcePos, points)
+    r = d[0] * d[0]
+    for dk in d[1:]:
+        r += dk * dk
+    np.sqrt(r, out=r)
+    np.maximum(r, CLAMP_RADIUS, out=r)
+    return d, r
+
+
+# Field and potential of the packed charges q at sourcePos on a (dim, m) array of field points.
+# The separation vectors, distances and 1/r are computed once per block and shared by E and V.
+def pointKernel(q, sourcePos, points, field, potential):
+    dim = sourcePos.shape[1]
+    E = np.zeros((dim, points.shape[1])) if field else None
+    V = np.zeros(points.shape[1]) if potential else None
+    for (p0, p1), (c0, c1) in _blocks(len(q), points.shape[1]):
+        d, r = _separation(sourcePos[c0:c1], points[:, p0:p1])
+        # 1/r, computed in place on the distance buffer
+        np.divide(1, r, out=r)
+        # Potential of Point Charge - Griffith Page 85, Eqn 26
+        if potential:
+            V[p0:p1] += q[c0:c1].dot(r)
+        # Electric Field E - Griffith Page 61, Eqn 4, with w = q / r**3
+        if field:
+            w = r * r
+            w *= r
+            w *= q[c0:c1, np.newaxis]
+            for k in range(dim):
+                d[k] *= w
+                E[k, p0:p1] += d[k].sum(axis=0)
+    return E, V
+
+
+# Total Electric Field of the packed charges q at sourcePos
+def superposeField(q, sourcePos, fieldPos):
+    points, shape = flattenFieldPos(fieldPos, sourcePos.shape[1])
+    E, V = pointKernel(q, sourcePos, points, True, False)
+    return tuple(Ek.reshape(shape) for Ek in E)
+
+
+# Total Electric Potential of the packed charges q at sourcePos
+def superposePotential(q, sourcePos, fieldPos):
+    points, shape = flattenFieldPos(fieldPos, sourcePos.shape[1])
+    E, V = pointKernel(q, sourcePos, points, False, True)
+    return V.reshape(shape)
+
+
+# Total Electric Field and Potential of the packed charges q at sourcePos from a single pass.
+# Returns (Ex, Ey(, Ez), V) or, with magnitude=True, (Ex, Ey(, Ez), V, |E|).
+def superposeFieldPotential(q, sourcePos, fieldPos, magnitude=False):
+    points, shape = flattenFieldPos(fieldPos, sourcePos.shape[1])
+    E, V = pointKernel(q, sourcePos, points, True, True)
+    return packFieldPotential(E, V, shape, magnitude)
+
+
+# Flatten a (dim, m) field E and an (m,) potential V, either of which may be None, into a single vector.
+def flattenFieldPotential(E, V):
+    return np.concatenate([np.empty(0) if E is None else E.ravel(), np.empty(0) if V is None else V])
+
+
+# Split a vector flattened by flattenFieldPotential back into the (Ex, Ey(, Ez), V) tuple of EV_Total.
+def unflattenFieldPotential(values, dim, field, potential, shape):
+    m = int(np.prod(shape))
+    E = values[:dim * m].reshape(dim, m) if field else None
+    V = values[dim * m if field else 0:] if potential else None
+    return packFieldPotential(E, V, shape)
+
+
+# Reshape a (dim, m) field and an (m,) potential into the (Ex, Ey(, Ez), V(, |E|)) tuple of EV_Total.
+# Either E or V may be None, in which case it is left out of the tuple.
+def packFieldPotential(E, V, shape, magnitude=False):
+    result = () if E is None else tuple(Ek.reshape(shape) for Ek in E)
+    if V is not None:
+        result += (V.reshape(shape),)
+    if magnitude:
+        result += (np.sqrt(np.einsum('ij,ij->j', E, E)).reshape(shape),)
+    return result
+
+
+# Field and potential of uniformly charged straight segments, line charge density lam from start to end.
+# Closed form integrals of Griffith Page 61, Eqn 4 and Page 85, Eqn 26 along the segment. s is the
+# coordinate of the field point along the segment and rho its distance from the line of the segment.
+def segmentKernel(lam, start, end, points, field, potential):
+    dim = start.shape[1]
+    E = np.zeros((dim, points.shape[1])) if field else None
+    V = np.zeros(points.shape[1]) if potential else None
+    axis = end - start
+    L = np.sqrt(np.einsum('ij,ij->i', axis, axis))
+    u = axis / L[:, np.newaxis]
+    for (p0, p1), (c0, c1) in _blocks(len(lam), points.shape[1]):
+        d = _differences(start[c0:c1], points[:, p0:p1])
+        uk = u[c0:c1]
+        s = sum(d[k] * uk[:, k][:, np.newaxis] for k in range(dim))
+        rho = [d[k] - s * uk[:, k][:, np.newaxis] for k in range(dim)]
+        rhoc = np.sqrt(sum(rk * rk for rk in rho))
+        np.maximum(rhoc, CLAMP_RADIUS, out=rhoc)
+        t = L[c0:c1, np.newaxis] - s
+        l = lam[c0:c1, np.newaxis]
+        if potential:
+            V[p0:p1] += (l * (np.arcsinh(t / rhoc) + np.arcsinh(s / rhoc))).sum(axis=0)
+        if field:
+            r1 = np.sqrt(rhoc * rhoc + s * s)
+            r2 = np.sqrt(rhoc * rhoc + t * t)
+            Epar = l * (1 / r2 - 1 / r1)
+            Eperp = l * (s / r1 + t / r2) / (rhoc * rhoc)
+            for k in range(dim):
+                E[k, p0:p1] += (Epar * uk[:, k][:, np.newaxis] + Eperp * rho[k]).sum(axis=0)
+    return E, V
+
+
+# log(Y + R) for R = sqrt(X**2 + Y**2 + z**2), without cancellation when Y < 0.
+def _logYR(Y, R, XZ2):
+    out = np.empty_like(R)
+    pos = Y >= 0
+    out[pos] = np.log(np.maximum(Y[pos] + R[pos], CLAMP_RADIUS ** 2))
+    neg = ~pos
+    out[neg] = np.log(np.maximum(XZ2[neg], CLAMP_RADIUS ** 4)) - np.log(R[neg] - Y[neg])
+    return out
+
+
+# Field and potential of uniformly charged rectangular panels, surface charge density sigma, spanned by
+# the orthogonal edges edgeU and edgeV from the corner origin. Closed form double integral over the panel:
+# V = sigma * sum over corners of +-[X log(Y + R) + Y log(X + R) - z atan(X Y / (z R))]
+def panelKernel(sigma, origin, edgeU, edgeV, points, field, potential):
+    dim = origin.shape[1]
+    E = np.zeros((dim, points.shape[1])) if field else None
+    V = np.zeros(points.shape[1]) if potential else None
+    a = np.sqrt(np.einsum('ij,ij->i', edgeU, edgeU))
+    b = np.sqrt(np.einsum('ij,ij->i', edgeV, edgeV))
+    e1 = edgeU / a[:, np.newaxis]
+    e2 = edgeV / b[:, np.newaxis]
+    if dim == 3:
+        normal = np.cross(e1, e2)
+    for (p0, p1), (c0, c1) in _blocks(len(sigma), points.shape[1]):
+        d = _differences(origin[c0:c1], points[:, p0:p1])
+        x = sum(d[k] * e1[c0:c1, k][:, np.newaxis] for k in range(dim))
+        y = sum(d[k] * e2[c0:c1, k][:, np.newaxis] for k in range(dim))
+        z = sum(d[k] * normal[c0:c1, k][:, np.newaxis] for k in range(dim)) if dim == 3 else np.zeros_like(x)
+        sgnz = np.sign(z)
+        az = np.abs(z)
+        sig = sigma[c0:c1, np.newaxis]
+        Ex, Ey, Ez, Vp = 0, 0, 0, 0
+        ab, bb = a[c0:c1, np.newaxis], b[c0:c1, np.newaxis]
+        for uc, vc, sgn in ((ab, bb, 1), (0., 0., 1), (0., bb, -1), (ab, 0., -1)):
+            X = uc - x
+            Y = vc - y
+            R = np.sqrt(X * X + Y * Y + z * z)
+            logYR = _logYR(Y, R, X * X + z * z)
+            logXR = _logYR(X, R, Y * Y + z * z)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                angle = np.where(az > 0, np.arctan2(X * Y, az * R), 0.)
+            if potential:
+                Vp = Vp + sgn * (X * logYR + Y * logXR - az * angle)
+            if field:
+                Ex = Ex + sgn * logYR
+                Ey = Ey + sgn * logXR
+                Ez = Ez + sgn * sgnz * angle
+        if potential:
+            V[p0:p1] += (sig * Vp).sum(axis=0)
+        if field:
+            for k in range(dim):
+                Ek = Ex * e1[c0:c1, k][:, np.newaxis] + Ey * e2[c0:c1, k][:, np.newaxis]
+                if dim == 3:
+                    Ek = Ek + Ez * normal[c0:c1, k][:, np.newaxis]
+                E[k, p0:p1] += (sig * Ek).sum(axis=0)
+    return E, V
+
+
+# Total Electric Field of uniformly charged segments at fieldPos
+def segmentField(lam, start, end, fieldPos):
+    points, shape = flattenFieldPos(fieldPos, start.shape[1])
+    E, V = segmentKernel(lam, start, end, points, True, False)
+    return tuple(E[k].reshape(shape) for k in range(start.shape[1]))
+
+
+# Total Electric Potential of uniformly charged segments at fieldPos
+def segmentPotential(lam, start, end, fieldPos):
+    points, shape = flattenFieldPos(fieldPos, start.shape[1])
+    E, V = segmentKernel(lam, start, end, points, False, True)
+    return V.reshape(shape)
+
+
+# Total Electric Field of uniformly charged rectangular panels at fieldPos
+def panelField(sigma, origin, edgeU, edgeV, fieldPos):
+    points, shape = flattenFieldPos(fieldPos, origin.shape[1])
+    E, V = panelKernel(sigma, origin, edgeU, edgeV, points, True, False)
+    return tuple(E[k].reshape(shape) for k in range(origin.shape[1]))
+
+
+# Total Electric Potential of uniformly charged rectangular panels at fieldPos
+def panelPotential(sigma, origin, edgeU, edgeV, fieldPos):
+    points, shape = flattenFieldPos(fieldPos, origin.shape[1])
+    E, V = panelKernel(sigma, origin, edgeU, edgeV, points, False, True)
+    return V.reshape(shape)
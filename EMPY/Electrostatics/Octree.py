@@ -0,0 +1,228 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: Octree.py
+Date: 18/10/2026
+Description: Contains the Octree Class, a Barnes-Hut tree code for 3 Dimensional point charges.
+             Charges are sorted along a Morton (Z-order) curve and grouped into an octree. Every node
+             stores the monopole, dipole and quadrupole moments of its charges about their centre, so
+             a group of distant charges can be replaced by its multipole expansion. The opening angle
+             theta controls the accuracy: a node is only expanded when radius / distance > theta.
+             The traversal is vectorized over (field point, node) pairs level by level, giving
+             O((N + M) log N) cost for N charges and M field points.
+
+Usage: Requires numpy library and EMPY.Electrostatics.Kernels.
+'''
+
+import numpy as np
+from EMPY.Electrostatics.Kernels import CLAMP_RADIUS
+
+# Number of bits per axis of the Morton codes, 3 * 21 = 63 bits fit a uint64.
+MAX_DEPTH = 21
+# Number of field points traversed together, bounds the size of the (point, node) frontier.
+TARGET_CHUNK = 2048
+
+
+# Spread the lower 21 bits of v so that there are two zero bits between consecutive bits.
+def _spreadBits(v):
+    v = v.astype(np.uint64) & np.uint64(0x1fffff)
+    v = (v | v << np.uint64(32)) & np.uint64(0x1f00000000ffff)
+    v = (v | v << np.uint64(16)) & np.uint64(0x1f0000ff0000ff)
+    v = (v | v << np.uint64(8)) & np.uint64(0x100f00f00f00f00f)
+    v = (v | v << np.uint64(4)) & np.uint64(0x10c30c30c30c30c3)
+    v = (v | v << np.uint64(2)) & np.uint64(0x1249249249249249)
+    return v
+
+
+# Morton (Z-order) codes of an (n, 3) array of positions inside the bounding cube [lo, lo + span].
+def mortonCodes(sourcePos, lo, span):
+    cells = np.floor((sourcePos - lo) / span * (1 << MAX_DEPTH)).astype(np.int64)
+    np.clip(cells, 0, (1 << MAX_DEPTH) - 1, out=cells)
+    return _spreadBits(cells[:, 0]) | _spreadBits(cells[:, 1]) << np.uint64(1) | _spreadBits(cells[:, 2]) << np.uint64(2)
+
+
+# Indices start[i], start[i] + 1, ..., end[i] - 1 of every range, concatenated.
+def _ranges(start, end):
+    counts = end - start
+    offsets = np.repeat(start - np.cumsum(counts) + counts, counts)
+    return offsets + np.arange(counts.sum())
+
+
+# Sum the rows of a over the disjoint, sorted ranges [start[i], end[i]).
+def _rangeSum(a, start, end, ufunc=np.add):
+    padded = np.concatenate([a, np.zeros((1,) + a.shape[1:], dtype=a.dtype)])
+    return ufunc.reduceat(padded, np.ravel(np.column_stack([start, end])), axis=0)[::2]
+
+
+class Octree:
+    'A Barnes-Hut Octree of 3 Dimensional point charges q at source positions sourcePos.'
+
+    def __init__(self, q, sourcePos, theta=0.5, leafSize=32):
+        self.theta = theta
+        self.leafSize = leafSize
+
+        sourcePos = np.asarray(sourcePos, dtype=np.float64).reshape(-1, 3)
+        q = np.asarray(q, dtype=np.float64)
+        lo = sourcePos.min(axis=0) if len(q) else np.zeros(3)
+        span = max(np.ptp(sourcePos, axis=0).max() if len(q) else 0., CLAMP_RADIUS)
+        codes = mortonCodes(sourcePos, lo, span)
+        order = np.argsort(codes, kind='stable')
+        self.order = order
+        self.q = q[order]
+        self.pos = sourcePos[order]
+        codes = codes[order]
+
+        # Build the nodes level by level. Children of a node are consecutive node indices.
+        starts, ends = [np.array([0])], [np.array([len(q)])]
+        levelIds = np.array([0])
+        childFirst = np.zeros(1, dtype=np.int64)
+        childCount = np.zeros(1, dtype=np.int64)
+        for level in range(1, MAX_DEPTH + 1):
+            split = (ends[-1] - starts[-1]) > leafSize
+            if not split.any():
+                break
+            s, e, split = starts[-1][split], ends[-1][split], levelIds[split]
+            idx = _ranges(s, e)
+            owner = np.repeat(split, e - s)
+            ownerEnd = np.repeat(e, e - s)
+            # A child starts wherever the Morton prefix of this level changes inside its parent.
+            prefix = codes[idx] >> np.uint64(3 * (MAX_DEPTH - level))
+            first = np.ones(len(idx), dtype=bool)
+            first[1:] = (prefix[1:] != prefix[:-1]) | (owner[1:] != owner[:-1])
+            childStart, childOwner = idx[first], owner[first]
+            childEnd = np.append(childStart[1:], 0)
+            lastOfOwner = np.append(childOwner[1:] != childOwner[:-1], True)
+            childEnd[lastOfOwner] = ownerEnd[first][lastOfOwner]
+            firstOfOwner = np.append(True, childOwner[1:] != childOwner[:-1])
+
+            ids = len(childFirst) + np.arange(len(childStart))
+            childFirst = np.concatenate([childFirst, np.zeros(len(ids), dtype=np.int64)])
+            childCount = np.concatenate([childCount, np.zeros(len(ids), dtype=np.int64)])
+            childFirst[childOwner[firstOfOwner]] = ids[firstOfOwner]
+            childCount[split] = np.bincount(childOwner, minlength=len(childCount))[split]
+
+            starts.append(childStart)
+            ends.append(childEnd)
+            levelIds = ids
+
+        self.start = np.concatenate(starts)
+        self.end = np.concatenate(ends)
+        self.childFirst = childFirst
+        self.childCount = childCount
+        self._computeMoments(starts, ends)
+
+    # Monopole, dipole and traceless quadrupole moments of every node about the |q| weighted centre,
+    # and the radius of the sphere about that centre which contains all the charges of the node.
+    def _computeMoments(self, starts, ends):
+        nNodes = len(self.start)
+        self.Q = np.zeros(nNodes)
+        self.centre = np.zeros((nNodes, 3))
+        self.dipole = np.zeros((nNodes, 3))
+        self.quadrupole = np.zeros((nNodes, 3, 3))
+        self.radius = np.zeros(nNodes)
+
+        absQ = np.abs(self.q)
+        offset = 0
+        for s, e in zip(starts, ends):
+            ids = offset + np.arange(len(s))
+            offset += len(s)
+            if len(self.q) == 0:
+                continue
+            # Nodes of one level are disjoint, so their moments are sums over disjoint ranges.
+            order = np.argsort(s)
+            s, e, ids = s[order], e[order], ids[order]
+            A = _rangeSum(absQ, s, e)
+            Q = _rangeSum(self.q, s, e)
+            weights = np.where(A > 0, A, 1.)
+            centre = _rangeSum(absQ[:, np.newaxis] * self.pos, s, e) / weights[:, np.newaxis]
+            counts = e - s
+            idx = _ranges(s, e)
+            d = self.pos[idx] - np.repeat(centre, counts, axis=0)
+            qd = self.q[idx, np.newaxis] * d
+            dipole = np.add.reduceat(qd, np.cumsum(counts) - counts, axis=0)
+            second = np.add.reduceat(qd[:, :, np.newaxis] * d[:, np.newaxis, :], np.cumsum(counts) - counts, axis=0)
+            trace = np.trace(second, axis1=1, axis2=2)
+            self.Q[ids] = Q
+            self.centre[ids] = centre
+            self.dipole[ids] = dipole
+            self.quadrupole[ids] = 3 * second - trace[:, np.newaxis, np.newaxis] * np.eye(3)
+            self.radius[ids] = np.maximum.reduceat(np.sqrt(np.einsum('ij,ij->i', d, d)), np.cumsum(counts) - counts)
+
+    # Electric Field and Potential of the tree at a (3, m) array of field points.
+    def evaluate(self, points):
+        m = points.shape[1]
+        E = np.zeros((3, m))
+        V = np.zeros(m)
+        X = points.T
+        for t0 in range(0, m, TARGET_CHUNK):
+            t1 = min(t0 + TARGET_CHUNK, m)
+            self._traverse(X[t0:t1], E[:, t0:t1], V[t0:t1])
+        return E, V
+
+    def _traverse(self, X, E, V):
+        m = len(X)
+        if len(self.q) == 0:
+            return
+        t = np.arange(m)
+        n = np.zeros(m, dtype=np.int64)
+        while len(t):
+            R = X[t] - self.centre[n]
+            r = np.sqrt(np.einsum('ij,ij->i', R, R))
+            accept = (r * self.theta > self.radius[n]) & (r > CLAMP_RADIUS)
+            if accept.any():
+                self._farField(t[accept], n[accept], R[accept], r[accept], E, V, m)
+
+            isLeaf = self.childCount[n] == 0
+            near = ~accept & isLeaf
+            if near.any():
+                self._nearField(X, t[near], n[near], E, V, m)
+
+            expand = ~accept & ~isLeaf
+            counts = self.childCount[n[expand]]
+            t = np.repeat(t[expand], counts)
+            n = _ranges(self.childFirst[n[expand]], self.childFirst[n[expand]] + counts)
+
+    # Multipole expansion of the accepted nodes n at the field points t, R = X[t] - centre[n].
+    def _farField(self, t, n, R, r, E, V, m):
+        inv = 1 / r
+        inv2 = inv * inv
+        inv3 = inv2 * inv
+        pR = np.einsum('ij,ij->i', self.dipole[n], R)
+        QR = np.einsum('ijk,ik->ij', self.quadrupole[n], R)
+        RQR = np.einsum('ij,ij->i', R, QR)
+        inv5 = inv3 * inv2
+        pot = self.Q[n] * inv + pR * inv3 + 0.5 * RQR * inv5
+        radial = self.Q[n] * inv3 + 3 * pR * inv5 + 2.5 * RQR * inv5 * inv2
+        field = radial[:, np.newaxis] * R - self.dipole[n] * inv3[:, np.newaxis] - QR * inv5[:, np.newaxis]
+        V += np.bincount(t, weights=pot, minlength=m)
+        for k in range(3):
+            E[k] += np.bincount(t, weights=field[:, k], minlength=m)
+
+    # Direct sum of the charges of the leaves n at the field points t.
+    def _nearField(self, X, t, n, E, V, m):
+        counts = self.end[n] - self.start[n]
+        t = np.repeat(t, counts)
+        idx = _ranges(self.start[n], self.end[n])
+        d = X[t] - self.pos[idx]
+        r = np.sqrt(np.einsum('ij,ij->i', d, d))
+        np.maximum(r, CLAMP_RADIUS, out=r)
+        w = self.q[idx] / r
+        V += np.bincount(t, weights=w, minlength=m)
+        w /= r * r
+        for k in range(3):
+            E[k] += np.bincount(t, weights=w * d[:, k], minlength=m)
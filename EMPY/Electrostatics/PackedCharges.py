@@ -0,0 +1,88 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: PackedCharges.py
+Date: 18/10/2026
+Description: Contains the PackedCharges Class.
+             PackedCharges stores the charges and source positions of a System in contiguous
+             numpy arrays so that superposition can be evaluated without a Python loop over Charge objects.
+
+Usage: Requires numpy library.
+'''
+
+import numpy as np
+
+
+# A PackedCharges object to store the charges q and source positions of a System in packed arrays.
+# Storage grows geometrically, so appending a single charge is amortized O(1).
+class PackedCharges:
+
+    def __init__(self, dim, capacity=16):
+        self.dim = dim
+        self.count = 0
+        self._q = np.empty(capacity, dtype=np.float64)
+        self._pos = np.empty((capacity, dim), dtype=np.float64)
+
+    def __len__(self):
+        return self.count
+
+    # Grow the underlying buffers so that at least n charges fit.
+    def _reserve(self, n):
+        capacity = len(self._q)
+        if n <= capacity:
+            return
+        while capacity < n:
+            capacity *= 2
+        q = np.empty(capacity, dtype=np.float64)
+        pos = np.empty((capacity, self.dim), dtype=np.float64)
+        q[:self.count] = self._q[:self.count]
+        pos[:self.count] = self._pos[:self.count]
+        self._q, self._pos = q, pos
+
+    # Method to add a single charge q at the source position sourcePos
+    def append(self, q, sourcePos):
+        self._reserve(self.count + 1)
+        self._q[self.count] = q
+        self._pos[self.count] = np.asarray(sourcePos, dtype=np.float64)[:self.dim]
+        self.count += 1
+
+    # Method to add an array of charges at an (n, dim) array of source positions
+    def extend(self, q, sourcePos):
+        sourcePos = np.asarray(sourcePos, dtype=np.float64).reshape(-1, self.dim)
+        q = np.broadcast_to(np.asarray(q, dtype=np.float64), (len(sourcePos),))
+        self._reserve(self.count + len(sourcePos))
+        self._q[self.count:self.count + len(sourcePos)] = q
+        self._pos[self.count:self.count + len(sourcePos)] = sourcePos
+        self.count += len(sourcePos)
+
+    # Method to remove the charge at index, keeping the order of the remaining charges
+    def remove(self, index):
+        if not -self.count <= index < self.count:
+            raise IndexError("PackedCharges index out of range")
+        index %= self.count
+        self._q[index:self.count - 1] = self._q[index + 1:self.count]
+        self._pos[index:self.count - 1] = self._pos[index + 1:self.count]
+        self.count -= 1
+
+    # Getter Method for the charges, a view of shape (n,)
+    def getCharges(self):
+        return self._q[:self.count]
+
+    # Getter Method for the source positions, a view of shape (n, dim)
+    def getPositions(self):
+        return self._pos[:self.count]
@@ -0,0 +1,205 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: ParticleMesh.py
+Date: 18/10/2026
+Description: Contains the ParticleMesh Class, a particle-mesh Poisson solver for 2 and 3 Dimensional point charges.
+             The charges are deposited onto a regular grid with cloud-in-cell (CIC) or triangular-shaped-
+             cloud (TSC) weights, the grid charges are convolved with the free space Green's functions of
+             the potential and of the field using zero padded FFTs, and E and V are interpolated back to
+             the field points with the same weights. This costs O(N + M log M) for N charges on a mesh
+             of M nodes instead of O(N) per field point. The mesh fields are smoothed over a few cells,
+             so they are accurate a few cells away from the charges but not among them: on the field
+             points between the charges of a dense plate the rms error of E is tens of percent. Points
+             outside the mesh are evaluated by direct summation, so meshFor grows a mesh to cover the
+             points it is asked to evaluate.
+
+Usage: Requires itertools, numpy, scipy libraries and EMPY.Electrostatics.Kernels.
+'''
+
+import itertools
+import numpy as np
+from EMPY.Electrostatics.Kernels import pointKernel
+
+# Number of grid nodes along each axis every charge is spread over, for each assignment scheme.
+ASSIGNMENTS = {'cic': 2, 'tsc': 3}
+# Default number of cells along the longest side of the mesh, for each dimension.
+DEFAULT_CELLS = {2: 256, 3: 64}
+# Mean of 1 / r over a cell of unit side, used as the Green's function of a node on itself
+# so that the charge of a node is treated as spread over its cell rather than as a point.
+SELF_POTENTIAL = {2: 4. * np.log(1. + np.sqrt(2.)), 3: 2.3800772}
+
+
+# Assignment weights of the (dim, m) points u, in units of grid cells from the mesh origin.
+# Returns the first node (dim, m) each point is spread over and the weights (dim, support, m) of
+# the support nodes from there on along every axis.
+def assignmentWeights(u, assignment):
+    if assignment == 'cic':
+        first = np.floor(u).astype(np.intp)
+        f = u - first
+        return first, np.stack([1. - f, f], axis=1)
+    nearest = np.floor(u + 0.5).astype(np.intp)
+    d = u - nearest
+    return nearest - 1, np.stack([0.5 * (0.5 - d) ** 2, 0.75 - d * d, 0.5 * (0.5 + d) ** 2], axis=1)
+
+
+class ParticleMesh:
+    'Particle-mesh solver for the field and potential of point charges q at the (n, dim) positions sourcePos.'
+
+    # The mesh has cubic cells, cells of them along the longest side of the bounding box of the charges,
+    # extended to cover bounds = (lo, hi) when given, plus a margin of a few cells on every side.
+    def __init__(self, q, sourcePos, cells=None, assignment='tsc', bounds=None):
+        if assignment not in ASSIGNMENTS:
+            raise ValueError("Unknown assignment " + str(assignment) + "; expected 'cic' or 'tsc'")
+        self.q = np.asarray(q, dtype=np.float64)
+        self.sourcePos = np.asarray(sourcePos, dtype=np.float64)
+        self.dim = self.sourcePos.shape[1]
+        self.assignment = assignment
+        self.cells = DEFAULT_CELLS[self.dim] if cells is None else int(cells)
+        if len(self.q):
+            lo, hi = self.sourcePos.min(axis=0), self.sourcePos.max(axis=0)
+        else:
+            lo, hi = np.zeros(self.dim), np.zeros(self.dim)
+        if bounds is not None:
+            lo = np.minimum(lo, np.asarray(bounds[0], dtype=np.float64))
+            hi = np.maximum(hi, np.asarray(bounds[1], dtype=np.float64))
+        # Region covered by the mesh, without its margin
+        self.bounds = (lo, hi)
+        extent = np.max(hi - lo)
+        self.spacing = extent / self.cells if extent > 0 else 1.
+        margin = ASSIGNMENTS[assignment] + 1
+        self.origin = lo - margin * self.spacing
+        self.shape = tuple(int(n) for n in np.ceil((hi - lo) / self.spacing).astype(np.intp) + 1 + 2 * margin)
+        self.charge = self._deposit()
+        self.V, self.E = self._solve()
+
+    # Nodes and weights of the (dim, m) points, as a list of (flat node index, weight) for every support node.
+    def _stencil(self, points):
+        first, weights = assignmentWeights((points - self.origin[:, np.newaxis]) / self.spacing, self.assignment)
+        stencil = []
+        for offset in itertools.product(range(weights.shape[1]), repeat=self.dim):
+            index = np.ravel_multi_index(tuple(first[k] + offset[k] for k in range(self.dim)), self.shape)
+            w = weights[0, offset[0]].copy()
+            for k in range(1, self.dim):
+                w *= weights[k, offset[k]]
+            stencil.append((index, w))
+        return stencil
+
+    # Grid charges of the mesh nodes.
+    def _deposit(self):
+        charge = np.zeros(int(np.prod(self.shape)))
+        for index, w in self._stencil(self.sourcePos.T):
+            charge += np.bincount(index, weights=w * self.q, minlength=charge.size)
+        return charge.reshape(self.shape)
+
+    # Potential and field on the mesh nodes, from the linear convolution of the grid charges with the
+    # Green's functions 1 / r and r / r^3. Zero padding every axis to at least twice the mesh keeps the
+    # periodic images of the FFT convolution apart, giving free space boundary conditions.
+    def _solve(self):
+        import scipy.fft
+        padded = tuple(scipy.fft.next_fast_len(2 * n - 1, real=True) for n in self.shape)
+        chargeHat = scipy.fft.rfftn(self.charge, padded)
+        # Signed node offsets along every axis, wrapped around the padded grid
+        offsets = [np.where(np.arange(n) <= n // 2, np.arange(n), np.arange(n) - n) * self.spacing for n in padded]
+        offsets = np.meshgrid(*offsets, indexing='ij', sparse=True)
+        r = np.sqrt(sum(s * s for s in offsets))
+        origin = (0,) * self.dim
+        r[origin] = 1.
+        inverse = 1. / r
+        mesh = tuple(slice(0, n) for n in self.shape)
+
+        def convolve(kernel):
+            return scipy.fft.irfftn(chargeHat * scipy.fft.rfftn(kernel), padded)[mesh]
+
+        G = inverse.copy()
+        G[origin] = SELF_POTENTIAL[self.dim] / self.spacing
+        V = convolve(G)
+        inverse3 = inverse * inverse * inverse
+        inverse3[origin] = 0.
+        E = np.array([convolve(s * inverse3) for s in offsets])
+        return V, E
+
+    # Whether the support nodes of every one of the (dim, m) points lie in the mesh.
+    def inside(self, points):
+        first, weights = assignmentWeights((points - self.origin[:, np.newaxis]) / self.spacing, self.assignment)
+        return np.all((first >= 0) & (first + weights.shape[1] <= np.array(self.shape)[:, np.newaxis]), axis=0)
+
+    # Field and potential of the charges on a (dim, m) array of field points, interpolated from the
+    # mesh with the assignment weights. Points too close to the edge of the mesh for their support
+    # nodes to lie in it are evaluated by direct summation.
+    def evaluate(self, points, field=True, potential=True):
+        E = np.zeros((self.dim, points.shape[1])) if field else None
+        V = np.zeros(points.shape[1]) if potential else None
+        inside = self.inside(points)
+        meshed = np.nonzero(inside)[0]
+        if len(meshed):
+            for index, w in self._stencil(points[:, meshed]):
+                if potential:
+                    V[meshed] += w * self.V.ravel()[index]
+                if field:
+                    for k in range(self.dim):
+                        E[k, meshed] += w * self.E[k].ravel()[index]
+        outside = np.nonzero(~inside)[0]
+        if len(outside):
+            Eo, Vo = pointKernel(self.q, self.sourcePos, points[:, outside], field, potential)
+            if field:
+                E[:, outside] = Eo
+            if potential:
+                V[outside] = Vo
+        return E, V
+
+    # Compare the mesh against direct summation on a random sample of nSample of the (dim, m) points.
+    # Returns the maximum and root mean square relative errors of the field E and the potential V.
+    def accuracy(self, points, nSample=256, seed=0):
+        rng = np.random.default_rng(seed)
+        sample = points[:, rng.choice(points.shape[1], min(nSample, points.shape[1]), replace=False)]
+        E, V = self.evaluate(sample)
+        E_direct, V_direct = pointKernel(self.q, self.sourcePos, sample, True, True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            errE = np.linalg.norm(E - E_direct, axis=0) / np.linalg.norm(E_direct, axis=0)
+            errV = np.abs(V - V_direct) / np.abs(V_direct)
+        errE, errV = errE[np.isfinite(errE)], errV[np.isfinite(errV)]
+        return {'E_max': float(errE.max(initial=0.)), 'E_rms': float(np.sqrt(np.mean(errE ** 2))) if len(errE) else 0.,
+                'V_max': float(errV.max(initial=0.)), 'V_rms': float(np.sqrt(np.mean(errV ** 2))) if len(errV) else 0.,
+                'nSample': sample.shape[1]}
+
+
+# Particle mesh to evaluate the (dim, m) points with: mesh when it covers them, else a new mesh of the charges.
+# With bounds None the new mesh covers the points together with the region of mesh, so a plot or grid outside
+# the charges is interpolated instead of summed directly; the spacing grows with the region at fixed cells.
+# A mesh grown from an existing one gets a margin of a quarter of its extent on every side, so that points
+# stepping out of it a little at a time, like field lines being traced, only rebuild it a few times.
+# With fixed bounds the mesh is kept and a warning is given when most of the points are outside it.
+def meshFor(mesh, points, q, sourcePos, cells=None, assignment='tsc', bounds=None):
+    if bounds is not None or points.shape[1] == 0:
+        if mesh is None:
+            mesh = ParticleMesh(q, sourcePos, cells, assignment, bounds)
+        outside = points.shape[1] - np.count_nonzero(mesh.inside(points))
+        if 2 * outside > points.shape[1]:
+            import warnings
+            warnings.warn(str(outside) + " of " + str(points.shape[1]) + " field points are outside the particle mesh"
+                          " and are evaluated by direct summation; widen meshBounds", Warning)
+        return mesh
+    if mesh is not None and mesh.inside(points).all():
+        return mesh
+    lo, hi = points.min(axis=1), points.max(axis=1)
+    if mesh is not None:
+        lo, hi = np.minimum(lo, mesh.bounds[0]), np.maximum(hi, mesh.bounds[1])
+        margin = 0.25 * np.max(hi - lo)
+        lo, hi = lo - margin, hi + margin
+    return ParticleMesh(q, sourcePos, cells, assignment, (lo, hi))
@@ -0,0 +1,157 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: SourceIndex.py
+Date: 18/10/2026
+Description: Contains the SourceIndex Class and the duplicateMask function, which find duplicate charges.
+             Two charges are duplicates when they have the same charge and the same position, or positions
+             within a tolerance of each other. SourceIndex hashes every charge added to it, by its position
+             or by the cell of a grid of spacing tolerance, so that checking a charge costs O(1).
+             duplicateMask does the same for whole arrays of charges with sorting instead of Python loops.
+
+Usage: Requires itertools, numpy libraries.
+'''
+
+import itertools
+import numpy as np
+
+# Neighbouring grid cells, including the cell itself, that may hold charges within tolerance.
+NEIGHBOURS = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+# Cells, as multiples of the direction towards the nearer neighbour along each axis, searched by duplicateMask.
+HALF_NEIGHBOURS = np.array(list(itertools.product((0, 1), repeat=3)))
+# Number of charges whose neighbouring cells are searched together by duplicateMask.
+CHUNK = 1 << 15
+
+
+class SourceIndex:
+    'Hashed index of the charges and positions of sources, answering whether a source duplicates one added before.'
+
+    def __init__(self, tolerance=0.):
+        self.tolerance = tolerance
+        self._cells = {}
+
+    def _key(self, pos):
+        if self.tolerance > 0:
+            return tuple(int(np.floor(c / self.tolerance)) for c in pos)
+        # Adding 0. turns -0. into 0.
+        return tuple(float(c) + 0. for c in pos)
+
+    # Whether a source of charge q at pos duplicates one in the index.
+    def contains(self, q, pos):
+        key = self._key(pos)
+        if self.tolerance <= 0:
+            return float(q) in self._cells.get(key, ())
+        for offset in NEIGHBOURS:
+            for q2, pos2 in self._cells.get(tuple(np.add(key, offset)), ()):
+                if q2 == q and np.linalg.norm(np.subtract(pos, pos2)) <= self.tolerance:
+                    return True
+        return False
+
+    def add(self, q, pos):
+        key = self._key(pos)
+        if self.tolerance <= 0:
+            self._cells.setdefault(key, set()).add(float(q))
+        else:
+            self._cells.setdefault(key, []).append((float(q), tuple(float(c) for c in pos)))
+
+
+# Spatial hash of integer grid cells; different cells sharing a hash are told apart by their distance.
+def _cellHash(cells):
+    return (cells[:, 0] * 73856093) ^ (cells[:, 1] * 19349663) ^ (cells[:, 2] * 83492791)
+
+
+# Boolean mask of the charges q at the (n, 3) sourcePos that duplicate an earlier kept one of them or one of
+# the existing charges existingQ at existingPos, i.e. have the same charge at a position within tolerance.
+# The charges kept are the ones a SourceIndex keeps when they are added to it one at a time.
+def duplicateMask(q, sourcePos, tolerance=0., existingQ=None, existingPos=None):
+    q = np.asarray(q, dtype=np.float64)
+    sourcePos = np.asarray(sourcePos, dtype=np.float64).reshape(-1, 3)
+    nExisting = 0 if existingQ is None else len(existingQ)
+    if nExisting:
+        q = np.concatenate([existingQ, q])
+        sourcePos = np.vstack([existingPos, sourcePos])
+    n = len(q)
+    index = np.arange(n)
+    if tolerance <= 0:
+        # Rows of (q, x, y, z) compared as raw bytes; adding 0. turns -0. into 0.
+        keys = np.ascontiguousarray(np.column_stack([q, sourcePos]) + 0.)
+        _, inverse = np.unique(keys.view(np.dtype((np.void, keys.itemsize * 4))).ravel(), return_inverse=True)
+        first = np.full(inverse.max() + 1 if n else 0, n)
+        np.minimum.at(first, inverse, index)
+        return (first[inverse] < index)[nExisting:]
+
+    # On a grid of spacing 2 tolerance, charges within tolerance of a charge lie in its own cell or in the
+    # neighbours towards the half of the cell it is in along each axis, 8 cells in all.
+    fine = np.floor(sourcePos / tolerance).astype(np.int64)
+    cells = fine >> 1
+    towards = 2 * (fine & 1) - 1
+    hashes = _cellHash(cells)
+    order = np.argsort(hashes, kind='stable')
+    sortedHash = hashes[order]
+    pairs = []
+    for c0 in range(0, n, CHUNK):
+        i0 = index[c0:c0 + CHUNK]
+        for offset in HALF_NEIGHBOURS:
+            neighbour = _cellHash(cells[i0] + offset * towards[i0])
+            # searchsorted runs much faster on sorted queries
+            sort = np.argsort(neighbour)
+            i0, neighbour = i0[sort], neighbour[sort]
+            lo = np.searchsorted(sortedHash, neighbour, 'left')
+            counts = np.searchsorted(sortedHash, neighbour, 'right') - lo
+            i = np.repeat(i0, counts)
+            j = order[np.repeat(lo - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]
+            match = (j < i) & (i >= nExisting) & (q[j] == q[i]) & \
+                (np.sum((sourcePos[j] - sourcePos[i]) ** 2, axis=1) <= tolerance * tolerance)
+            pairs.append((i[match], j[match]))
+    i = np.concatenate([np.empty(0, dtype=np.intp)] + [p[0] for p in pairs])
+    j = np.concatenate([np.empty(0, dtype=np.intp)] + [p[1] for p in pairs])
+    return _resolveChains(i, j, n)[nExisting:]
+
+
+# Rounds of _resolveChains done with whole array operations before the rest is finished one charge at a time.
+RESOLVE_ROUNDS = 8
+
+
+# Duplicate mask of n charges from the pairs (i, j), j < i, of charges within tolerance of each other. Like
+# adding the charges one at a time to a SourceIndex, charge i is a duplicate only when it matches an earlier
+# charge that was kept, so in a chain of charges each within tolerance of the next every other one is kept.
+def _resolveChains(i, j, n):
+    # 1 kept, 0 duplicate, -1 not known yet; charges matching no earlier charge are kept
+    state = np.ones(n, dtype=np.int8)
+    state[i] = -1
+    # Every round settles at least the first unknown charge, whose matches are all known
+    for _ in range(RESOLVE_ROUNDS):
+        unknown = state[i] == -1
+        if not unknown.any():
+            break
+        i, j = i[unknown], j[unknown]
+        anyKept = np.bincount(i, weights=state[j] == 1, minlength=n) > 0
+        anyUnknown = np.bincount(i, weights=state[j] == -1, minlength=n) > 0
+        pending = state == -1
+        state[pending & anyKept] = 0
+        state[pending & ~anyKept & ~anyUnknown] = 1
+    unknown = state[i] == -1
+    if unknown.any():
+        i, j = i[unknown], j[unknown]
+        order = np.argsort(i, kind='stable')
+        i, j = i[order], j[order]
+        starts = np.flatnonzero(np.r_[True, i[1:] != i[:-1]])
+        ends = np.r_[starts[1:], len(i)]
+        for s0, s1 in zip(starts, ends):
+            state[i[s0]] = 0 if (state[j[s0:s1]] == 1).any() else 1
+    return state == 0
@@ -23,64 +23,385 @@ Description: Contains System, DiscreteSystem(System) and ContinuousSystem(System
              System object stores and keeps track of list of charges in a given setting.
              DiscreteSystem is child class of System which is used for system of discrete charges.
              ContinuousSystem is child class of System which is used for system of continuous charges.
+             Continuous charge can either be discretized into Charge objects or described by the
+             analytic source elements of EMPY.Electrostatics.Elements.
+
+             System can evaluate its fields by direct summation or with a particle-mesh FFT solver,
+             see System.setEvaluationMode.
 
              System object requires input a charge to be initialized.
 
-Usage: Requires math, numpy, matplotlib.pyplot libraries, and EMPY.Electrostatics.Charge.
+Usage: Requires numpy, matplotlib.pyplot libraries, EMPY.Electrostatics.Charge,
+       EMPY.Electrostatics.PackedCharges, EMPY.Electrostatics.Kernels, EMPY.Electrostatics.ParticleMesh,
+       EMPY.Electrostatics.Interactions, EMPY.Electrostatics.Elements, EMPY.Electrostatics.Distributions,
+       EMPY.Core.FieldCache, EMPY.Core.LiveField,
+       EMPY.Core.Tiling, EMPY.Core.FieldStore, EMPY.Core.Parallel, EMPY.Core.BasisField,
+       EMPY.Core.FieldSampler, EMPY.Core.FieldLines, EMPY.Core.Render,
+       EMPY.Core.Glyphs and EMPY.Core.Transforms.
 
 This code and Charge library was inspired by Robert Martin's ElectrodynamicsPy Project.
 https://github.com/robertmartin8/ElectrodynamicsPy
 '''
 
-import math
+import weakref
 import numpy as np
-import matplotlib.pyplot as plt
 from EMPY.Electrostatics.Charge import Charge
+from EMPY.Electrostatics.PackedCharges import PackedCharges
+from EMPY.Electrostatics.Kernels import pointKernel, flattenFieldPos, packFieldPotential, \
+    flattenFieldPotential, unflattenFieldPotential
+from EMPY.Electrostatics.ParticleMesh import ParticleMesh, ASSIGNMENTS, meshFor
+from EMPY.Electrostatics.Interactions import pairInteractions
+from EMPY.Electrostatics.Elements import PackedElements, Polyline, Segment, Arc, Panel
+from EMPY.Electrostatics import Distributions
+from EMPY.Core.FieldCache import FieldCache, cachedEvaluate
+from EMPY.Core.LiveField import LiveField
+from EMPY.Core.Tiling import DEFAULT_TILE_BYTES
+from EMPY.Core.FieldStore import writeField
+from EMPY.Core.Parallel import parallelEvaluate
+from EMPY.Core.BasisField import BasisField
+from EMPY.Core.FieldSampler import FieldSampler, polylinePoints
+from EMPY.Core.FieldLines import traceFieldLines, boundsAround
+from EMPY.Core.Render import showFigure
+from EMPY.Core.Glyphs import drawDiscs
+from EMPY.Core.Transforms import applyTransform, signedPower, clip
 
 # A System object to store, keep track, and visualize a list of 2-Dimensional Charge Objects
 class System:
 
     def __init__(self):
         # Initialize an empty list of 2D Charge Objects
-        self.chargeLists = []
+        self._chargeLists = []
+        # Charges and source positions of chargeLists packed into numpy arrays for vectorized superposition
+        self.packedCharges = PackedCharges(2)
+        # Initialize an empty list of analytic source Elements
+        self.elementLists = []
+        self.packedElements = PackedElements(2)
+        # Evaluation mode of E_Total and V_Total, 'direct' summation or particle-mesh 'pm'
+        self.evaluationMode = 'direct'
+        self.meshCells = None
+        self.meshAssignment = 'tsc'
+        self.meshBounds = None
+        self._mesh = None
+        # Version counter of the sources and the cache of fields evaluated for the current version
+        self.version = 0
+        self.fieldCache = FieldCache()
+        # Live field grids patched incrementally whenever a source is added or removed
+        self._liveFields = weakref.WeakSet()
+
+    # Bump the version counter and invalidate the cached fields and the mesh whenever the sources change.
+    # contribution(points, field, potential) is the (E, V) of the single source added (sign=1) or
+    # removed (sign=-1), used to patch the live fields. The approximate backends are not patched source by
+    # source, so outside 'direct' mode, or when the change has no contribution, the live fields are evaluated again.
+    def _sourcesChanged(self, contribution=None, sign=1):
+        self.version += 1
+        self.fieldCache.clear()
+        self._mesh = None
+        for live in list(self._liveFields):
+            if contribution is None or self.evaluationMode != 'direct':
+                live.refresh()
+            else:
+                field, potential = live.values[0] is not None, live.values[1] is not None
+                live.patch(contribution(live.points, field, potential), sign)
+
+    # Charge Objects of all packed charges. Charges added in bulk by add_Charges only get their Charge
+    # Objects when the list is first asked for, so large distributions never create them unless needed.
+    # The list is returned as a tuple; charges are added and removed through add_Charge and remove_Charge.
+    @property
+    def chargeLists(self):
+        return tuple(self._materializeCharges())
+
+    # Create the Charge Objects still missing for bulk added charges and return the backing list.
+    def _materializeCharges(self):
+        q, sourcePos = self.packedCharges.getCharges(), self.packedCharges.getPositions()
+        for i in range(len(self._chargeLists), len(self.packedCharges)):
+            self._chargeLists.append(Charge(q[i], sourcePos[i].tolist()))
+        return self._chargeLists
 
     # Method to add a single Charge object to chargeLists
     def add_Charge(self, charge):
-        self.chargeLists.append(charge)
-
-    # Calculate the total electric field of all Charge Objects present in the System
-    def E_Total(self, fieldPos):
-        Ex_total, Ey_total = 0, 0
-        for C in self.chargeLists:
-            Ex_total += Charge.electricField(C, fieldPos)[0]
-            Ey_total += Charge.electricField(C, fieldPos)[1]
-        return Ex_total, Ey_total
-
-    # Calculate the total electric potential of all Charge Objects present in the System
-    def V_Total(self, fieldPos):
-        V_Total = 0
-        for C in self.chargeLists:
-            V_Total += Charge.electricPot(C, fieldPos)
-        return V_Total
+        self._materializeCharges().append(charge)
+        self.packedCharges.append(charge.q, charge.pos)
+        self._sourcesChanged(self._chargeContribution(len(self.packedCharges) - 1))
+
+    # Method to add n charges at once from an (n,) array of charges q and an (n, 2) array of positions,
+    # written straight into packedCharges without creating a Charge object per charge.
+    def add_Charges(self, q, sourcePos):
+        q = np.broadcast_to(np.asarray(q, dtype=np.float64), len(sourcePos)).copy()
+        sourcePos = np.array(sourcePos, dtype=np.float64).reshape(-1, 2)
+        self.packedCharges.extend(q, sourcePos)
+        self._sourcesChanged(lambda points, field, potential: pointKernel(q, sourcePos, points, field, potential))
+
+    # Method to add a single analytic source Element to elementLists
+    def add_Element(self, element):
+        self.packedElements.append(element)
+        self.elementLists.append(element)
+        self._sourcesChanged(self._elementContribution(element))
+
+    # Contribution of the packed charge at index, evaluated by direct summation.
+    def _chargeContribution(self, index):
+        q = self.packedCharges.getCharges()[index:index + 1].copy()
+        sourcePos = self.packedCharges.getPositions()[index:index + 1].copy()
+        return lambda points, field, potential: pointKernel(q, sourcePos, points, field, potential)
+
+    # Contribution of a single Element.
+    def _elementContribution(self, element):
+        packed = PackedElements(2)
+        packed.append(element)
+        return packed.evaluate
+
+    # Method to remove a single Charge object from chargeLists
+    def remove_Charge(self, charge):
+        index = self._materializeCharges().index(charge)
+        contribution = self._chargeContribution(index)
+        self._chargeLists.pop(index)
+        self.packedCharges.remove(index)
+        self._sourcesChanged(contribution, sign=-1)
+
+    # Method to remove a single analytic source Element from elementLists
+    def remove_Element(self, element):
+        index = self.elementLists.index(element)
+        self.elementLists.pop(index)
+        self.packedElements.remove(index)
+        self._sourcesChanged(self._elementContribution(element), sign=-1)
+
+    # Evaluate the field and/or potential on fieldPos once and keep it up to date as sources are added
+    # and removed, each change costing a single source evaluation in 'direct' mode and a full evaluation with
+    # the active backend otherwise, so the LiveField always agrees with E_Total. Returns a LiveField whose get method
+    # returns (Ex, Ey) or (Ex, Ey, V) like E_Total and EV_Total.
+    def liveField(self, fieldPos, field=True, potential=True):
+        points, shape = flattenFieldPos(fieldPos, 2)
+        live = LiveField(points, self.evaluate(points, field, potential),
+                         lambda values: packFieldPotential(values[0], values[1], shape),
+                         lambda points: self._evaluate(points, field, potential))
+        self._liveFields.add(live)
+        return live
+
+    # Select how E_Total and V_Total are evaluated. mode='direct' sums every charge at every field point,
+    # mode='pm' solves on a particle mesh with meshCells cells along its longest side and 'cic' or 'tsc'
+    # assignment, covering the charges and meshBounds = (lo, hi) if given, see EMPY.Electrostatics.ParticleMesh.
+    # Without meshBounds the mesh grows to cover the field points evaluated, so plots and grids around the charges
+    # are interpolated from it; with meshBounds, points outside it are summed directly, with a warning when they
+    # are most of them. The mesh field is smoothed over a few cells: among the charges, e.g. between those of a
+    # dense plate, the rms error of E is tens of percent, so check it with meshError before relying on it.
+    # Elements are always evaluated with their closed form expressions.
+    def setEvaluationMode(self, mode, meshCells=None, meshAssignment='tsc', meshBounds=None):
+        if mode not in ('direct', 'pm'):
+            raise ValueError("Unknown evaluation mode " + str(mode) + "; expected 'direct' or 'pm'")
+        if meshAssignment not in ASSIGNMENTS:
+            raise ValueError("Unknown mesh assignment " + str(meshAssignment) + "; expected 'cic' or 'tsc'")
+        self.evaluationMode = mode
+        self.meshCells = meshCells
+        self.meshAssignment = meshAssignment
+        self.meshBounds = meshBounds
+        self._sourcesChanged()
+
+    # Getter Method for the particle mesh of the charges, built on first use
+    def getMesh(self):
+        if self._mesh is None:
+            self._mesh = ParticleMesh(self.packedCharges.getCharges(), self.packedCharges.getPositions(),
+                                      self.meshCells, self.meshAssignment, self.meshBounds)
+        return self._mesh
+
+    # Make the particle mesh cover the (2, m) field points, see EMPY.Electrostatics.ParticleMesh.meshFor.
+    def _coverMesh(self, points):
+        self._mesh = meshFor(self._mesh, points, self.packedCharges.getCharges(), self.packedCharges.getPositions(),
+                             self.meshCells, self.meshAssignment, self.meshBounds)
+        return self._mesh
+
+    # Compare the particle mesh against direct summation on a random sample of nSample points of fieldPos.
+    # Returns the maximum and root mean square relative errors of the field E and the potential V.
+    def meshError(self, fieldPos, nSample=256, seed=0):
+        points, shape = flattenFieldPos(fieldPos, 2)
+        return self._coverMesh(points).accuracy(points, nSample, seed)
+
+    # Interactions of the charges of the System with each other and with its Elements, as a tuple of the total
+    # energy, the (n, 2) forces on the charges (None unless forces) and the potential at every charge from all
+    # other sources, see EMPY.Electrostatics.Interactions. The energy leaves out the self energy of the Elements.
+    # Results are kept in fieldCache until the sources change; workers > 1 evaluates blocks of pairs in threads.
+    def interactions(self, forces=True, workers=None):
+        key = (self.version, 'interactions', forces)
+        result = self.fieldCache.get(key)
+        if result is None:
+            q, sourcePos = self.packedCharges.getCharges(), self.packedCharges.getPositions()
+            energy, F, phi = pairInteractions(q, sourcePos, forces, workers)
+            if len(self.packedElements) and len(q):
+                Ee, Ve = self.packedElements.evaluate(sourcePos.T, forces, True)
+                energy += q.dot(Ve)
+                phi += Ve
+                if forces:
+                    F += q[:, np.newaxis] * Ee.T
+            result = (energy, F, phi)
+            self.fieldCache.put(key, result)
+        return result
+
+    # Evaluate the total electric field and/or potential of the System on a (2, m) array of field points.
+    # Results are kept in fieldCache, so evaluating the same points again is free until the sources change.
+    # workers > 1 splits the points into tiles evaluated in parallel, see EMPY.Core.Parallel; None uses the default.
+    def evaluate(self, points, field=True, potential=True, workers=None):
+        return cachedEvaluate(self.fieldCache, self.version,
+                              lambda points, field, potential: self._evaluate(points, field, potential, workers),
+                              points, field, potential)
+
+    def _evaluate(self, points, field, potential, workers=None):
+        if self.evaluationMode == 'pm':
+            self._coverMesh(points)
+        return parallelEvaluate(lambda points: self._evaluateTile(points, field, potential), points, workers)
+
+    def _evaluateTile(self, points, field, potential):
+        if self.evaluationMode == 'pm':
+            E, V = self.getMesh().evaluate(points, field, potential)
+        else:
+            E, V = pointKernel(self.packedCharges.getCharges(), self.packedCharges.getPositions(),
+                               points, field, potential)
+        if len(self.packedElements):
+            Ee, Ve = self.packedElements.evaluate(points, field, potential)
+            if field:
+                E += Ee
+            if potential:
+                V += Ve
+        return E, V
+
+    # Evaluate the field and/or potential of every group of sources once on fieldPos, so that the result for
+    # any charges costs a matrix product: the returned BasisField evaluates weights with evaluate(weights) and
+    # yields the result of a sequence of weights with frames, as tuples like EV_Total, see EMPY.Core.BasisField.
+    # groups is a list of index arrays of packed charges sharing one weight, which scales their present charges;
+    # by default every charge is its own group and its weight is its charge. Every Element follows as its own group.
+    def basisField(self, fieldPos, groups=None, field=True, potential=True, workers=None):
+        points, shape = flattenFieldPos(fieldPos, 2)
+        q, sourcePos = self.packedCharges.getCharges(), self.packedCharges.getPositions()
+        if groups is None:
+            sources = [(np.ones(1), sourcePos[i:i + 1]) for i in range(len(q))]
+            weights = list(q)
+        else:
+            groups = [np.asarray(g, dtype=np.intp) for g in groups]
+            sources = [(q[g], sourcePos[g]) for g in groups]
+            weights = [1.] * len(groups)
+        contributions = [lambda points, s=s: pointKernel(*s, points, field, potential) for s in sources]
+        contributions += [lambda points, e=e: self._elementContribution(e)(points, field, potential)
+                          for e in self.elementLists]
+        weights += [1.] * len(self.elementLists)
+        basis = np.empty((len(contributions), (2 * field + potential) * points.shape[1]))
+        for g, contribution in enumerate(contributions):
+            basis[g] = flattenFieldPotential(*parallelEvaluate(contribution, points, workers))
+        return BasisField(basis, weights, lambda values: unflattenFieldPotential(values, 2, field, potential, shape))
+
+    # Interpolating sampler of the total electric field and/or potential tabulated on a Grid, for fast queries
+    # at many scattered points: its sample method returns the rows Ex, Ey and/or V at a (2, m) array of points,
+    # see EMPY.Core.FieldSampler. Points within exclusionRadius of a charge or an Element are evaluated exactly.
+    def sampler(self, grid, order=3, tolerance=None, maxLevel=2, exclusionRadius=0., field=True, potential=False,
+                workers=None):
+        if grid.dim != 2:
+            raise ValueError("sampler requires a grid of dimension 2")
+        sources = [self.packedCharges.getPositions()]
+        if exclusionRadius > 0:
+            sources += [polylinePoints(outline, exclusionRadius / 2.)
+                        for element in self.elementLists for outline in element.getOutline()]
+        return FieldSampler(lambda points: np.vstack([v for v in self._evaluate(points, field, potential, workers)
+                                                      if v is not None]),
+                            grid, order, tolerance, maxLevel, np.vstack(sources), exclusionRadius)
+
+    # Trace the electric field lines through the (2, n) seeds with EMPY.Core.FieldLines.traceFieldLines, on the
+    # exact field or, when given, on the field interpolated by a FieldSampler with field=True. Lines stop at
+    # bounds = [(min, max), ...], by default the box of the sampler or around the charges, and within
+    # stopRadius of a charge or an Element, by default 1% of the largest side of bounds. Returns a FieldLines.
+    def fieldLines(self, seeds, bounds=None, direction='both', step=None, tolerance=None, maxSteps=2000,
+                   stopRadius=None, sampler=None, workers=None):
+        sourcePos = self.packedCharges.getPositions()
+        if bounds is None:
+            if sampler is not None:
+                bounds = sampler.grid.bounds
+            else:
+                bounds = boundsAround(np.vstack([sourcePos] + [outline for element in self.elementLists
+                                                               for outline in element.getOutline()]))
+        if stopRadius is None:
+            stopRadius = 0.01 * max(hi - lo for lo, hi in bounds)
+        sources = [sourcePos] + [polylinePoints(outline, stopRadius / 2.)
+                                 for element in self.elementLists for outline in element.getOutline()]
+        if sampler is not None:
+            evaluate = lambda points: sampler.sample(points)[:2]
+        else:
+            evaluate = lambda points: self._evaluate(points, True, False, workers)[0]
+        return traceFieldLines(evaluate, seeds, bounds, direction, step, tolerance, maxSteps, np.vstack(sources),
+                               stopRadius)
+
+    # Stream the total electric field and/or potential over a Grid of field points tile by tile, so that
+    # the memory in use stays below memoryBudget bytes however large the grid is. Yields (tile, E, V) with
+    # tile the tuple of slices of the tile in the grid, E of shape (2,) + tile shape and V of the tile shape.
+    def iterField(self, grid, memoryBudget=DEFAULT_TILE_BYTES, field=True, potential=True, workers=None):
+        if grid.dim != 2:
+            raise ValueError("iterField requires a grid of dimension 2")
+        # Field points, their meshgrid, E and V take (3 * 2 + 1) float64 per point; the kernels
+        # work on cache-sized blocks of the tile and need no memory in proportion to it.
+        for tile in grid.tiles(grid.tileShape(memoryBudget, 8 * (3 * 2 + 1))):
+            shape = grid.sliceShape(tile)
+            E, V = self._evaluate(grid.tilePoints(tile), field, potential, workers)
+            yield tile, (None if E is None else E.reshape((2,) + shape)), (None if V is None else V.reshape(shape))
+
+    # Evaluate the total electric field and/or potential over a Grid tile by tile, writing the components
+    # 'Ex', 'Ey' and 'V' straight into memory-mapped .npy files in directory together with the grid metadata.
+    # Returns the StoredField of directory, which can also be re-opened later with EMPY.Core.FieldStore.openField.
+    def evaluateToDisk(self, directory, grid, memoryBudget=DEFAULT_TILE_BYTES, field=True, potential=True,
+                       workers=None):
+        names = (('Ex', 'Ey') if field else ()) + (('V',) if potential else ())
+
+        def tiles():
+            for tile, E, V in self.iterField(grid, memoryBudget, field, potential, workers):
+                values = {'V': V}
+                if field:
+                    values.update(zip(('Ex', 'Ey'), E))
+                yield tile, values
+
+        return writeField(directory, grid, names, tiles(),
+                          {'system': type(self).__name__, 'version': self.version})
+
+    # Calculate the total electric field of all Charge Objects and Elements present in the System
+    def E_Total(self, fieldPos, workers=None):
+        points, shape = flattenFieldPos(fieldPos, 2)
+        E, V = self.evaluate(points, potential=False, workers=workers)
+        return E[0].reshape(shape), E[1].reshape(shape)
+
+    # Calculate the total electric potential of all Charge Objects and Elements present in the System
+    def V_Total(self, fieldPos, workers=None):
+        points, shape = flattenFieldPos(fieldPos, 2)
+        E, V = self.evaluate(points, field=False, workers=workers)
+        return V.reshape(shape)
+
+    # Calculate the total electric field and potential in a single pass over the charges.
+    # Returns (Ex, Ey, V) or, with magnitude=True, (Ex, Ey, V, |E|).
+    def EV_Total(self, fieldPos, magnitude=False, workers=None):
+        points, shape = flattenFieldPos(fieldPos, 2)
+        E, V = self.evaluate(points, workers=workers)
+        return packFieldPotential(E, V, shape, magnitude)
 
     # Getter Method for accessing the list of Charge Objects
     def getCharges(self):
         return self.chargeLists
 
-    # Plot the 3D Projection of the total Electric Potential of the combined charge objects in chargeLists.
-    def plotPotential3D(self, xs, ys, w):
+    # Getter Method for accessing the list of Elements
+    def getElements(self):
+        return self.elementLists
+
+    # Draw the outline of every Element on the axis ax, the Panels filled in one PolyCollection and the
+    # other Elements in one LineCollection.
+    def drawElements(self, ax):
+        from matplotlib.collections import LineCollection, PolyCollection
+        panels = [o for e in self.elementLists if isinstance(e, Panel) for o in e.getOutline()]
+        lines = [o for e in self.elementLists if not isinstance(e, Panel) for o in e.getOutline()]
+        if panels:
+            ax.add_collection(PolyCollection(panels, facecolors='k', edgecolors='k', alpha=0.5, zorder=20))
+        if lines:
+            ax.add_collection(LineCollection(lines, colors='k', linewidths=3, zorder=20))
+
+    # Plot the 3D Projection of the total Electric Potential of the combined charge objects in chargeLists
+    # on a resolution x resolution grid, compressed by transform, by default the signed 9th root.
+    def plotPotential3D(self, xs, ys, w, resolution = 500, transform = signedPower(1. / 9)):
+        import matplotlib.pyplot as plt
         width = w
         height = (ys[1] - ys[0]/(xs[1]-xs[0])*width)
 
-        x, y = np.meshgrid(np.linspace(xs[0], xs[1], 500),
-                           np.linspace(ys[0], ys[1], 500))
-        total_VField = self.V_Total([x,y])
-        for i in range(len(total_VField)):
-            for j in range(len(total_VField[i])):
-                if total_VField[i][j] < 0:
-                    total_VField[i][j] = -math.pow(-total_VField[i][j], float(1) / 9)
-                else:
-                    total_VField[i][j] = total_VField[i][j] ** (1 / 9)
+        x, y = np.meshgrid(np.linspace(xs[0], xs[1], resolution),
+                           np.linspace(ys[0], ys[1], resolution))
+        total_VField = applyTransform(self.V_Total([x,y]), transform)
         fig = plt.figure(figsize=(width+2, height+2))
         ax = plt.axes(projection="3d")
         ax = plt.axes(projection="3d")
@@ -94,7 +415,7 @@ class System:
         surf = ax.plot_surface(x, y, total_VField, cmap="Spectral", antialiased=True)
 
         plt.colorbar(surf, shrink=0.8)
-        plt.show()
+        showFigure('plotPotential3D', {'x': x, 'y': y, 'V': total_VField})
 
 
 # A DiscreteSystem object to store, keep track, and visualize a list of 2-Dimensional Charge Objects
@@ -103,30 +424,31 @@ class DiscreteSystem(System):
     def __init__(self):
         System.__init__(self);
 
-    # Plot the Total Electric Field Generated by all the Charge Objects in chargeLists
-    def plot_VectField(self, xs, ys, showEField = True, showEPot = False):
+    # Plot the Total Electric Field Generated by all the Charge Objects in chargeLists on a resolution x resolution
+    # grid. transform is applied to the potential before its contours are drawn, see EMPY.Core.Transforms.
+    def plot_VectField(self, xs, ys, showEField = True, showEPot = False, resolution = 100, transform = clip(upper = 10000)):
+        import matplotlib.pyplot as plt
         plt.figure()
 
-        x, y = np.meshgrid(np.linspace(xs[0], xs[1], 100),
-                           np.linspace(ys[0], ys[1], 100))
+        x, y = np.meshgrid(np.linspace(xs[0], xs[1], resolution),
+                           np.linspace(ys[0], ys[1], resolution))
+
+        Ex, Ey, V, Emag = self.EV_Total([x,y], magnitude=True)
 
         if showEField:
-            Ex, Ey = self.E_Total([x,y])
-            P = (Ex ** 2 + Ey ** 2)
-            plt.streamplot(x, y, Ex, Ey, color=np.log(P), density=0.9 ,linewidth=2, cmap=plt.cm.get_cmap("Spectral"), arrowsize=2.)
+            P = Emag ** 2
+            plt.streamplot(x, y, Ex, Ey, color=np.log(P), density=0.9 ,linewidth=2, cmap="Spectral", arrowsize=2.)
             ax = plt.gca()  # get current axis
-            for c in self.getCharges():
-                ax.add_patch(plt.Circle((Charge.get_Pos(c)[0], Charge.get_Pos(c)[1]), radius=0.1, color='k', zorder=20))
+            drawDiscs(ax, self.packedCharges.getPositions(), 0.1)
             ax.set_aspect('equal')
             plt.colorbar()
             plt.draw()
 
         if showEPot:
-            V = self.V_Total([x,y])
-            V[V > 10000] = 10000
+            V = applyTransform(V, transform)
             plt.contour(x, y, V, 500)
 
-        plt.show()
+        showFigure('plot_VectField', {'x': x, 'y': y, 'Ex': Ex, 'Ey': Ey, 'V': V})
 
 
 # A ContinuousSystem object to store, keep track, and visualize a
@@ -137,62 +459,102 @@ class ContinuousSystem(System):
         System.__init__(self)
 
     # Create a Continuous Line Charge Distribution
-    def line_charge(self, pX, pY, l, density, Q):
-        for qdl in range(int(l*density)):
-            qPosition = [pX(qdl/density), pY(qdl/density)]
-            charge = Charge(Q/density, qPosition)
-            self.add_Charge(charge)
+    # pX and pY may take an array of parameters, otherwise they are called once per sample.
+    # With analytic=True the curve is a single Polyline Element through the samples instead of point charges.
+    def line_charge(self, pX, pY, l, density, Q, analytic=False):
+        if analytic:
+            t = np.linspace(0, l, max(1, int(l*density)) + 1)
+            vertices = np.array([Distributions.sampleParametric(pX, t), Distributions.sampleParametric(pY, t)]).T
+            self.add_Element(Polyline(Q*l, vertices, weights=np.diff(t)))
+            return
+        t = np.arange(int(l*density)) / density
+        self.add_Charges(Q/density, np.array([Distributions.sampleParametric(pX, t),
+                                              Distributions.sampleParametric(pY, t)]).T)
 
     # Create a Continuous Surface Charge Distribution
-    def plate(self, dim, vertex, density, Q):
+    # With analytic=True the plate is a single Panel Element instead of point charges.
+    def plate(self, dim, vertex, density, Q, analytic=False):
+        if analytic:
+            self.add_Element(Panel(Q, dim, vertex))
+            return
         sigma = Q / (dim[0]*dim[1]*density**2)
-        for i in range(int(dim[0]*density)):
-            for j in range(int(dim[1]*density)):
-                qPosition = [i/density + vertex[0], j/density + vertex[1]]
-                charge = Charge(sigma, qPosition)
-                self.add_Charge(charge)
+        x, y = np.meshgrid(np.arange(int(dim[0]*density)) / density + vertex[0],
+                           np.arange(int(dim[1]*density)) / density + vertex[1], indexing='ij')
+        self.add_Charges(sigma, np.array([x.ravel(), y.ravel()]).T)
 
     # Create a Continuous Charge Distribution in the form of a Straight Wire
-    def straightWire(self,start, end, res, Q):
+    # With analytic=True the wire is a single Segment Element, carrying the same total charge as the discretized wire.
+    def straightWire(self,start, end, res, Q, analytic=False):
         length = ((end[1] - start[1]) ** 2 + (end[0] - start[0]) ** 2) ** 0.5
+        if analytic:
+            self.add_Element(Segment(Q / length * int((end[0] - start[0]) * res), start, end))
+            return
         gradient = (end[1] - start[1]) / (end[0] - start[0])
         intercept = start[1] - gradient * start[0]
 
         lambd = Q / length
-        for i in range(int((end[0] - start[0]) * res)):
-            charge = Charge(lambd, [i / res + start[0], gradient * (i / res) + intercept])
-            self.add_Charge(charge)
+        x = np.arange(int((end[0] - start[0]) * res)) / res
+        self.add_Charges(lambd, np.array([x + start[0], gradient * x + intercept]).T)
 
     # Create a Continuous Charge Distribution in the form of a Circular Loop
-    def circularWire(self, center, R, density, Q):
+    # With analytic=True the loop is a single Arc Element, carrying the same total charge as the discretized loop.
+    def circularWire(self, center, R, density, Q, analytic=False):
+        if analytic:
+            self.add_Element(Arc(2*np.pi*Q, center, R))
+            return
         def x(t):
             return center[0] - R*np.cos(t)
         def y(t):
             return center[1] - R*np.sin(t)
         self.line_charge(pX=x, pY=y, l = 2*np.pi, density=density, Q=Q)
 
-    # Plot the Total Electric Field Generated by the Continuous Charge Distribution in the System.
-    def plot_VectField(self, xs, ys, showEField = True, showEPot = False):
+    # The builders below spread a total charge Q over n samples of a shape, see EMPY.Electrostatics.Distributions.
+
+    # Curve (pX(t), pY(t)) for t from t0 to t1, with n charges weighted by the length of curve they stand for.
+    def parametricCurve(self, pX, pY, t0, t1, n, Q):
+        weights, sourcePos = Distributions.parametricCurve([pX, pY], t0, t1, n)
+        self.add_Charges(Q * weights, sourcePos)
+
+    # Polyline through vertices with charges about spacing apart.
+    def polyline(self, vertices, spacing, Q):
+        weights, sourcePos = Distributions.polyline(vertices, spacing)
+        self.add_Charges(Q * weights, sourcePos)
+
+    # Ring of n charges of radius R about center.
+    def ring(self, center, R, n, Q):
+        weights, sourcePos = Distributions.ring(center, R, n)
+        self.add_Charges(Q * weights, sourcePos)
+
+    # Uniformly charged disk of radius R about center with charges about spacing apart.
+    def disk(self, center, R, spacing, Q):
+        weights, sourcePos = Distributions.disk(center, R, spacing)
+        self.add_Charges(Q * weights, sourcePos)
+
+    # Plot the Total Electric Field Generated by the Continuous Charge Distribution in the System on a
+    # resolution x resolution grid, with transform applied to the potential as in DiscreteSystem.plot_VectField.
+    def plot_VectField(self, xs, ys, showEField = True, showEPot = False, resolution = 100, transform = clip(upper = 10000)):
+        import matplotlib.pyplot as plt
         plt.figure()
 
-        x, y = np.meshgrid(np.linspace(xs[0], xs[1], 100),
-                           np.linspace(ys[0], ys[1], 100))
+        x, y = np.meshgrid(np.linspace(xs[0], xs[1], resolution),
+                           np.linspace(ys[0], ys[1], resolution))
+
+        Ex, Ey, V, Emag = self.EV_Total([x,y], magnitude=True)
 
         if showEField:
-            Ex, Ey = self.E_Total([x,y])
-            P = (Ex ** 2 + Ey ** 2)
-            plt.streamplot(x, y, Ex, Ey, color=np.log(P), density=0.9 ,linewidth=2, cmap=plt.cm.get_cmap("Spectral"), arrowsize=2.)
+            P = Emag ** 2
+            plt.streamplot(x, y, Ex, Ey, color=np.log(P), density=0.9 ,linewidth=2, cmap="Spectral", arrowsize=2.)
             ax = plt.gca()  # get current axis
-            for c in self.getCharges():
-                ax.add_patch(plt.Circle((Charge.get_Pos(c)[0], Charge.get_Pos(c)[1]), radius=1/len(self.getCharges()), color='k', zorder=20))
+            if len(self.packedCharges):
+                drawDiscs(ax, self.packedCharges.getPositions(), 1 / len(self.packedCharges))
+            self.drawElements(ax)
             ax.set_aspect('equal')
             plt.colorbar()
             plt.draw()
 
         if showEPot:
-            V = self.V_Total([x,y])
-            V[V > 10000] = 10000
+            V = applyTransform(V, transform)
             plt.contourf(x, y, V, cmap="coolwarm", alpha=0.6)
 
-        plt.show()
+        showFigure('plot_VectField', {'x': x, 'y': y, 'Ex': Ex, 'Ey': Ey, 'V': V})
 
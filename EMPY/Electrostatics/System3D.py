@@ -25,117 +25,564 @@ Description: Contains System3D, DiscreteSystem3D(System) and ContinuousSystem3D(
 
              System3D object requires input a charge to be initialized.
 
-Usage: Requires math, numpy, mayavi libraries, and EMPY.Electrostatics.Charge3D.
+             System3D can evaluate its fields by direct summation, with a Barnes-Hut tree code or
+             with a particle-mesh FFT solver, see System3D.setEvaluationMode. Continuous charge can also be described by
+             the analytic source elements of EMPY.Electrostatics.Elements3D, see System3D.add_Element.
+
+Usage: Requires math, numpy, mayavi libraries, EMPY.Electrostatics.Charge3D,
+       EMPY.Electrostatics.PackedCharges, EMPY.Electrostatics.Kernels, EMPY.Electrostatics.Octree,
+       EMPY.Electrostatics.ParticleMesh, EMPY.Electrostatics.Elements, EMPY.Electrostatics.Distributions,
+       EMPY.Electrostatics.SourceIndex, EMPY.Electrostatics.Interactions, EMPY.Core.FieldCache, EMPY.Core.LiveField,
+       EMPY.Core.Tiling, EMPY.Core.FieldStore, EMPY.Core.Parallel, EMPY.Core.BasisField,
+       EMPY.Core.FieldSampler, EMPY.Core.FieldLines, EMPY.Core.Render,
+       EMPY.Core.Glyphs and EMPY.Core.Transforms.
 
 The use of Mayavi Library for 3 Dimensional Scientific Plotting was inspired from danielsjensen1's electrodynamics project.
 https://github.com/danielsjensen1/electrodynamics
 '''
 
-from mayavi import mlab
+import weakref
 import numpy as np
 from EMPY.Electrostatics.Charge3D import Charge3D
+from EMPY.Electrostatics.PackedCharges import PackedCharges
+from EMPY.Electrostatics.Kernels import pointKernel, flattenFieldPos, packFieldPotential, \
+    flattenFieldPotential, unflattenFieldPotential
+from EMPY.Electrostatics.Octree import Octree
+from EMPY.Electrostatics.ParticleMesh import ParticleMesh, ASSIGNMENTS, meshFor
+from EMPY.Electrostatics.Elements import PackedElements
+from EMPY.Electrostatics import Distributions
+from EMPY.Electrostatics.SourceIndex import SourceIndex, duplicateMask
+from EMPY.Electrostatics.Interactions import pairInteractions
+from EMPY.Core.FieldCache import FieldCache, cachedEvaluate
+from EMPY.Core.LiveField import LiveField
+from EMPY.Core.Tiling import DEFAULT_TILE_BYTES
+from EMPY.Core.FieldStore import writeField
+from EMPY.Core.Parallel import parallelEvaluate
+from EMPY.Core.BasisField import BasisField
+from EMPY.Core.FieldSampler import FieldSampler, polylinePoints
+from EMPY.Core.FieldLines import traceFieldLines, boundsAround
+from EMPY.Core.Render import showScene
+from EMPY.Core.Glyphs import drawPoints3D, drawPolylines3D, packPolylines
+from EMPY.Core.Transforms import transformMagnitude
 
 
-def addUniqueSource(source, sourceList):
+# With a SourceIndex, sources are duplicates when they have the same charge and position (within the
+# tolerance of the index) and the check costs O(1); without one, sourceList is searched for source itself.
+def addUniqueSource(source, sourceList, index=None):
     import warnings
-    if source not in sourceList:
+    if index is None:
+        unique = source not in sourceList
+    else:
+        unique = not index.contains(source.q, source.pos)
+    if unique:
         sourceList += [source]
+        if index is not None:
+            index.add(source.q, source.pos)
     else:
         warnings.warn("Source " + str(source) +
                       " already in Collection list; Ignoring", Warning)
 
 
-def addListToCollection(sourceList, inputList, dupWarning):
+def addListToCollection(sourceList, inputList, dupWarning, index=None):
     if dupWarning is True:  # Skip iterating both lists if warnings are off
         for source in inputList:
             # Checks if source is in list, throw warning
-            addUniqueSource(source, sourceList)
+            addUniqueSource(source, sourceList, index)
     else:
         sourceList.extend(inputList)
 
 
+# Draw every line of a FieldLines as a single mayavi line source, coloured by the index of its line.
+def drawFieldLines(lines):
+    line = np.repeat(np.arange(len(lines)), np.diff(lines.offsets))
+    drawPolylines3D(lines.vertices, lines.offsets, line, colormap='Spectral')
+
+
 # A System3D object to store, keep track, and visualize a list of 3-Dimensional Charge3D Objects
 class System3D:
 
-    def __init__(self, sources, dupWarning=True):
+    # With dupWarning=True, sources with the same charge as an earlier one at the same position, or at a
+    # position within dupTolerance of it, are ignored with a warning.
+    def __init__(self, sources, dupWarning=True, dupTolerance=0.):
         # Initialize an empty list of Charge3D Objects
-        self.charge3DLists = []
+        self._charge3DLists = []
+        self.dupWarning = dupWarning
+        self.dupTolerance = dupTolerance
+        index = SourceIndex(dupTolerance)
 
         for s in sources:
             if type(s) == System3D:
-                addListToCollection(self.charge3DLists, s.charge3DLists, dupWarning)
+                addListToCollection(self._charge3DLists, s.charge3DLists, dupWarning, index)
             elif isinstance(s, list) or isinstance(s, tuple):
-                addListToCollection(self.charge3DLists, s, dupWarning)
+                addListToCollection(self._charge3DLists, s, dupWarning, index)
             else:
                 if dupWarning is True:
-                    addUniqueSource(s, self.charge3DLists)
+                    addUniqueSource(s, self._charge3DLists, index)
                 else:
-                    self.charge3DLists += [s]
+                    self._charge3DLists += [s]
+
+        # Charges and source positions of charge3DLists packed into numpy arrays for vectorized superposition
+        self.packedCharges = PackedCharges(3, capacity=max(16, len(self._charge3DLists)))
+        self.packedCharges.extend([C.q for C in self._charge3DLists],
+                                  [C.pos for C in self._charge3DLists])
+        # Initialize an empty list of analytic source Elements
+        self.elementLists = []
+        self.packedElements = PackedElements(3)
+        # Evaluation mode of E_Total and V_Total, 'direct' summation, Barnes-Hut 'tree' code or particle-mesh 'pm'
+        self.evaluationMode = 'direct'
+        self.theta = 0.5
+        self.leafSize = 32
+        self._tree = None
+        self.meshCells = None
+        self.meshAssignment = 'tsc'
+        self.meshBounds = None
+        self._mesh = None
+        # Version counter of the sources and the cache of fields evaluated for the current version
+        self.version = 0
+        self.fieldCache = FieldCache()
+        # Live field grids patched incrementally whenever a source is added or removed
+        self._liveFields = weakref.WeakSet()
+
+    # Bump the version counter and invalidate the cached fields, the tree and the mesh whenever the sources change.
+    # contribution(points, field, potential) is the (E, V) of the single source added (sign=1) or
+    # removed (sign=-1), used to patch the live fields. The approximate backends are not patched source by
+    # source, so outside 'direct' mode, or when the change has no contribution, the live fields are evaluated again.
+    def _sourcesChanged(self, contribution=None, sign=1):
+        self.version += 1
+        self.fieldCache.clear()
+        self._tree = None
+        self._mesh = None
+        for live in list(self._liveFields):
+            if contribution is None or self.evaluationMode != 'direct':
+                live.refresh()
+            else:
+                field, potential = live.values[0] is not None, live.values[1] is not None
+                live.patch(contribution(live.points, field, potential), sign)
+
+    # Charge3D Objects of all packed charges. Charges added in bulk by add_Charges3D only get their Charge3D
+    # Objects when the list is first asked for, so large distributions never create them unless needed.
+    # The list is returned as a tuple; charges are added and removed through add_Charge3D and remove_Charge3D.
+    @property
+    def charge3DLists(self):
+        return tuple(self._materializeCharges())
+
+    # Create the Charge3D Objects still missing for bulk added charges and return the backing list.
+    def _materializeCharges(self):
+        q, sourcePos = self.packedCharges.getCharges(), self.packedCharges.getPositions()
+        for i in range(len(self._charge3DLists), len(self.packedCharges)):
+            self._charge3DLists.append(Charge3D(q[i], sourcePos[i].tolist()))
+        return self._charge3DLists
 
     def get_Charge3DList(self):
         return self.charge3DLists
 
     # Method to add a single Charge3D object to charge3DLists
     def add_Charge3D(self, charge3D):
-        self.charge3DLists.append(charge3D)
+        self._materializeCharges().append(charge3D)
+        self.packedCharges.append(charge3D.q, charge3D.pos)
+        self._sourcesChanged(self._chargeContribution(len(self.packedCharges) - 1))
+
+    # Method to add n charges at once from an (n,) array of charges q and an (n, 3) array of positions,
+    # written straight into packedCharges without creating a Charge3D object per charge.
+    # With dupWarning, charges duplicating an earlier one are ignored with a single warning.
+    def add_Charges3D(self, q, sourcePos):
+        q = np.broadcast_to(np.asarray(q, dtype=np.float64), len(sourcePos)).copy()
+        sourcePos = np.array(sourcePos, dtype=np.float64).reshape(-1, 3)
+        if self.dupWarning is True:
+            duplicate = duplicateMask(q, sourcePos, self.dupTolerance,
+                                      self.packedCharges.getCharges(), self.packedCharges.getPositions())
+            if duplicate.any():
+                import warnings
+                warnings.warn(str(int(duplicate.sum())) + " sources already in Collection list; Ignoring", Warning)
+                q, sourcePos = q[~duplicate], sourcePos[~duplicate]
+        self.packedCharges.extend(q, sourcePos)
+        self._sourcesChanged(lambda points, field, potential: pointKernel(q, sourcePos, points, field, potential))
+
+    # Build a system straight from an (n,) array of charges q and an (n, 3) array of positions,
+    # in time linear in n up to a sort, without creating a Charge3D object per charge.
+    @classmethod
+    def fromArrays(cls, q, sourcePos, dupWarning=True, dupTolerance=0.):
+        system = cls([], dupWarning, dupTolerance)
+        system.add_Charges3D(q, sourcePos)
+        return system
+
+    # Method to add a single analytic source Element, such as a Segment3D, Arc3D or Panel3D
+    def add_Element(self, element):
+        self.packedElements.append(element)
+        self.elementLists.append(element)
+        self._sourcesChanged(self._elementContribution(element))
+
+    # Contribution of the packed charge at index, evaluated by direct summation.
+    def _chargeContribution(self, index):
+        q = self.packedCharges.getCharges()[index:index + 1].copy()
+        sourcePos = self.packedCharges.getPositions()[index:index + 1].copy()
+        return lambda points, field, potential: pointKernel(q, sourcePos, points, field, potential)
+
+    # Contribution of a single Element.
+    def _elementContribution(self, element):
+        packed = PackedElements(3)
+        packed.append(element)
+        return packed.evaluate
+
+    # Method to remove a single Charge3D object from charge3DLists
+    def remove_Charge3D(self, charge3D):
+        index = self._materializeCharges().index(charge3D)
+        contribution = self._chargeContribution(index)
+        self._charge3DLists.pop(index)
+        self.packedCharges.remove(index)
+        self._sourcesChanged(contribution, sign=-1)
+
+    # Method to remove a single analytic source Element from elementLists
+    def remove_Element(self, element):
+        index = self.elementLists.index(element)
+        self.elementLists.pop(index)
+        self.packedElements.remove(index)
+        self._sourcesChanged(self._elementContribution(element), sign=-1)
+
+    # Evaluate the field and/or potential on fieldPos once and keep it up to date as sources are added
+    # and removed, each change costing a single source evaluation in 'direct' mode and a full evaluation with
+    # the active backend otherwise, so the LiveField always agrees with E_Total. Returns a LiveField whose get method
+    # returns (Ex, Ey, Ez) or (Ex, Ey, Ez, V) like E_Total and EV_Total.
+    def liveField(self, fieldPos, field=True, potential=True):
+        points, shape = flattenFieldPos(fieldPos, 3)
+        live = LiveField(points, self.evaluate(points, field, potential),
+                         lambda values: packFieldPotential(values[0], values[1], shape),
+                         lambda points: self._evaluate(points, field, potential))
+        self._liveFields.add(live)
+        return live
+
+    # Getter Method for accessing the list of Elements
+    def getElements(self):
+        return self.elementLists
+
+    # Select how E_Total and V_Total are evaluated. mode='direct' sums every charge at every field point,
+    # mode='tree' uses a Barnes-Hut octree with opening angle theta; smaller theta is slower but more accurate.
+    # mode='pm' solves on a particle mesh with meshCells cells along its longest side and 'cic' or 'tsc'
+    # assignment, covering the charges and meshBounds = (lo, hi) if given, see EMPY.Electrostatics.ParticleMesh.
+    # Without meshBounds the mesh grows to cover the field points evaluated, so plots and grids around the charges
+    # are interpolated from it; with meshBounds, points outside it are summed directly, with a warning when they
+    # are most of them. The mesh field is smoothed over a few cells: among the charges, e.g. between those of a
+    # dense plate, the rms error of E is tens of percent, so check it with meshError before relying on it.
+    # Elements are always evaluated with their closed form expressions.
+    def setEvaluationMode(self, mode, theta=0.5, leafSize=32, meshCells=None, meshAssignment='tsc', meshBounds=None):
+        if mode not in ('direct', 'tree', 'pm'):
+            raise ValueError("Unknown evaluation mode " + str(mode) + "; expected 'direct', 'tree' or 'pm'")
+        if meshAssignment not in ASSIGNMENTS:
+            raise ValueError("Unknown mesh assignment " + str(meshAssignment) + "; expected 'cic' or 'tsc'")
+        self.evaluationMode = mode
+        self.theta = theta
+        self.leafSize = leafSize
+        self.meshCells = meshCells
+        self.meshAssignment = meshAssignment
+        self.meshBounds = meshBounds
+        self._sourcesChanged()
+
+    # Getter Method for the Barnes-Hut octree of the charges, built on first use
+    def getTree(self):
+        if self._tree is None:
+            self._tree = Octree(self.packedCharges.getCharges(), self.packedCharges.getPositions(),
+                                theta=self.theta, leafSize=self.leafSize)
+        return self._tree
+
+    # Getter Method for the particle mesh of the charges, built on first use
+    def getMesh(self):
+        if self._mesh is None:
+            self._mesh = ParticleMesh(self.packedCharges.getCharges(), self.packedCharges.getPositions(),
+                                      self.meshCells, self.meshAssignment, self.meshBounds)
+        return self._mesh
+
+    # Make the particle mesh cover the (3, m) field points, see EMPY.Electrostatics.ParticleMesh.meshFor.
+    def _coverMesh(self, points):
+        self._mesh = meshFor(self._mesh, points, self.packedCharges.getCharges(), self.packedCharges.getPositions(),
+                             self.meshCells, self.meshAssignment, self.meshBounds)
+        return self._mesh
+
+    # Evaluate the total electric field and/or potential of the System3D on a (3, m) array of field points.
+    # Results are kept in fieldCache, so evaluating the same points again is free until the sources change.
+    # workers > 1 splits the points into tiles evaluated in parallel, see EMPY.Core.Parallel; None uses the default.
+    def evaluate(self, points, field=True, potential=True, workers=None):
+        return cachedEvaluate(self.fieldCache, self.version,
+                              lambda points, field, potential: self._evaluate(points, field, potential, workers),
+                              points, field, potential)
 
-    # Calculate the total electric field of all Charge3D Objects present in the System3D
-    def E_Total(self, fieldPos):
-        Ex_total, Ey_total, Ez_total = 0, 0, 0
+    def _evaluate(self, points, field, potential, workers=None):
+        if self.evaluationMode == 'pm':
+            self._coverMesh(points)
+        return parallelEvaluate(lambda points: self._evaluateTile(points, field, potential), points, workers)
 
-        for C in self.get_Charge3DList():
-            Ex_total += Charge3D.electricField(C, fieldPos)[0]
-            Ey_total += Charge3D.electricField(C, fieldPos)[1]
-            Ez_total += Charge3D.electricField(C, fieldPos)[2]
+    def _evaluateTile(self, points, field, potential):
+        if self.evaluationMode == 'tree':
+            E, V = self.getTree().evaluate(points)
+        elif self.evaluationMode == 'pm':
+            E, V = self.getMesh().evaluate(points, field, potential)
+        else:
+            E, V = pointKernel(self.packedCharges.getCharges(), self.packedCharges.getPositions(),
+                               points, field, potential)
+        if len(self.packedElements):
+            Ee, Ve = self.packedElements.evaluate(points, field, potential)
+            if field:
+                E += Ee
+            if potential:
+                V += Ve
+        return E, V
 
-        return Ex_total, Ey_total, Ez_total
+    # Evaluate the field and/or potential of every group of sources once on fieldPos, so that the result for
+    # any charges costs a matrix product: the returned BasisField evaluates weights with evaluate(weights) and
+    # yields the result of a sequence of weights with frames, as tuples like EV_Total, see EMPY.Core.BasisField.
+    # groups is a list of index arrays of packed charges sharing one weight, which scales their present charges;
+    # by default every charge is its own group and its weight is its charge. Every Element follows as its own group.
+    def basisField(self, fieldPos, groups=None, field=True, potential=True, workers=None):
+        points, shape = flattenFieldPos(fieldPos, 3)
+        q, sourcePos = self.packedCharges.getCharges(), self.packedCharges.getPositions()
+        if groups is None:
+            sources = [(np.ones(1), sourcePos[i:i + 1]) for i in range(len(q))]
+            weights = list(q)
+        else:
+            groups = [np.asarray(g, dtype=np.intp) for g in groups]
+            sources = [(q[g], sourcePos[g]) for g in groups]
+            weights = [1.] * len(groups)
+        contributions = [lambda points, s=s: pointKernel(*s, points, field, potential) for s in sources]
+        contributions += [lambda points, e=e: self._elementContribution(e)(points, field, potential)
+                          for e in self.elementLists]
+        weights += [1.] * len(self.elementLists)
+        basis = np.empty((len(contributions), (3 * field + potential) * points.shape[1]))
+        for g, contribution in enumerate(contributions):
+            basis[g] = flattenFieldPotential(*parallelEvaluate(contribution, points, workers))
+        return BasisField(basis, weights, lambda values: unflattenFieldPotential(values, 3, field, potential, shape))
 
-    # Calculate the total electric potential of all Charge3D Objects present in the System3D
-    def V_Total(self, fieldPos):
-        V_Total = 0
-        for C in self.get_Charge3DList():
-            V_Total += Charge3D.potentialField(C, fieldPos)
-        return V_Total
+    # Interpolating sampler of the total electric field and/or potential tabulated on a Grid, for fast queries
+    # at many scattered points: its sample method returns the rows Ex, Ey, Ez and/or V at a (3, m) array of points,
+    # see EMPY.Core.FieldSampler. Points within exclusionRadius of a charge or an Element are evaluated exactly.
+    def sampler(self, grid, order=3, tolerance=None, maxLevel=2, exclusionRadius=0., field=True, potential=False,
+                workers=None):
+        if grid.dim != 3:
+            raise ValueError("sampler requires a grid of dimension 3")
+        sources = [self.packedCharges.getPositions()]
+        if exclusionRadius > 0:
+            sources += [polylinePoints(outline, exclusionRadius / 2.)
+                        for element in self.elementLists for outline in element.getOutline()]
+        return FieldSampler(lambda points: np.vstack([v for v in self._evaluate(points, field, potential, workers)
+                                                      if v is not None]),
+                            grid, order, tolerance, maxLevel, np.vstack(sources), exclusionRadius)
 
+    # Trace the electric field lines through the (3, n) seeds with EMPY.Core.FieldLines.traceFieldLines, on the
+    # exact field or, when given, on the field interpolated by a FieldSampler with field=True. Lines stop at
+    # bounds = [(min, max), ...], by default the box of the sampler or around the charges, and within
+    # stopRadius of a charge or an Element, by default 1% of the largest side of bounds. Returns a FieldLines.
+    def fieldLines(self, seeds, bounds=None, direction='both', step=None, tolerance=None, maxSteps=2000,
+                   stopRadius=None, sampler=None, workers=None):
+        sourcePos = self.packedCharges.getPositions()
+        if bounds is None:
+            if sampler is not None:
+                bounds = sampler.grid.bounds
+            else:
+                bounds = boundsAround(np.vstack([sourcePos] + [outline for element in self.elementLists
+                                                               for outline in element.getOutline()]))
+        if stopRadius is None:
+            stopRadius = 0.01 * max(hi - lo for lo, hi in bounds)
+        sources = [sourcePos] + [polylinePoints(outline, stopRadius / 2.)
+                                 for element in self.elementLists for outline in element.getOutline()]
+        if sampler is not None:
+            evaluate = lambda points: sampler.sample(points)[:3]
+        else:
+            evaluate = lambda points: self._evaluate(points, True, False, workers)[0]
+        return traceFieldLines(evaluate, seeds, bounds, direction, step, tolerance, maxSteps, np.vstack(sources),
+                               stopRadius)
+
+    # Stream the total electric field and/or potential over a Grid of field points tile by tile, so that
+    # the memory in use stays below memoryBudget bytes however large the grid is. Yields (tile, E, V) with
+    # tile the tuple of slices of the tile in the grid, E of shape (3,) + tile shape and V of the tile shape.
+    def iterField(self, grid, memoryBudget=DEFAULT_TILE_BYTES, field=True, potential=True, workers=None):
+        if grid.dim != 3:
+            raise ValueError("iterField requires a grid of dimension 3")
+        # Field points, their meshgrid, E and V take (3 * 3 + 1) float64 per point; the kernels
+        # work on cache-sized blocks of the tile and need no memory in proportion to it.
+        for tile in grid.tiles(grid.tileShape(memoryBudget, 8 * (3 * 3 + 1))):
+            shape = grid.sliceShape(tile)
+            E, V = self._evaluate(grid.tilePoints(tile), field, potential, workers)
+            yield tile, (None if E is None else E.reshape((3,) + shape)), (None if V is None else V.reshape(shape))
+
+    # Evaluate the total electric field and/or potential over a Grid tile by tile, writing the components
+    # 'Ex', 'Ey', 'Ez' and 'V' straight into memory-mapped .npy files in directory together with the grid metadata.
+    # Returns the StoredField of directory, which can also be re-opened later with EMPY.Core.FieldStore.openField.
+    def evaluateToDisk(self, directory, grid, memoryBudget=DEFAULT_TILE_BYTES, field=True, potential=True,
+                       workers=None):
+        names = (('Ex', 'Ey', 'Ez') if field else ()) + (('V',) if potential else ())
+
+        def tiles():
+            for tile, E, V in self.iterField(grid, memoryBudget, field, potential, workers):
+                values = {'V': V}
+                if field:
+                    values.update(zip(('Ex', 'Ey', 'Ez'), E))
+                yield tile, values
+
+        return writeField(directory, grid, names, tiles(),
+                          {'system': type(self).__name__, 'version': self.version})
+
+    # Calculate the total electric field of all Charge3D Objects and Elements present in the System3D
+    def E_Total(self, fieldPos, workers=None):
+        points, shape = flattenFieldPos(fieldPos, 3)
+        E, V = self.evaluate(points, potential=False, workers=workers)
+        return E[0].reshape(shape), E[1].reshape(shape), E[2].reshape(shape)
+
+    # Calculate the total electric potential of all Charge3D Objects and Elements present in the System3D
+    def V_Total(self, fieldPos, workers=None):
+        points, shape = flattenFieldPos(fieldPos, 3)
+        E, V = self.evaluate(points, field=False, workers=workers)
+        return V.reshape(shape)
+
+    # Calculate the total electric field and potential in a single pass over the charges.
+    # Returns (Ex, Ey, Ez, V) or, with magnitude=True, (Ex, Ey, Ez, V, |E|).
+    def EV_Total(self, fieldPos, magnitude=False, workers=None):
+        points, shape = flattenFieldPos(fieldPos, 3)
+        E, V = self.evaluate(points, workers=workers)
+        return packFieldPotential(E, V, shape, magnitude)
+
+    # Compare the tree code against direct summation on a random sample of nSample points of fieldPos.
+    # Returns the maximum and root mean square relative errors of the field E and the potential V.
+    def treeError(self, fieldPos, nSample=256, seed=0):
+        points, shape = flattenFieldPos(fieldPos, 3)
+        rng = np.random.default_rng(seed)
+        sample = points[:, rng.choice(points.shape[1], min(nSample, points.shape[1]), replace=False)]
+        E, V = self.getTree().evaluate(sample)
+        q, sourcePos = self.packedCharges.getCharges(), self.packedCharges.getPositions()
+        E_direct, V_direct = pointKernel(q, sourcePos, sample, True, True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            errE = np.linalg.norm(E - E_direct, axis=0) / np.linalg.norm(E_direct, axis=0)
+            errV = np.abs(V - V_direct) / np.abs(V_direct)
+        errE, errV = errE[np.isfinite(errE)], errV[np.isfinite(errV)]
+        return {'E_max': float(errE.max(initial=0.)), 'E_rms': float(np.sqrt(np.mean(errE ** 2))) if len(errE) else 0.,
+                'V_max': float(errV.max(initial=0.)), 'V_rms': float(np.sqrt(np.mean(errV ** 2))) if len(errV) else 0.,
+                'nSample': sample.shape[1]}
+
+    # Compare the particle mesh against direct summation on a random sample of nSample points of fieldPos.
+    # Returns the maximum and root mean square relative errors of the field E and the potential V.
+    def meshError(self, fieldPos, nSample=256, seed=0):
+        points, shape = flattenFieldPos(fieldPos, 3)
+        return self._coverMesh(points).accuracy(points, nSample, seed)
+
+    # Interactions of the charges of the System3D with each other and with its Elements, as a tuple of the total
+    # energy, the (n, 3) forces on the charges (None unless forces) and the potential at every charge from all
+    # other sources, see EMPY.Electrostatics.Interactions. The energy leaves out the self energy of the Elements.
+    # Results are kept in fieldCache until the sources change; workers > 1 evaluates blocks of pairs in threads.
+    def interactions(self, forces=True, workers=None):
+        key = (self.version, 'interactions', forces)
+        result = self.fieldCache.get(key)
+        if result is None:
+            q, sourcePos = self.packedCharges.getCharges(), self.packedCharges.getPositions()
+            energy, F, phi = pairInteractions(q, sourcePos, forces, workers)
+            if len(self.packedElements) and len(q):
+                Ee, Ve = self.packedElements.evaluate(sourcePos.T, forces, True)
+                energy += q.dot(Ve)
+                phi += Ve
+                if forces:
+                    F += q[:, np.newaxis] * Ee.T
+            result = (energy, F, phi)
+            self.fieldCache.put(key, result)
+        return result
 
 # A DiscreteSystem3D object to store, keep track, and visualize a discrete distribution of
 # 3-Dimensional Charge3D Objects contained in the system.
 class DiscreteSystem3D(System3D):
 
-    def __init__(self, sources, dupWarning=True):
-        System3D.__init__(self, sources, dupWarning)
+    def __init__(self, sources, dupWarning=True, dupTolerance=0.):
+        System3D.__init__(self, sources, dupWarning, dupTolerance)
 
     # Plot the Total Electric Field Generated by all the Charge3D Objects in charge3DLists
-    def plotField(self, xs, ys, zs):
-        x, y, z = np.mgrid[xs[0]:xs[1]:10j, ys[0]:ys[1]:10j, zs[0]:zs[1]:10j]
+    # lines is an optional FieldLines, e.g. from fieldLines, drawn over the quiver plot. The grid has resolution
+    # points along every axis and transform rescales the arrow lengths, see EMPY.Core.Transforms.transformMagnitude.
+    def plotField(self, xs, ys, zs, lines=None, resolution=10, transform=None):
+        from mayavi import mlab
+        x, y, z = np.mgrid[xs[0]:xs[1]:resolution * 1j, ys[0]:ys[1]:resolution * 1j, zs[0]:zs[1]:resolution * 1j]
 
-        Ex, Ey, Ez = self.E_Total([x,y,z])
+        Ex, Ey, Ez = transformMagnitude(self.E_Total([x,y,z]), transform)
 
         mlab.figure(size=(1000,1000))
-        for C in self.get_Charge3DList():
-            if Charge3D.getCharge(C) < 0:
-                color = (0, 0, 1)
-            else:
-                color = (1, 0, 0)
-            mlab.points3d(Charge3D.getPosition(C)[0], Charge3D.getPosition(C)[1], Charge3D.getPosition(C)[2], color=color, scale_factor = 1)
+        # Negative charges blue and positive charges red, in one glyph call
+        if len(self.packedCharges):
+            drawPoints3D(self.packedCharges.getPositions().T, np.where(self.packedCharges.getCharges() < 0, -1., 1.))
         mlab.quiver3d(x,y,z, Ex, Ey, Ez, line_width=2, scale_factor=1, colormap='gist_rainbow', opacity=0.6)
-        mlab.show()
+        if lines is not None:
+            drawFieldLines(lines)
+        showScene('plotField', {'x': x, 'y': y, 'z': z, 'Ex': Ex, 'Ey': Ey, 'Ez': Ez})
 
 
 # A ContinuousSystem3D object to store, keep track, and visualize a
 # continuous distribution of 3-Dimensional Charge3D Objects.
 class ContinuousSystem3D(System3D):
 
-    def __init__(self, sources, dupWarning=True):
-        System3D.__init__(self, sources, dupWarning)
+    def __init__(self, sources=(), dupWarning=True, dupTolerance=0.):
+        System3D.__init__(self, sources, dupWarning, dupTolerance)
+
+    # The builders below spread a total charge Q over the samples of a shape and write them straight
+    # into packedCharges, see EMPY.Electrostatics.Distributions. sources may be left empty.
+
+    # Curve (pX(t), pY(t), pZ(t)) for t from t0 to t1, with n charges weighted by the length of curve they
+    # stand for. pX, pY and pZ may take an array of parameters, otherwise they are called once per sample.
+    def parametricCurve(self, pX, pY, pZ, t0, t1, n, Q):
+        weights, sourcePos = Distributions.parametricCurve([pX, pY, pZ], t0, t1, n)
+        self.add_Charges3D(Q * weights, sourcePos)
+
+    # Straight line of n charges from start to end.
+    def line(self, start, end, n, Q):
+        weights, sourcePos = Distributions.line(start, end, n)
+        self.add_Charges3D(Q * weights, sourcePos)
+
+    # Polyline through vertices with charges about spacing apart.
+    def polyline(self, vertices, spacing, Q):
+        weights, sourcePos = Distributions.polyline(vertices, spacing)
+        self.add_Charges3D(Q * weights, sourcePos)
+
+    # Ring of n charges of radius R about center, perpendicular to normal.
+    def ring(self, center, R, n, Q, normal=(0, 0, 1)):
+        weights, sourcePos = Distributions.ring(center, R, n, normal)
+        self.add_Charges3D(Q * weights, sourcePos)
+
+    # Helix of n charges and radius R about the axis through center along normal, advancing pitch per turn.
+    def helix(self, center, R, pitch, turns, n, Q, normal=(0, 0, 1)):
+        weights, sourcePos = Distributions.helix(center, R, pitch, turns, n, normal)
+        self.add_Charges3D(Q * weights, sourcePos)
+
+    # Uniformly charged disk of radius R about center, perpendicular to normal, with charges about spacing apart.
+    def disk(self, center, R, spacing, Q, normal=(0, 0, 1)):
+        weights, sourcePos = Distributions.disk(center, R, spacing, normal)
+        self.add_Charges3D(Q * weights, sourcePos)
+
+    # Uniformly charged rectangular plate corner + s edgeU + t edgeV with nu x nv charges.
+    def plate(self, corner, edgeU, edgeV, nu, nv, Q):
+        weights, sourcePos = Distributions.rectangle(corner, edgeU, edgeV, nu, nv)
+        self.add_Charges3D(Q * weights, sourcePos)
+
+    # Uniformly charged spherical shell of radius R about center with n charges.
+    def sphereShell(self, center, R, n, Q):
+        weights, sourcePos = Distributions.sphereShell(center, R, n)
+        self.add_Charges3D(Q * weights, sourcePos)
+
+    # Uniformly charged lateral surface of a cylinder of radius R and length, from center along axis.
+    def cylinder(self, center, R, length, nAround, nAlong, Q, axis=(0, 0, 1)):
+        weights, sourcePos = Distributions.cylinder(center, R, length, nAround, nAlong, axis)
+        self.add_Charges3D(Q * weights, sourcePos)
+
+    # Uniformly charged axis-aligned box from corner to corner + size with charges about spacing apart.
+    def box(self, corner, size, spacing, Q):
+        weights, sourcePos = Distributions.box(corner, size, spacing)
+        self.add_Charges3D(Q * weights, sourcePos)
 
     # Plot the Total Electric Field Generated by the Continuous Charge3D Distribution in the System.
-    def plotField(self, xs, ys, zs, object):
-        x, y, z = np.mgrid[xs[0]:xs[1]:10j, ys[0]:ys[1]:10j, zs[0]:zs[1]:10j]
+    # lines is an optional FieldLines, e.g. from fieldLines, drawn over the quiver plot. resolution and transform
+    # are as in DiscreteSystem3D.plotField.
+    def plotField(self, xs, ys, zs, object, lines=None, resolution=10, transform=None):
+        from mayavi import mlab
+        x, y, z = np.mgrid[xs[0]:xs[1]:resolution * 1j, ys[0]:ys[1]:resolution * 1j, zs[0]:zs[1]:resolution * 1j]
 
-        Ex, Ey, Ez = self.E_Total([x,y,z])
+        Ex, Ey, Ez = transformMagnitude(self.E_Total([x,y,z]), transform)
 
         mlab.figure(size=(1000,1000))
         mlab.plot3d(object[0], object[1], object[2], tube_radius=0.15, colormap='Spectral')
+        outlines = [outline for element in self.getElements() for outline in element.getOutline()]
+        if outlines:
+            drawPolylines3D(*packPolylines(outlines), color=(0, 0, 0), tube_radius=0.15)
         mlab.quiver3d(x,y,z, Ex, Ey, Ez, line_width=1, scale_factor=1, colormap='gist_rainbow', opacity=0.75)
-        mlab.show()
\ No newline at end of file
+        if lines is not None:
+            drawFieldLines(lines)
+        showScene('plotField', {'x': x, 'y': y, 'z': z, 'Ex': Ex, 'Ey': Ey, 'Ez': Ez})
\ No newline at end of file
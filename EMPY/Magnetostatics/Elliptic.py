@@ -0,0 +1,134 @@
+import functools
+import numpy as np
+
+LOG4 = np.log(4.)
+# Number of octaves [2^-(j+1), 2^-j) of x covered by an EllipticTable; below them the asymptotic forms are used.
+TABLE_OCTAVES = 48
+# Largest number of mantissa bits indexing the intervals of an octave before giving up on the tolerance.
+MAX_INTERVAL_BITS = 16
+# Number of values of x looked up together, keeping the temporaries of EllipticTable.evaluate in cache.
+TABLE_BLOCK = 1 << 15
+# Exponent bias and number of mantissa bits of a float64.
+EXPONENT_BIAS = 1023
+MANTISSA_BITS = 52
+
+
+# E(1 - x) and K(1 - x) from scipy, the integrals used by the loop field with x = alpha^2 / beta^2.
+def referenceIntegrals(x):
+  import scipy.special
+  return scipy.special.ellipe(1. - x), scipy.special.ellipkm1(x)
+
+
+class EllipticTable(object):
+  'Tabulated complete elliptic integrals E(1 - x) and K(1 - x) for x in [0, 1] within a relative tolerance.'
+
+  # K grows like -ln(x) / 2 as x -> 0, so the table is uniform within every octave of x rather than over
+  # [0, 1]. The bits of a float64 hold its exponent above its mantissa, so shifting them right leaves the
+  # octave and the top bits of the mantissa as a single integer: the index of the interval of x, with the
+  # remaining mantissa bits its position u in [0, 1) within it. Each interval holds a quadratic in u through
+  # E and K at its Chebyshev nodes, which has the same relative error in every octave, and the number of
+  # mantissa bits is raised until that error is below tolerance. Below the last octave K = ln(4) - ln(x) / 2
+  # and E = 1.
+  def __init__(self, tolerance = 1e-8):
+    self.tolerance = tolerance
+    self.xMin = 2. ** -TABLE_OCTAVES
+    bits = 4
+    while True:
+      coefficients, error = self._fit(bits)
+      if error <= tolerance:
+        break
+      if bits >= MAX_INTERVAL_BITS:
+        raise ValueError("Elliptic integral table cannot reach the relative tolerance " + str(tolerance))
+      bits += 1
+    self.bits = bits
+    self.n = 1 << bits
+    self.error = error
+    self._shift = MANTISSA_BITS - bits
+    self._first = (EXPONENT_BIAS - TABLE_OCTAVES) << bits
+    self._scale = 2. ** -self._shift
+    self.E, self.K = coefficients
+
+  # Lower end and width of the intervals of x indexed by 2^bits intervals per octave. The last interval
+  # starts at x = 1, the only point of the table with the exponent of [1, 2).
+  @staticmethod
+  def _intervals(bits):
+    n = 1 << bits
+    index = np.arange(TABLE_OCTAVES * n + 1)
+    exponent = index // n - TABLE_OCTAVES
+    return np.ldexp(1. + (index % n) / n, exponent), np.ldexp(1. / n, exponent)
+
+  # Quadratic coefficients (u^2, u, 1) of E and K in every interval, as contiguous columns, and their
+  # largest relative error against scipy between the nodes.
+  def _fit(self, bits):
+    lower, width = self._intervals(bits)
+    nodes = 0.5 - 0.5 * np.cos(np.pi * np.arange(1, 6, 2) / 6.)
+    inverse = np.linalg.inv(np.vander(nodes, 3))
+    u = np.linspace(0., 1., 9)
+    vander = np.vander(u, 3)
+    coefficients, error = [], 0.
+    for fit, check in zip(referenceIntegrals(lower[:, np.newaxis] + width[:, np.newaxis] * nodes),
+                          referenceIntegrals(lower[:, np.newaxis] + width[:, np.newaxis] * u)):
+      c = fit.dot(inverse.T)
+      error = max(error, np.max(np.abs(c.dot(vander.T) - check) / np.abs(check)))
+      coefficients.append([np.ascontiguousarray(c[:, k]) for k in range(3)])
+    return coefficients, error
+
+  # Number of table intervals.
+  def size(self):
+    return len(self.E[0])
+
+  # (E(1 - x), K(1 - x)) at x in [0, 1]. Rounding can push alpha^2 / beta^2 slightly below 0 on a wire,
+  # where the indices are clipped into the table instead of returning nan like scipy. Large arrays are
+  # looked up in blocks of TABLE_BLOCK values.
+  def evaluate(self, x):
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    if x.size <= TABLE_BLOCK:
+      return self._evaluateBlock(x)
+    E, K = np.empty(x.shape), np.empty(x.shape)
+    flat, flatE, flatK = x.reshape(-1), E.reshape(-1), K.reshape(-1)
+    for i in range(0, x.size, TABLE_BLOCK):
+      flatE[i:i + TABLE_BLOCK], flatK[i:i + TABLE_BLOCK] = self._evaluateBlock(flat[i:i + TABLE_BLOCK])
+    return E, K
+
+  def _evaluateBlock(self, x):
+    index = x.view(np.int64) >> self._shift
+    index -= self._first
+    np.clip(index, 0, self.size() - 1, out=index)
+    u = (x.view(np.int64) & ((1 << self._shift) - 1)).astype(np.float64)
+    u *= self._scale
+    E, K = [self._quadratic(c, index, u) for c in (self.E, self.K)]
+    if x.size and x.min() < self.xMin:
+      tiny = np.nonzero(x < self.xMin)
+      with np.errstate(divide='ignore'):
+        K[tiny] = LOG4 - 0.5 * np.log(np.maximum(x[tiny], 0.))
+      E[tiny] = 1.
+    return E, K
+
+  @staticmethod
+  def _quadratic(c, index, u):
+    value = np.take(c[0], index)
+    value *= u
+    value += np.take(c[1], index)
+    value *= u
+    value += np.take(c[2], index)
+    return value
+
+  # Relative errors of the table against scipy on nSample points spread uniformly in x and in ln(x).
+  # Returns a dict with the maximum and root mean square relative errors of E and K.
+  def accuracy(self, nSample = 100000, seed = 0):
+    rng = np.random.default_rng(seed)
+    x = np.concatenate([rng.random(nSample // 2),
+                        np.exp(rng.uniform(np.log(self.xMin) - 5., 0., nSample - nSample // 2))])
+    E, K = self.evaluate(x)
+    E_ref, K_ref = referenceIntegrals(x)
+    E_error = np.abs(E - E_ref) / np.abs(E_ref)
+    K_error = np.abs(K - K_ref) / np.abs(K_ref)
+    return {'E_max': E_error.max(), 'E_rms': np.sqrt(np.mean(E_error ** 2)),
+            'K_max': K_error.max(), 'K_rms': np.sqrt(np.mean(K_error ** 2)),
+            'tolerance': self.tolerance, 'nSample': len(x)}
+
+
+# Shared EllipticTable for a tolerance, built on first use.
+@functools.lru_cache(maxsize=8)
+def ellipticTable(tolerance = 1e-8):
+  return EllipticTable(tolerance)
@@ -1,7 +1,24 @@
 import math
+import weakref
 import numpy as np
-import scipy.special
-import matplotlib.pyplot as plt
+from EMPY.Core.FieldCache import FieldCache, arrayKey
+from EMPY.Core.LiveField import LiveField
+from EMPY.Core.Tiling import DEFAULT_TILE_BYTES
+from EMPY.Core.FieldStore import writeField
+from EMPY.Core.Parallel import parallelEvaluate
+from EMPY.Core.BasisField import BasisField
+from EMPY.Core.FieldSampler import FieldSampler
+from EMPY.Core.FieldLines import traceFieldLines, boundsAround
+from EMPY.Core.Render import showFigure
+from EMPY.Magnetostatics.Elliptic import ellipticTable, referenceIntegrals
+
+# Number of (field point, loop) pairs evaluated together by LoopSystem.
+LOOP_BLOCK_PAIRS = 1 << 15
+# evaluate interpolates at least AXISYMMETRIC_MIN_POINTS points from at least AXISYMMETRIC_MIN_LOOPS coaxial
+# loops from an AxisymmetricField of shape AXISYMMETRIC_SHAPE, which costs less than summing every loop there.
+AXISYMMETRIC_MIN_POINTS = 1 << 17
+AXISYMMETRIC_MIN_LOOPS = 32
+AXISYMMETRIC_SHAPE = (128, 256)
 
 def normalize(v):
   l = np.linalg.norm(v)
@@ -26,58 +43,306 @@ class LoopSystem(object):
     self._length_units = length_units
     self._field_units = field_units
     self._epsilon = np.finfo(np.float64).eps
+    # Version counter of the loops and the cache of fields evaluated for the current version.
+    # Loops changed in place after being added are not tracked; add them again instead.
+    self.version = 0
+    self.fieldCache = FieldCache()
+    # Live field grids patched incrementally whenever a loop is added or removed
+    self._liveFields = weakref.WeakSet()
+    self._packed = None
+    # EllipticTable replacing the scipy elliptic integrals, see setEllipticMode.
+    self._ellipticTable = None
+    # Whether evaluate interpolates large evaluations of coaxial loops, see setAxisymmetricMode.
+    self._axisymmetric = True
+
+  def _loopsChanged(self, loop, sign):
+      self.version += 1
+      self._packed = None
+      self.fieldCache.clear()
+      for live in list(self._liveFields):
+          live.patch((self._evalLoop(live.points, loop),), sign)
 
   def addLoop(self, loop):
       self.loops.append(loop)
+      self._loopsChanged(loop, 1)
 
-  def evaluate(self, position):
-      _p = np.atleast_2d(position)
-      B = np.zeros(_p.shape)
-      for loop in self.loops:
-          B += self._evalLoop(_p, loop)
-      return np.squeeze(B / self._field_units)
+  def removeLoop(self, loop):
+      self.loops.pop(self.loops.index(loop))
+      self._loopsChanged(loop, -1)
+
+  # Evaluate the field at position once and keep it up to date as loops are added and removed,
+  # each change costing a single loop evaluation. The get method of the returned LiveField
+  # returns the same array as evaluate.
+  def liveField(self, position):
+      _p = np.atleast_2d(np.asarray(position, dtype=np.float64))
+      live = LiveField(_p, (self._sumLoops(_p),),
+                       lambda values: np.squeeze(values[0] / self._field_units),
+                       lambda points: (self._sumLoops(points),))
+      self._liveFields.add(live)
+      return live
+
+  # workers > 1 splits the positions into tiles evaluated in parallel, see EMPY.Core.Parallel.
+  # Coaxial stacks of many loops evaluated at many positions are interpolated from an AxisymmetricField
+  # covering the positions instead, with a relative rms error of about 1e-5, see setAxisymmetricMode.
+  def evaluate(self, position, workers = None):
+      key = (self.version, arrayKey(np.asarray(position, dtype=np.float64)))
+      B = self.fieldCache.get(key)
+      if B is None:
+          B = self._evaluate(position, workers)
+          self.fieldCache.put(key, B)
+      return B
+
+  # Stream the field over a 3D Grid of field points tile by tile, so that the memory in use stays below
+  # memoryBudget bytes however large the grid is. Yields (tile, B) with tile the tuple of slices of the
+  # tile in the grid and B of shape tile shape + (3,).
+  def iterField(self, grid, memoryBudget = DEFAULT_TILE_BYTES, workers = None):
+      if grid.dim != 3:
+          raise ValueError("iterField requires a grid of dimension 3")
+      # _evalLoop holds about 40 float64 temporaries per field point.
+      for tile in grid.tiles(grid.tileShape(memoryBudget, 8 * 40)):
+          B = self._sumLoopsParallel(grid.tilePoints(tile).T, workers) / self._field_units
+          yield tile, B.reshape(grid.sliceShape(tile) + (3,))
+
+  # Evaluate the field over a 3D Grid tile by tile, writing 'Bx', 'By' and 'Bz' straight into
+  # memory-mapped .npy files in directory together with the grid metadata. Returns the StoredField.
+  def evaluateToDisk(self, directory, grid, memoryBudget = DEFAULT_TILE_BYTES, workers = None):
+      tiles = ((tile, {'Bx': B[..., 0], 'By': B[..., 1], 'Bz': B[..., 2]})
+               for tile, B in self.iterField(grid, memoryBudget, workers))
+      return writeField(directory, grid, ('Bx', 'By', 'Bz'), tiles,
+                        {'system': type(self).__name__, 'version': self.version})
+
+  # Evaluate the field of every loop once at position, so that the field for any currents costs a matrix
+  # product: the returned BasisField evaluates currents with evaluate(currents) and yields the field of a
+  # sequence of currents with frames, see EMPY.Core.BasisField. groups is a list of lists of loops sharing
+  # one weight, which scales the present currents of the loops of the group; by default every loop is
+  # its own group and its weight is its current.
+  def basisField(self, position, groups = None, workers = None):
+      _p = np.atleast_2d(np.asarray(position, dtype=np.float64))
+      if groups is None:
+          packs = [self._packLoops([loop])[:3] + (np.ones(1),) for loop in self.loops]
+          weights = [loop.i for loop in self.loops]
+      else:
+          packs = [self._packLoops(group) for group in groups]
+          weights = np.ones(len(groups))
+      basis = np.empty((len(packs), _p.size))
+      for g, packed in enumerate(packs):
+          basis[g] = parallelEvaluate(lambda points: (self._evalLoops(points.T, packed).T,), _p.T, workers)[0].T.ravel()
+      basis /= self._field_units
+      return BasisField(basis, weights, lambda values: np.squeeze(values.reshape(_p.shape)))
+
+  # Interpolating sampler of the field tabulated on a 3D Grid, for fast queries at many scattered points:
+  # its sample method returns the rows Bx, By and Bz at a (3, m) array of points, see EMPY.Core.FieldSampler.
+  # Points within exclusionRadius of a wire, where the field is singular, are evaluated exactly.
+  def sampler(self, grid, order = 3, tolerance = None, maxLevel = 2, exclusionRadius = 0., workers = None):
+      if grid.dim != 3:
+          raise ValueError("sampler requires a grid of dimension 3")
+      sources = np.empty((0, 3))
+      if exclusionRadius > 0 and self.loops:
+          sources = np.vstack([self._wirePoints(loop, exclusionRadius / 2.) for loop in self.loops])
+      return FieldSampler(lambda points: self._sumLoopsParallel(points.T, workers).T / self._field_units,
+                          grid, order, tolerance, maxLevel, sources, exclusionRadius)
+
+  # Trace the magnetic field lines through the (m, 3) seed positions with EMPY.Core.FieldLines.traceFieldLines,
+  # on the exact field or, when given, on the field interpolated by a FieldSampler of the system. Lines stop
+  # at bounds = [(min, max), ...], by default the box of the sampler or around the loops, and within stopRadius
+  # of a wire, by default 1% of the largest side of bounds. Returns a FieldLines with (3, k) vertices.
+  def fieldLines(self, seeds, bounds = None, direction = 'both', step = None, tolerance = None, maxSteps = 2000,
+                 stopRadius = None, sampler = None, workers = None):
+      if bounds is None:
+          if sampler is not None:
+              bounds = sampler.grid.bounds
+          else:
+              centres, normals, radii, currents = self._packedLoops()
+              bounds = boundsAround(np.vstack([centres - radii[:, np.newaxis], centres + radii[:, np.newaxis]]))
+      if stopRadius is None:
+          stopRadius = 0.01 * max(hi - lo for lo, hi in bounds)
+      sources = np.empty((0, 3))
+      if self.loops:
+          sources = np.vstack([self._wirePoints(loop, stopRadius / 2.) for loop in self.loops])
+      if sampler is not None:
+          evaluate = sampler.sample
+      else:
+          evaluate = lambda points: self._sumLoopsParallel(points.T, workers).T
+      return traceFieldLines(evaluate, np.atleast_2d(np.asarray(seeds, dtype=np.float64)).T, bounds, direction,
+                             step, tolerance, maxSteps, sources, stopRadius)
+
+  # Points along the wire of loop, at most spacing apart.
+  def _wirePoints(self, loop, spacing):
+      helper = np.array([1., 0., 0.]) if abs(loop.n[0]) < 0.9 else np.array([0., 1., 0.])
+      u = normalize(np.cross(helper, loop.n))
+      v = np.cross(loop.n, u)
+      phi = np.linspace(0., 2. * np.pi, max(8, int(np.ceil(2. * np.pi * loop.r / spacing))), endpoint=False)
+      return loop.p + loop.r * (np.outer(np.cos(phi), u) + np.outer(np.sin(phi), v))
+
+  # Select how the complete elliptic integrals of the loop fields are computed. mode='scipy' calls
+  # scipy.special for every point and loop, mode='table' interpolates a table built once to the relative
+  # tolerance, see EMPY.Magnetostatics.Elliptic; getEllipticTable().accuracy() reports its errors.
+  # The table looks the integrals up about twice as fast as scipy. Live fields are evaluated again in the new mode.
+  def setEllipticMode(self, mode, tolerance = 1e-8):
+      if mode not in ('scipy', 'table'):
+          raise ValueError("Unknown elliptic mode " + str(mode) + "; expected 'scipy' or 'table'")
+      self._ellipticTable = ellipticTable(tolerance) if mode == 'table' else None
+      self.version += 1
+      self.fieldCache.clear()
+      for live in list(self._liveFields):
+          live.refresh()
+
+  # Getter Method for the EllipticTable in use, None in the 'scipy' mode
+  def getEllipticTable(self):
+      return self._ellipticTable
+
+  # Common axis of the loops as (origin, axis) when all loops share one axis, else None.
+  # Loops facing the other way along the axis count as coaxial, with their current reversed.
+  def coaxialAxis(self, tolerance = 1e-9):
+      if not self.loops:
+          return None
+      centres, normals, radii, currents = self._packedLoops()
+      origin, axis = centres[0], normals[0]
+      offsets = centres - origin
+      offsets -= np.outer(offsets.dot(axis), axis)
+      if np.abs(np.cross(normals, axis)).max() > tolerance or \
+         np.linalg.norm(offsets, axis=1).max() > tolerance * max(1., radii.max()):
+          return None
+      return origin, axis
+
+  # The loops in the frame of their common axis: centres on the z axis at their axial offsets,
+  # normals along +z and the currents of reversed loops negated.
+  def _axialLoops(self):
+      coaxial = self.coaxialAxis()
+      if coaxial is None:
+          raise ValueError("The loops of the LoopSystem do not share a common axis")
+      origin, axis = coaxial
+      centres, normals, radii, currents = self._packedLoops()
+      packed = (np.outer((centres - origin).dot(axis), [0., 0., 1.]),
+                np.tile([0., 0., 1.], (len(radii), 1)), radii, currents * np.sign(normals.dot(axis)))
+      return origin, axis, packed
+
+  # Closed form field of coaxial loops on their axis, mu_0 I a^2 / (2 (a^2 + z^2)^(3/2)) per loop,
+  # at the axial coordinates s measured from the centre of the first loop. Returns B along the axis.
+  def onAxisField(self, s):
+      origin, axis, (centres, normals, radii, currents) = self._axialLoops()
+      z = (np.asarray(s, dtype=np.float64)[..., np.newaxis] - centres[:, 2]) * self._length_units
+      a = radii * self._length_units
+      mu0 = 4.e-7 * np.pi
+      return (mu0 * currents * a * a / (2. * (a * a + z * z) ** 1.5)).sum(axis=-1) / self._field_units
+
+  # Tabulate the field of coaxial loops once on a (rho, z) half-plane of shape points, rho from 0 to rhoMax
+  # and z over zRange measured along the axis from the centre of the first loop. The returned
+  # AxisymmetricField maps the table back onto any 3D positions; positions within margin cells
+  # of a wire, where the field is singular, are evaluated exactly instead.
+  def axisymmetricField(self, rhoMax, zRange, shape = (128, 256), margin = 4):
+      origin, axis, packed = self._axialLoops()
+      return AxisymmetricField(self, origin, axis, packed, rhoMax, zRange, shape, margin)
+
+  # Select whether evaluate interpolates large evaluations of coaxial loops, mode='auto', or always sums
+  # every loop at every position, mode='exact'.
+  def setAxisymmetricMode(self, mode):
+      if mode not in ('auto', 'exact'):
+          raise ValueError("Unknown axisymmetric mode " + str(mode) + "; expected 'auto' or 'exact'")
+      self._axisymmetric = mode == 'auto'
+      self.version += 1
+      self.fieldCache.clear()
+
+  def _evaluate(self, position, workers = None):
+      p = np.atleast_2d(np.asarray(position, dtype=np.float64))
+      if self._axisymmetric and len(p) >= AXISYMMETRIC_MIN_POINTS and len(self.loops) >= AXISYMMETRIC_MIN_LOOPS \
+         and self.coaxialAxis() is not None:
+          return self._coveringField(p).evaluate(p)
+      return np.squeeze(self._sumLoopsParallel(p, workers) / self._field_units)
+
+  # AxisymmetricField of the coaxial loops whose table covers the (m, 3) positions p, padded by the cells
+  # that AxisymmetricField evaluates exactly along its edges.
+  def _coveringField(self, p):
+      origin, axis = self.coaxialAxis()
+      d = p - origin
+      z = d.dot(axis)
+      rho = np.sqrt(np.maximum(np.einsum('ij,ij->i', d, d) - z * z, 0.))
+      nRho, nZ = AXISYMMETRIC_SHAPE
+      rhoMax = max(rho.max(), self._packedLoops()[2].max()) * (nRho - 1.) / (nRho - 4.)
+      pad = max(z.max() - z.min(), 1e-9) * 2. / (nZ - 5.)
+      return self.axisymmetricField(rhoMax, (z.min() - pad, z.max() + pad), AXISYMMETRIC_SHAPE)
+
+  # _sumLoops over tiles of the (m, 3) positions p evaluated on workers threads or processes.
+  def _sumLoopsParallel(self, p, workers = None):
+      return parallelEvaluate(lambda points: (self._sumLoops(points.T).T,), p.T, workers)[0].T
+
+  # Centres, normals, radii and currents of the loops packed into arrays, rebuilt after loops change.
+  def _packedLoops(self):
+      if self._packed is None:
+          self._packed = self._packLoops(self.loops)
+      return self._packed
+
+  def _packLoops(self, loops):
+      return (np.array([loop.p for loop in loops]).reshape(-1, 3),
+              np.array([loop.n for loop in loops]).reshape(-1, 3),
+              np.array([loop.r for loop in loops]),
+              np.array([loop.i for loop in loops]))
+
+  # Field of all loops at the (m, 3) positions p, evaluated for blocks of points x loops at once.
+  def _sumLoops(self, p):
+      return self._evalLoops(p, self._packedLoops())
 
   def _evalLoop(self, p, loop):
-      r_vect = (p - loop.p) * self._length_units
-      r = np.linalg.norm(r_vect, axis=1, keepdims=True)
-      z = r_vect.dot(loop.n.T)
-      rho_vect = r_vect - np.outer(z, loop.n)
-      rho = np.linalg.norm(rho_vect, axis=1)
-      rho_vect[rho > self._epsilon,] = \
-          (rho_vect[rho > self._epsilon,].T / rho[rho > self._epsilon]).T
+      return self._evalLoops(p, self._packLoops([loop]))
+
+  def _evalLoops(self, p, packed):
+      centres, normals, radii, currents = packed
+      B = np.zeros(p.shape)
+      nLoops = len(radii)
+      if nLoops == 0:
+          return B
+      # Blocks of LOOP_BLOCK_PAIRS (point, loop) pairs keep the temporaries cache sized.
+      loopBlock = min(nLoops, LOOP_BLOCK_PAIRS)
+      pointBlock = max(1, LOOP_BLOCK_PAIRS // loopBlock)
+      for p0 in range(0, len(p), pointBlock):
+          p1 = min(p0 + pointBlock, len(p))
+          for l0 in range(0, nLoops, loopBlock):
+              l1 = min(l0 + loopBlock, nLoops)
+              B[p0:p1] += self._evalBlock(p[p0:p1], centres[l0:l1], normals[l0:l1], radii[l0:l1], currents[l0:l1])
+      return B
+
+  # Field of a block of loops at a block of points, worked on per component as (points, loops) arrays.
+  def _evalBlock(self, p, centres, normals, radii, currents):
+      r_vect = [(p[:, k, np.newaxis] - centres[:, k]) * self._length_units for k in range(3)]
+      z = r_vect[0] * normals[:, 0] + r_vect[1] * normals[:, 1] + r_vect[2] * normals[:, 2]
+      rho_vect = [r_vect[k] - z * normals[:, k] for k in range(3)]
+      rho2 = rho_vect[0] * rho_vect[0] + rho_vect[1] * rho_vect[1] + rho_vect[2] * rho_vect[2]
+      rho = np.sqrt(rho2)
 
-      a = loop.r * self._length_units
-      alpha2 = a * a + rho * rho + z * z - 2. * a * rho
-      beta2 = a * a + rho * rho + z * z + 2. * a * rho
+      a = radii * self._length_units
+      r2 = a * a + rho2 + z * z
+      alpha2 = r2 - 2. * a * rho
+      beta2 = r2 + 2. * a * rho
       beta = np.sqrt(beta2)
-      c = 4.e-7 * loop.i  # \mu_0  I / \pi
+      c = 4.e-7 * currents  # \mu_0  I / \pi
       a2b2 = alpha2 / beta2
-      Ek2 = scipy.special.ellipe(1. - a2b2)
-      Kk2 = scipy.special.ellipkm1(a2b2)
+      if self._ellipticTable is None:
+          Ek2, Kk2 = referenceIntegrals(a2b2)
+      else:
+          Ek2, Kk2 = self._ellipticTable.evaluate(a2b2)
 
       denom = (2. * alpha2 * beta * rho)
       with np.errstate(invalid='ignore'):
-          numer = c * z * ((a * a + rho * rho + z * z) * Ek2 - alpha2 * Kk2)
-      sw = np.abs(denom) > self._epsilon
-      Brho = np.zeros(numer.shape)
-      Brho[sw] = numer[sw] / denom[sw]
+          numer = c * z * (r2 * Ek2 - alpha2 * Kk2)
+      Brho = np.divide(numer, denom, out=np.zeros(numer.shape), where=np.abs(denom) > self._epsilon)
+      # Brho multiplies the unit vector along rho_vect, which is left unnormalized where rho vanishes.
+      np.divide(Brho, rho, out=Brho, where=rho > self._epsilon)
 
       denom = (2. * alpha2 * beta)
       with np.errstate(invalid='ignore'):
-          numer = c * ((a * a - rho * rho - z * z) * Ek2 + alpha2 * Kk2)
-      sw = np.abs(denom) > self._epsilon
-      Bz = np.full(numer.shape, np.inf)
-      Bz[sw] = numer[sw] / denom[sw]
+          numer = c * ((a * a - rho2 - z * z) * Ek2 + alpha2 * Kk2)
+      Bz = np.divide(numer, denom, out=np.full(numer.shape, np.inf), where=np.abs(denom) > self._epsilon)
 
-      return (Brho * rho_vect.T).T + np.outer(Bz, loop.n)
+      with np.errstate(invalid='ignore'):
+          return np.array([np.einsum('ij,ij->i', Brho, rho_vect[k]) + Bz.dot(normals[:, k]) for k in range(3)]).T
 
   def plotBField(self, min_x, max_x, n_x, min_y, max_y, n_y, n_lines = None, density = None):
+      import matplotlib.pyplot as plt
       X = np.linspace(min_x, max_x, n_x)
       Y = np.linspace(min_y, max_y, n_y)
-      points = np.empty([n_y * n_x, 3])
-      for i in range(0, n_y):
-          for j in range(0, n_x):
-              points[n_x * i + j, :] = np.array([X[j], Y[i], 0.])
+      points = np.zeros([n_y * n_x, 3])
+      points[:, 0] = np.tile(X, n_y)
+      points[:, 1] = np.repeat(Y, n_x)
       B = self.evaluate(points)
       legend_handles = []
       if n_lines is None:
@@ -98,29 +363,99 @@ class LoopSystem(object):
                             linewidth=1, density=density,
                             color=np.log(P),
                             arrowsize=1.,
-                            cmap=plt.cm.get_cmap("Spectral"),
+                            cmap="Spectral",
                             start_points=start_points)
       scale = 1
-      for loop in self.loops:
-          dp = loop.r * np.array([loop.n[1], -loop.n[0], 0])
-          p0 = loop.p - dp
-          pos_X = (p0[0])
-          pos_Y = (p0[1])
-          p1 = loop.p + dp
-          neg_X = (p1[0])
-          neg_Y = (p1[1])
-
-          plt.plot(pos_X, pos_Y, 'o', fillstyle='none',
-                   linewidth=3 * scale, markersize=20 * scale,
-                   color='black', markeredgewidth=3 * scale)
-          plt.plot(pos_X, pos_Y, 'o', fillstyle='full',
-                   linewidth=3 * scale, markersize=7 * scale,
-                   color='black', markeredgewidth=1 * scale)
-          plt.plot(neg_X, neg_Y, 'o', fillstyle='none',
-                   linewidth=3 * scale, markersize=20 * scale,
-                   color='black', markeredgewidth=3 * scale)
-          plt.plot(neg_X, neg_Y, 'x', fillstyle='none',
-                   linewidth=3 * scale, markersize=9 * scale,
-                   color='black', markeredgewidth=3 * scale)
+      # Where every loop crosses the plane, the current coming out of it at p0 and going into it at p1,
+      # drawn for all loops together with one call per marker.
+      if self.loops:
+          p, n, r = self._packedLoops()[:3]
+          dp = r[:, np.newaxis] * np.stack([n[:, 1], -n[:, 0], np.zeros(len(r))], axis=1)
+          p0 = p - dp
+          p1 = p + dp
+          plt.plot(p0[:, 0], p0[:, 1], 'o', fillstyle='none', linestyle='none',
+                   markersize=20 * scale, color='black', markeredgewidth=3 * scale)
+          plt.plot(p0[:, 0], p0[:, 1], 'o', fillstyle='full', linestyle='none',
+                   markersize=7 * scale, color='black', markeredgewidth=1 * scale)
+          plt.plot(p1[:, 0], p1[:, 1], 'o', fillstyle='none', linestyle='none',
+                   markersize=20 * scale, color='black', markeredgewidth=3 * scale)
+          plt.plot(p1[:, 0], p1[:, 1], 'x', fillstyle='none', linestyle='none',
+                   markersize=9 * scale, color='black', markeredgewidth=3 * scale)
       plt.legend(handles=legend_handles)
-      plt.show()
\ No newline at end of file
+      showFigure('plotBField', {'x': X, 'y': Y, 'Bx': Bx, 'By': By})
+
+
+# Catmull-Rom weights of the stencil points -1, 0, 1 and 2 at the fractional offsets t.
+def _catmullRom(t):
+  return (((2. - t) * t - 1.) * t / 2., ((3. * t - 5.) * t * t + 2.) / 2.,
+          ((4. - 3. * t) * t + 1.) * t / 2., (t - 1.) * t * t / 2.)
+
+class AxisymmetricField(object):
+  'A table of the (Brho, Bz) field of coaxial loops on a (rho, z) half-plane, interpolated at 3D positions.'
+
+  def __init__(self, system, origin, axis, packed, rhoMax, zRange, shape, margin = 4):
+    self.system = system
+    self.origin = origin
+    self.axis = axis
+    self._packed = packed
+    self.rho = np.linspace(0., rhoMax, shape[0])
+    self.z = np.linspace(zRange[0], zRange[1], shape[1])
+    rho, z = np.meshgrid(self.rho, self.z, indexing='ij')
+    B = self._exact(rho.ravel(), z.ravel())
+    self.Brho = B[:, 0].reshape(shape)
+    self.Bz = B[:, 2].reshape(shape)
+    # Near a wire the field is singular and the table is not used.
+    self._margin = (margin * (self.rho[1] - self.rho[0]), margin * (self.z[1] - self.z[0]))
+    # Prepend the row at rho = -drho, where Brho is odd and Bz even in rho, for the cubic stencils.
+    self._tables = [np.vstack([-self.Brho[1:2], self.Brho]), np.vstack([self.Bz[1:2], self.Bz])]
+
+  # Field of the loops at (rho, z) in their axial frame, as rows (Brho, 0, Bz).
+  def _exact(self, rho, z):
+      points = np.array([rho, np.zeros(len(rho)), z]).T
+      return self.system._evalLoops(points, self._packed) / self.system._field_units
+
+  # Cylindrical coordinates (rho, z) of the (m, 3) positions p and the unit vectors along rho.
+  def cylindrical(self, p):
+      d = p - self.origin
+      z = d.dot(self.axis)
+      rho_vect = d - np.outer(z, self.axis)
+      rho = np.linalg.norm(rho_vect, axis=1)
+      np.divide(rho_vect.T, rho, out=rho_vect.T, where=rho > 0)
+      return rho, z, rho_vect
+
+  # (Brho, Bz) at cylindrical coordinates, interpolated from the table with bicubic Catmull-Rom stencils.
+  # Positions outside of the table, in its outermost cells or within margin cells of a wire are evaluated exactly.
+  def evaluateCylindrical(self, rho, z):
+      rho, z = np.broadcast_arrays(np.asarray(rho, dtype=np.float64), np.asarray(z, dtype=np.float64))
+      shape = rho.shape
+      rho, z = rho.ravel(), z.ravel()
+      u = rho / (self.rho[1] - self.rho[0])
+      v = (z - self.z[0]) / (self.z[1] - self.z[0])
+      i = np.floor(u).astype(np.intp)
+      j = np.floor(v).astype(np.intp)
+      exact = (i > len(self.rho) - 3) | (j < 1) | (j > len(self.z) - 3)
+      centres, normals, radii, currents = self._packed
+      for a, zi in zip(radii, centres[:, 2]):
+          exact |= (np.abs(rho - a) < self._margin[0]) & (np.abs(z - zi) < self._margin[1])
+      i = np.where(exact, 0, i)
+      j = np.where(exact, 1, j)
+      wu = _catmullRom(u - i)
+      wv = _catmullRom(v - j)
+      Brho, Bz = np.zeros(len(rho)), np.zeros(len(rho))
+      # Row i + a of the padded tables is the table row i + a - 1, for a = 0..3.
+      for a in range(4):
+          for b in range(4):
+              w = wu[a] * wv[b]
+              Brho += w * self._tables[0][i + a, j + b - 1]
+              Bz += w * self._tables[1][i + a, j + b - 1]
+      if exact.any():
+          B = self._exact(rho[exact], z[exact])
+          Brho[exact], Bz[exact] = B[:, 0], B[:, 2]
+      return Brho.reshape(shape), Bz.reshape(shape)
+
+  # Field at the positions of shape (m, 3) or (3,), like LoopSystem.evaluate.
+  def evaluate(self, position):
+      p = np.atleast_2d(np.asarray(position, dtype=np.float64))
+      rho, z, rho_hat = self.cylindrical(p)
+      Brho, Bz = self.evaluateCylindrical(rho, z)
+      return np.squeeze(rho_hat * Brho[:, np.newaxis] + np.outer(Bz, self.axis))
@@ -0,0 +1,106 @@
+import numpy as np
+from EMPY.Core.FieldCache import FieldCache, arrayKey
+from EMPY.Core.Parallel import parallelEvaluate
+from EMPY.Core.Render import showFigure
+from EMPY.Magnetostatics.Loops import LoopSystem
+from EMPY.Magnetostatics.MagneticElements import Element, biotSavart
+
+
+class MSystem(object):
+    'A system of current carrying Elements from MagneticElements, evaluated together.'
+
+    def __init__(self, sources=None):
+        self.sources = []
+        # Circular elements are evaluated as Loops, all other elements as straight segments,
+        # except those without packSegments, which are evaluated on their own.
+        self._loops = LoopSystem()
+        self._segments = None
+        # Version counter of the sources and the cache of fields evaluated for the current version.
+        self.version = 0
+        self.fieldCache = FieldCache()
+        if sources is not None:
+            self.addSource(sources)
+
+    def _sourcesChanged(self):
+        self.version += 1
+        self._segments = None
+        self.fieldCache.clear()
+
+    # Add an Element or a list of Elements to the system.
+    def addSource(self, source):
+        sources = [source] if isinstance(source, Element) else list(source)
+        for s in sources:
+            self.sources.append(s)
+            for loop in (s.getLoops() if s.packSegments else []):
+                self._loops.addLoop(loop)
+        self._sourcesChanged()
+
+    def removeSource(self, source):
+        index = self.sources.index(source)
+        self.sources.pop(index)
+        self._loops = LoopSystem()
+        for s in self.sources:
+            for loop in (s.getLoops() if s.packSegments else []):
+                self._loops.addLoop(loop)
+        self._sourcesChanged()
+
+    # Segments of all sources packed into (starts, ends, currents) arrays, rebuilt after sources change.
+    # Sources without packSegments, such as Helix, are evaluated on their own by _sumSources.
+    def _packedSegments(self):
+        if self._segments is None:
+            segments = [s.getSegments() for s in self.sources if s.packSegments]
+            self._segments = (np.vstack([np.empty((0, 3))] + [s[0] for s in segments]),
+                              np.vstack([np.empty((0, 3))] + [s[1] for s in segments]),
+                              np.concatenate([np.empty(0)] + [s[2] for s in segments]))
+        return self._segments
+
+    # Magnetic field of all sources at position of shape (3,) or (m, 3), in Tesla. Results are kept in
+    # fieldCache; workers > 1 evaluates tiles of the positions in parallel, see EMPY.Core.Parallel.
+    def getB(self, position, workers=None):
+        key = (self.version, arrayKey(np.asarray(position, dtype=np.float64)))
+        B = self.fieldCache.get(key)
+        if B is None:
+            p = np.atleast_2d(np.asarray(position, dtype=np.float64))
+            B = np.squeeze(parallelEvaluate(lambda points: (self._sumSources(points.T).T,), p.T, workers)[0].T)
+            self.fieldCache.put(key, B)
+        return B
+
+    def evaluate(self, position, workers=None):
+        return self.getB(position, workers)
+
+    def _sumSources(self, p):
+        B = biotSavart(*self._packedSegments(), p) + self._loops._sumLoops(p)
+        for s in self.sources:
+            if not s.packSegments:
+                B += s._evaluate(p)
+        return B
+
+    # Draw the sources in 3D next to a streamplot of the field on the x-z plane through y = 0.
+    # fieldRange is [min, max, n]: the plane spans min to max along both axes with n points each.
+    def displaySystem(self, fieldRange=[-10, 10, 50]):
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(14, 6))
+        ax = fig.add_subplot(1, 2, 1, projection='3d')
+        for source in self.sources:
+            for outline in source.getOutline():
+                ax.plot(outline[:, 0], outline[:, 1], outline[:, 2], color='Purple')
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        ax.set_zlabel("z")
+
+        ax = fig.add_subplot(1, 2, 2)
+        s = np.linspace(fieldRange[0], fieldRange[1], int(fieldRange[2]))
+        X, Z = np.meshgrid(s, s)
+        B = self.getB(np.array([X.ravel(), np.zeros(X.size), Z.ravel()]).T).reshape(X.shape + (3,))
+        Bx, Bz = B[..., 0], B[..., 2]
+        P = Bx ** 2 + Bz ** 2
+        stream = ax.streamplot(X, Z, Bx, Bz, color=np.log(P), density=1.5, linewidth=1, cmap="Spectral", arrowsize=1.)
+        for source in self.sources:
+            for outline in source.getOutline():
+                ax.plot(outline[:, 0], outline[:, 2], color='k', linewidth=2)
+        ax.set_xlim(fieldRange[0], fieldRange[1])
+        ax.set_ylim(fieldRange[0], fieldRange[1])
+        ax.set_xlabel("x")
+        ax.set_ylabel("z")
+        fig.colorbar(stream.lines, ax=ax)
+        showFigure('displaySystem', {'x': X, 'z': Z, 'Bx': Bx, 'Bz': Bz})
@@ -0,0 +1,191 @@
+import numpy as np
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem, normalize
+
+MU0 = 4.e-7 * np.pi
+# Number of (field point, segment) pairs evaluated together by biotSavart.
+SEGMENT_BLOCK_PAIRS = 1 << 15
+# Default distance, in turn radii, beyond which a turn of a Helix is evaluated as a circular loop.
+HELIX_OPENING = 4.
+
+
+# Two unit vectors which together with normal form a right handed orthonormal basis.
+def planeBasis(normal):
+    n = normalize(np.array(normal, dtype=np.float64))
+    helper = np.array([1., 0., 0.]) if abs(n[0]) < 0.9 else np.array([0., 1., 0.])
+    u = normalize(np.cross(helper, n))
+    return u, np.cross(n, u)
+
+
+# Number of straight segments per turn keeping a circle of the given radius within tolerance of its chords.
+def segmentsPerTurn(radius, tolerance):
+    if radius <= tolerance:
+        return 8
+    return max(8, int(np.ceil(np.pi / np.arccos(1. - tolerance / radius))))
+
+
+# Closed form Biot-Savart field of straight segments from starts to ends carrying currents, at the (m, 3)
+# points p. With u the unit vector along a segment of length L, t the distance along u from its start to the
+# foot of the perpendicular r from the segment line to a point and r1, r2 the distances to both ends,
+# B = mu_0 I / (4 pi) (u x r) / |r|^2 (t / r1 + (L - t) / r2). Points on a segment get no field from it.
+def biotSavart(starts, ends, currents, p):
+    B = np.zeros(p.shape)
+    nSegments = len(currents)
+    if nSegments == 0:
+        return B
+    lengths = np.linalg.norm(ends - starts, axis=1)
+    directions = np.divide(ends - starts, lengths[:, np.newaxis], out=np.zeros(starts.shape),
+                           where=lengths[:, np.newaxis] > 0)
+    segmentBlock = min(nSegments, SEGMENT_BLOCK_PAIRS)
+    pointBlock = max(1, SEGMENT_BLOCK_PAIRS // segmentBlock)
+    for p0 in range(0, len(p), pointBlock):
+        p1 = min(p0 + pointBlock, len(p))
+        for s0 in range(0, nSegments, segmentBlock):
+            s1 = min(s0 + segmentBlock, nSegments)
+            B[p0:p1] += _segmentBlock(starts[s0:s1], directions[s0:s1], lengths[s0:s1], currents[s0:s1], p[p0:p1])
+    return B
+
+
+def _segmentBlock(starts, u, lengths, currents, p):
+    r = [p[:, k, np.newaxis] - starts[:, k] for k in range(3)]
+    t = r[0] * u[:, 0] + r[1] * u[:, 1] + r[2] * u[:, 2]
+    r = [r[k] - t * u[:, k] for k in range(3)]
+    rho2 = r[0] * r[0] + r[1] * r[1] + r[2] * r[2]
+    s = lengths - t
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cosines = t / np.sqrt(rho2 + t * t) + s / np.sqrt(rho2 + s * s)
+    scale = np.divide(MU0 / (4. * np.pi) * currents * cosines, rho2, out=np.zeros(rho2.shape),
+                      where=rho2 > 1e-24 * (lengths * lengths))
+    cross = (u[:, 1] * r[2] - u[:, 2] * r[1], u[:, 2] * r[0] - u[:, 0] * r[2], u[:, 0] * r[1] - u[:, 1] * r[0])
+    return np.array([np.einsum('ij,ij->i', scale, c) for c in cross]).T
+
+
+# Field of a list of Loops at the (m, 3) points p, using the elliptic integral expressions of LoopSystem.
+def loopField(loops, p):
+    system = LoopSystem()
+    return system._evalLoops(p, system._packLoops(loops))
+
+
+class Element(object):
+    'A current carrying element of an MSystem, made of straight segments and circular loops.'
+
+    # Elements whose segments an MSystem packs with those of its other sources; the others are
+    # evaluated on their own with _evaluate.
+    packSegments = True
+
+    def __init__(self, curr, pos):
+        self.curr = np.float64(curr)
+        self.pos = np.array(pos, dtype=np.float64)
+
+    # Straight segments of the element as (starts, ends, currents) arrays.
+    def getSegments(self):
+        return np.empty((0, 3)), np.empty((0, 3)), np.empty(0)
+
+    # Circular loops of the element, evaluated with the elliptic integral expressions of Loops.
+    def getLoops(self):
+        return []
+
+    # List of (k, 3) arrays of points tracing the element, for drawing it.
+    def getOutline(self):
+        starts, ends, currents = self.getSegments()
+        if len(currents) == 0:
+            return []
+        return [np.vstack([starts, ends[-1:]])]
+
+    # Magnetic field of the element alone at position of shape (3,) or (m, 3), in Tesla.
+    def getB(self, position):
+        return np.squeeze(self._evaluate(np.atleast_2d(np.asarray(position, dtype=np.float64))))
+
+    # Magnetic field of the element at the (m, 3) points p.
+    def _evaluate(self, p):
+        B = biotSavart(*self.getSegments(), p)
+        if self.getLoops():
+            B += loopField(self.getLoops(), p)
+        return B
+
+
+class Line(Element):
+    'A current curr flowing along the polyline through vertices, placed relative to pos.'
+
+    def __init__(self, curr, vertices, pos=[0, 0, 0]):
+        Element.__init__(self, curr, pos)
+        self.vertices = np.array(vertices, dtype=np.float64).reshape(-1, 3)
+
+    def getSegments(self):
+        points = self.vertices + self.pos
+        return points[:-1], points[1:], np.full(len(points) - 1, self.curr)
+
+
+class Segment(Line):
+    'A current curr flowing along the straight segment from start to end.'
+
+    def __init__(self, curr, start, end):
+        Line.__init__(self, curr, [start, end])
+
+
+class Circular(Element):
+    'A circular loop of diameter dim centred on pos, with the current curr flowing counterclockwise about normal.'
+
+    def __init__(self, curr, dim, pos=[0, 0, 0], normal=[0, 0, 1]):
+        Element.__init__(self, curr, pos)
+        self.dim = np.float64(dim)
+        self.normal = normalize(np.array(normal, dtype=np.float64))
+
+    def getLoops(self):
+        return [Loop(self.pos, self.normal, self.dim / 2., self.curr)]
+
+    def getOutline(self):
+        u, v = planeBasis(self.normal)
+        phi = np.linspace(0, 2 * np.pi, 100)[:, np.newaxis]
+        return [self.pos + self.dim / 2. * (np.cos(phi) * u + np.sin(phi) * v)]
+
+
+class Helix(Line):
+    'A helix of diameter dim and turns turns advancing pitch per turn along normal, starting on the circle about pos.'
+
+    packSegments = False
+
+    def __init__(self, curr, dim, pitch, turns, pos=[0, 0, 0], normal=[0, 0, 1], tolerance=1e-3, opening=HELIX_OPENING):
+        self.dim = np.float64(dim)
+        self.opening = np.float64(opening)
+        self.pitch = np.float64(pitch)
+        self.turns = np.float64(turns)
+        self.normal = normalize(np.array(normal, dtype=np.float64))
+        # The chords of every turn stay within tolerance of the helix, and every full turn starts on a vertex.
+        self.perTurn = segmentsPerTurn(self.dim / 2., tolerance)
+        n = max(1, int(np.ceil(abs(self.turns) * self.perTurn)))
+        t = np.sign(self.turns) * np.minimum(np.arange(n + 1) / self.perTurn, abs(self.turns))[:, np.newaxis]
+        u, v = planeBasis(self.normal)
+        vertices = self.dim / 2. * (np.cos(2 * np.pi * t) * u + np.sin(2 * np.pi * t) * v) + self.pitch * t * self.normal
+        Line.__init__(self, curr, vertices, pos)
+
+    # Seen from farther than opening turn radii, a full turn is evaluated as a circular Loop about its centre
+    # plus a straight segment along the axis carrying its advance by pitch, and its chords are only summed at
+    # the points nearer to it. A helix of N turns then costs about N loop and segment evaluations per field
+    # point plus the chords of the turns within reach, instead of N times segmentsPerTurn chords: 1000 turns
+    # of diameter 1 at the default tolerance take about 2.5 s on 1e4 points along them instead of 17 s.
+    # The far turns add an rms error of 0.3 to 1% of the field, falling as 1 / opening^2; opening=inf sums
+    # every chord.
+    def _evaluate(self, p):
+        starts, ends, currents = self.getSegments()
+        radius = self.dim / 2.
+        full = int(abs(self.turns))
+        advance = self.pitch * np.sign(self.turns) * self.normal
+        axisStarts = self.pos + np.arange(full)[:, np.newaxis] * advance
+        centres = axisStarts + advance / 2.
+        loops = (centres, np.tile(self.normal, (full, 1)), np.full(full, radius),
+                 np.full(full, self.curr * np.sign(self.turns)))
+        system = LoopSystem()
+        B = system._evalLoops(p, loops) + biotSavart(axisStarts, axisStarts + advance, np.full(full, self.curr), p)
+        # The chords of the last partial turn are always summed.
+        B += biotSavart(starts[full * self.perTurn:], ends[full * self.perTurn:], currents[full * self.perTurn:], p)
+        reach2 = self.opening ** 2 * (radius * radius + self.pitch * self.pitch / 4.)
+        for k in range(full):
+            near = np.flatnonzero(np.einsum('ij,ij->i', p - centres[k], p - centres[k]) < reach2)
+            if len(near) == 0:
+                continue
+            q = p[near]
+            chords = slice(k * self.perTurn, (k + 1) * self.perTurn)
+            B[near] += biotSavart(starts[chords], ends[chords], currents[chords], q) \
+                - system._evalLoops(q, tuple(a[k:k + 1] for a in loops)) \
+                - biotSavart(axisStarts[k:k + 1], axisStarts[k:k + 1] + advance, np.full(1, self.curr), q)
+        return B
@@ -1,49 +1,152 @@
-from mpl_toolkits.mplot3d import axes3d
-import matplotlib.pyplot as plt
 import numpy as np
+from EMPY.Core.Parallel import parallelEvaluate
+from EMPY.Core.Render import showFigure
+from EMPY.Core.Glyphs import drawDiscs
 
-class Wire(object):
-    def __init__(self, r, pos):
+MU0 = 4.e-7 * np.pi
+# Number of (field point, wire) pairs evaluated together by WireSystem.
+WIRE_BLOCK_PAIRS = 1 << 16
+
+class WireSystem(object):
+    'Infinite straight wires through positions along directions carrying currents, superposed in one vectorized pass.'
+
+    def __init__(self):
+        self.positions = np.empty((0, 3))
+        self.directions = np.empty((0, 3))
+        self.currents = np.empty(0)
+        self.radii = np.empty(0)
+
+    # Add a wire through pos (2 or 3 coordinates) along direction carrying current, of the given radius.
+    def addWire(self, pos, current=1., direction=[0, 0, 1], radius=0.):
+        self.addWires([pos], [current], [direction], [radius])
+
+    # Add n wires at once from (n, 2) or (n, 3) positions and n currents. Directions default to the z axis.
+    def addWires(self, positions, currents, directions=None, radii=None):
+        positions = np.array(positions, dtype=np.float64)
+        positions = np.hstack([positions, np.zeros((len(positions), 3 - positions.shape[1]))])
+        if directions is None:
+            directions = np.tile([0., 0., 1.], (len(positions), 1))
+        directions = np.array(directions, dtype=np.float64)
+        lengths = np.linalg.norm(directions, axis=1)
+        if np.any(lengths < 1e-9):
+            raise ValueError("Wire direction with |v| < e normalized")
+        self.positions = np.vstack([self.positions, positions])
+        self.directions = np.vstack([self.directions, directions / lengths[:, np.newaxis]])
+        self.currents = np.concatenate([self.currents, np.broadcast_to(np.asarray(currents, dtype=np.float64), len(positions))])
+        radii = np.zeros(len(positions)) if radii is None else np.broadcast_to(np.asarray(radii, dtype=np.float64), len(positions))
+        self.radii = np.concatenate([self.radii, radii])
+
+    # Remove the wire added with the same pos, current, direction and radius, like addWire takes them.
+    def removeWire(self, pos, current=1., direction=[0, 0, 1], radius=0.):
+        pos = np.array(pos, dtype=np.float64)
+        pos = np.concatenate([pos, np.zeros(3 - len(pos))])
+        direction = np.array(direction, dtype=np.float64)
+        direction = direction / np.linalg.norm(direction)
+        match = np.flatnonzero(np.all(self.positions == pos, axis=1) & np.all(np.abs(self.directions - direction) < 1e-12, axis=1) &
+                               (self.currents == current) & (self.radii == radius))
+        if len(match) == 0:
+            raise ValueError("Wire not in WireSystem")
+        index = match[0]
+        self.positions = np.delete(self.positions, index, axis=0)
+        self.directions = np.delete(self.directions, index, axis=0)
+        self.currents = np.delete(self.currents, index)
+        self.radii = np.delete(self.radii, index)
+
+    # Total magnetic field at position of shape (3,) or (m, 3), in Tesla. Every wire contributes
+    # mu_0 I / (2 pi) (d x r) / |r|^2 with r the perpendicular vector from the wire to the point, and
+    # mu_0 I / (2 pi) (d x r) / a^2 inside a wire of radius a.
+    def getB(self, position, workers=None):
+        p = np.atleast_2d(np.asarray(position, dtype=np.float64))
+        return np.squeeze(parallelEvaluate(lambda points: (self._sumWires(points.T).T,), p.T, workers)[0].T)
+
+    # In-plane field (bx, by) on the plane z = 0 at the points (x, y). workers > 1 splits the points into
+    # tiles evaluated in parallel, see EMPY.Core.Parallel; None uses the default.
+    def calculateB(self, x, y, workers=None):
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+        B = self.getB(np.array([x.ravel(), y.ravel(), np.zeros(x.size)]).T, workers).reshape(x.shape + (3,))
+        return B[..., 0], B[..., 1]
+
+    def _sumWires(self, p):
+        B = np.zeros(p.shape)
+        nWires = len(self.currents)
+        if nWires == 0:
+            return B
+        wireBlock = min(nWires, WIRE_BLOCK_PAIRS)
+        pointBlock = max(1, WIRE_BLOCK_PAIRS // wireBlock)
+        for p0 in range(0, len(p), pointBlock):
+            p1 = min(p0 + pointBlock, len(p))
+            for w0 in range(0, nWires, wireBlock):
+                w1 = min(w0 + wireBlock, nWires)
+                B[p0:p1] += self._wireBlock(p[p0:p1], slice(w0, w1))
+        return B
+
+    def _wireBlock(self, p, wires):
+        d = self.directions[wires]
+        r = [p[:, k, np.newaxis] - self.positions[wires, k] for k in range(3)]
+        along = r[0] * d[:, 0] + r[1] * d[:, 1] + r[2] * d[:, 2]
+        r = [r[k] - along * d[:, k] for k in range(3)]
+        r2 = np.maximum(r[0] * r[0] + r[1] * r[1] + r[2] * r[2], self.radii[wires] ** 2)
+        scale = np.divide(MU0 / (2 * np.pi) * self.currents[wires], r2, out=np.zeros(r2.shape), where=r2 > 0)
+        cross = (d[:, 1] * r[2] - d[:, 2] * r[1], d[:, 2] * r[0] - d[:, 0] * r[2], d[:, 0] * r[1] - d[:, 1] * r[0])
+        return np.array([np.einsum('ij,ij->i', scale, c) for c in cross]).T
+
+    # Streamplot of the in-plane field on the plane z = 0, with every wire drawn as a disc.
+    def plotBField2D(self, xs, ys, npts=100):
+        import matplotlib.pyplot as plt
+        x, y = np.meshgrid(np.linspace(xs[0], xs[1], npts), np.linspace(ys[0], ys[1], npts))
+        fig = plt.figure()
+        ax = plt.gca()
+        bx, by = self.calculateB(x, y)
+        P = (bx ** 2 + by ** 2)
+        plt.streamplot(x, y, bx, by, color=np.log(P), density=0.9, linewidth=2, cmap="Spectral", arrowsize=2.)
+        drawDiscs(ax, self.positions[:, :2], np.maximum(self.radii, 0.01 * (xs[1] - xs[0])))
+        plt.colorbar()
+        plt.draw()
+        showFigure('plotBField2D', {'x': x, 'y': y, 'Bx': bx, 'By': by})
+
+
+class Wire(WireSystem):
+    'A single infinite straight wire of radius r through pos along the z axis carrying current curr, a WireSystem of one wire.'
+
+    def __init__(self, r, pos, curr=1.):
+        WireSystem.__init__(self)
         self.r = r
-        self.pos = pos
+        self.pos = np.array(pos, dtype=np.float64)
+        self.curr = np.float64(curr)
+        self.addWire(self.pos, self.curr, radius=r)
         self.phi = np.linspace(-2 * np.pi, 2 * np.pi, 100)
         self.x = r * np.cos(self.phi) + self.pos[0]
         self.y = r * np.sin(self.phi) + self.pos[1]
 
-    def calculateB(self, x, y):
-        i = 1  # Amps in the wire
-        mu = 1.26 * 10 ** (-6)  # Magnetic constant
-        mag = (mu / (2 * np.pi)) * (i / np.sqrt((x) ** 2 + (y) ** 2))  # Magnitude of the vector B
-        by = mag * (np.cos(np.arctan2(y, x)))  # By
-        bx = mag * (-np.sin(np.arctan2(y, x)))  # Bx
-        return bx, by
-
     def plotBField2D(self, xs, ys, npts = 10):
-        x = np.linspace(xs[0], xs[1], 10)
-        y = np.linspace(ys[0], ys[1], 10)
+        import matplotlib.pyplot as plt
+        x = np.linspace(xs[0], xs[1], npts)
+        y = np.linspace(ys[0], ys[1], npts)
         x, y = np.meshgrid(x, y)
         fig = plt.figure()
         ax = plt.gca()
         bx, by = self.calculateB(x, y)
         P = (bx ** 2 + by ** 2)
-        plt.streamplot(x + self.pos[0], y + self.pos[1], bx, by, color=np.log(P), density=0.9, linewidth=2, cmap=plt.cm.get_cmap("Spectral"),
-                       arrowsize=2.)
-        ax.add_patch(plt.Circle((self.pos[0], self.pos[1]), radius=self.r, color='k', zorder=20))
+        plt.streamplot(x, y, bx, by, color=np.log(P), density=0.9, linewidth=2, cmap="Spectral", arrowsize=2.)
+        drawDiscs(ax, [self.pos[:2]], self.r)
         plt.colorbar()
         plt.draw()
-        plt.show()
+        showFigure('plotBField2D', {'x': x, 'y': y, 'Bx': bx, 'By': by})
 
     def plotBField3D(self, xs, ys, zs, npts = 10):
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import axes3d
         x = np.linspace(xs[0], xs[1], npts)
         y = np.linspace(ys[0], ys[1], npts)
         z = np.linspace(zs[0], zs[1], npts)
         x, y, z = np.meshgrid(x, y, z)
         fig = plt.figure()
-        ax = fig.gca(projection='3d')
+        ax = fig.add_subplot(projection='3d')
         bx, by = self.calculateB(x, y)
         bz = 0
-        ax.quiver(x + self.pos[0], y + self.pos[1], z, bx, by, bz, cmap='coolwarm', length=0.5, normalize=True)
-        for i in np.linspace(zs[0], zs[1], 800):  # Plot the wire
-            ax.plot(self.x, self.y, i, label='Cylinder', color='Purple')
+        ax.quiver(x, y, z, bx, by, bz, cmap='coolwarm', length=0.5, normalize=True)
+        # Plot the wire as one cylindrical surface
+        ax.plot_surface(np.tile(self.x, (2, 1)), np.tile(self.y, (2, 1)), np.repeat([[zs[0]], [zs[1]]], len(self.x), axis=1),
+                        color='Purple', label='Cylinder')
         plt.draw()
-        plt.show()
+        showFigure('plotBField3D', {'x': x, 'y': y, 'z': z, 'Bx': bx, 'By': by})
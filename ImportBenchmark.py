@@ -0,0 +1,89 @@
+'''
+__/\\\\\\\\\\\\\\\_        __/\\\\____________/\\\\_        __/\\\\\\\\\\\\\___        __/\\\________/\\\_
+ _\/\\\///////////__        _\/\\\\\\________/\\\\\\_        _\/\\\/////////\\\_        _\///\\\____/\\\/__
+  _\/\\\_____________        _\/\\\//\\\____/\\\//\\\_        _\/\\\_______\/\\\_        ___\///\\\/\\\/____
+   _\/\\\\\\\\\\\_____        _\/\\\\///\\\/\\\/_\/\\\_        _\/\\\\\\\\\\\\\/__        _____\///\\\/______
+    _\/\\\///////______        _\/\\\__\///\\\/___\/\\\_        _\/\\\/////////____        _______\/\\\_______
+     _\/\\\_____________        _\/\\\____\///_____\/\\\_        _\/\\\_____________        _______\/\\\_______
+      _\/\\\_____________        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+       _\/\\\\\\\\\\\\\\\_        _\/\\\_____________\/\\\_        _\/\\\_____________        _______\/\\\_______
+        _\///////////////__        _\///______________\///__        _\///______________        _______\///________
+
+    ________          __                                              __  _         ____        __  __
+   / ____/ ___  _____/ /__________  ____ ___  ____ _____ _____  ___  / /_(______   / __ \__  __/ /_/ /_  ____  ____
+  / __/ / / _ \/ ___/ __/ ___/ __ \/ __ `__ \/ __ `/ __ `/ __ \/ _ \/ __/ / ___/  / /_/ / / / / __/ __ \/ __ \/ __ \
+ / /___/ /  __/ /__/ /_/ /  / /_/ / / / / / / /_/ / /_/ / / / /  __/ /_/ / /__   / ____/ /_/ / /_/ / / / /_/ / / / /
+/_____/_/\___/\___/\__/_/   \____/_/ /_/ /_/\__,_/\__, /_/ /_/\___/\__/_/\___/  /_/    \__, /\__/_/ /_/\____/_/ /_/
+                                                 /____/                               /____/
+Author: V Vijendran
+File: ImportBenchmark.py
+Date: 18/10/2026
+Description: Import time benchmark of the EMPY modules.
+             Every module is imported in a fresh interpreter, with mayavi, matplotlib and vtk
+             blocked to stand in for a worker image without plotting stacks. The best time of
+             several runs and the heavy libraries that ended up loaded are reported.
+
+Usage: python ImportBenchmark.py [module ...] [--repeat n] [--allow-plotting]. Requires sys, subprocess, argparse and json libraries.
+'''
+
+import sys
+import json
+import argparse
+import subprocess
+
+MODULES = ['EMPY.Electrostatics.System3D', 'EMPY.Electrostatics.System', 'EMPY.Magnetostatics.Loops',
+           'EMPY.Magnetostatics.MSystem', 'EMPY.Magnetostatics.Wire']
+# Libraries the compute core should not load on import.
+HEAVY = ['scipy', 'matplotlib', 'mayavi', 'vtk', 'PyQt5', 'pyface', 'traits']
+BLOCKED = ['mayavi', 'matplotlib', 'vtk', 'mpl_toolkits']
+
+# Run in the child interpreter: block the plotting packages, time the import and list the heavy modules.
+CHILD = '''
+import sys, time, json, importlib.abc
+class Block(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name.split('.')[0] in %(blocked)r:
+            raise ImportError('blocked by ImportBenchmark: ' + name)
+if %(block)r:
+    sys.meta_path.insert(0, Block())
+start = time.perf_counter()
+import numpy
+numpyTime = time.perf_counter() - start
+start = time.perf_counter()
+import %(module)s
+moduleTime = time.perf_counter() - start
+print(json.dumps({'numpy': numpyTime, 'module': moduleTime,
+                  'loaded': [m for m in %(heavy)r if m in sys.modules]}))
+'''
+
+
+def importTime(module, block=True):
+    code = CHILD % {'module': module, 'blocked': BLOCKED, 'block': block, 'heavy': HEAVY}
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return {'error': result.stderr.strip().splitlines()[-1]}
+    return json.loads(result.stdout)
+
+
+def benchmark(modules, repeat=5, block=True):
+    print("%-32s %12s %12s  %s" % ("module", "numpy (ms)", "EMPY (ms)", "heavy libraries loaded"))
+    for module in modules:
+        runs = [importTime(module, block) for _ in range(repeat)]
+        failed = [r for r in runs if 'error' in r]
+        if failed:
+            print("%-32s failed: %s" % (module, failed[0]['error']))
+            continue
+        numpyTime = min(r['numpy'] for r in runs)
+        moduleTime = min(r['module'] for r in runs)
+        print("%-32s %12.1f %12.1f  %s" % (module, 1e3 * numpyTime, 1e3 * moduleTime,
+                                            ', '.join(runs[0]['loaded']) or 'none'))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Time importing EMPY modules in fresh interpreters.")
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--allow-plotting', action='store_true',
+                        help="do not block mayavi, matplotlib and vtk")
+    args = parser.parse_args()
+    benchmark(args.modules, args.repeat, not args.allow_plotting)
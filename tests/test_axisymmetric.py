@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from EMPY.Magnetostatics import Loops
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+
+
+def coil(n=40):
+    system = LoopSystem()
+    for k in range(n):
+        system.addLoop(Loop([1., 2., 0.05 * k], [0., 0., 1. if k % 3 else -1.], 1. + 0.01 * k, 1.))
+    return system
+
+
+def test_evaluate_interpolates_large_coaxial_evaluations(monkeypatch):
+    system = coil()
+    points = np.random.default_rng(0).random((Loops.AXISYMMETRIC_MIN_POINTS, 3)) * [6, 6, 8] - [2, 1, 2]
+    exact = LoopSystem._sumLoopsParallel(system, points)
+
+    def summed(*args, **kwargs):
+        raise AssertionError("coaxial loops summed at every point")
+    monkeypatch.setattr(system, '_sumLoopsParallel', summed)
+    error = np.linalg.norm(system.evaluate(points) - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.sqrt(np.mean(error ** 2)) < 1e-4
+
+
+def test_exact_mode_and_small_evaluations_sum_every_loop():
+    system = coil()
+    points = np.random.default_rng(1).normal(size=(100, 3))
+    assert np.array_equal(system.evaluate(points), system._sumLoops(points))
+    system.setAxisymmetricMode('exact')
+    assert system.coaxialAxis() is not None
+    with pytest.raises(ValueError):
+        system.setAxisymmetricMode('table')
+
+
+def test_axisymmetric_field_matches_the_loops():
+    system = coil()
+    field = system.axisymmetricField(3., (-1., 3.))
+    points = np.random.default_rng(2).normal(size=(500, 3)) * 0.7 + [1., 2., 1.]
+    exact = system.evaluate(points)
+    error = np.linalg.norm(field.evaluate(points) - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.sqrt(np.mean(error ** 2)) < 1e-3
+    origin, axis = system.coaxialAxis()
+    s = np.array([0.3, 1.])
+    assert np.allclose(system.onAxisField(s), system.evaluate(origin + np.outer(s, axis)).dot(axis))
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from EMPY.Electrostatics.System import System
+from EMPY.Electrostatics.System3D import System3D
+from EMPY.Electrostatics.Elements import Segment
+from EMPY.Electrostatics.Elements3D import Arc3D
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+
+rng = np.random.default_rng(0)
+q = rng.normal(size=8)
+grid2D = tuple(np.meshgrid(np.linspace(-1, 2, 9), np.linspace(-1, 2, 7)))
+grid3D = tuple(rng.random((3, 5, 6)) * 3 - 1)
+
+
+def assertSameFields(a, b):
+    for x, y in zip(a, b):
+        assert np.allclose(x, y, rtol=1e-10, atol=1e-12 * np.abs(y).max())
+
+
+def test_2D_basis_superposes_like_the_system():
+    positions = rng.random((8, 2))
+    system = System()
+    system.add_Charges(q, positions)
+    system.add_Element(Segment(2., [0., -0.5], [1., -0.5]))
+    basis = system.basisField(grid2D)
+    assert basis.size() == 9
+    assertSameFields(basis.evaluate(), system.EV_Total(grid2D))
+
+    weights = rng.normal(size=9)
+    scaled = System()
+    scaled.add_Charges(weights[:8], positions)
+    scaled.add_Element(Segment(2. * weights[8], [0., -0.5], [1., -0.5]))
+    assertSameFields(basis.evaluate(weights), scaled.EV_Total(grid2D))
+
+    frames = list(basis.frames([weights, 2. * weights], memoryBudget=1))
+    assertSameFields(frames[1], tuple(2. * v for v in basis.evaluate(weights)))
+    with pytest.raises(ValueError):
+        basis.evaluate(np.ones(3))
+
+
+def test_3D_groups_scale_their_present_charges():
+    positions = rng.random((8, 3))
+    system = System3D.fromArrays(q, positions)
+    system.add_Element(Arc3D(1., [0.5, 0.5, -0.5], 0.7))
+    groups = [np.arange(5), np.arange(5, 8)]
+    basis = system.basisField(grid3D, groups=groups, potential=False)
+    assertSameFields(basis.evaluate(), system.E_Total(grid3D))
+
+    scaled = System3D.fromArrays(np.concatenate([3. * q[:5], -q[5:]]), positions)
+    scaled.add_Element(Arc3D(0.5, [0.5, 0.5, -0.5], 0.7))
+    assertSameFields(basis.evaluate([3., -1., 0.5]), scaled.E_Total(grid3D))
+
+
+def test_loop_basis_superposes_like_the_system():
+    points = rng.normal(size=(300, 3))
+    loops = [Loop([0., 0., k], [0.2 * k, 0., 1.], 1. + 0.1 * k, 1.) for k in range(3)]
+    system = LoopSystem()
+    for loop in loops:
+        system.addLoop(loop)
+    currents = [2., -1., 0.5]
+    scaled = LoopSystem()
+    for loop, current in zip(loops, currents):
+        scaled.addLoop(Loop(loop.p, loop.n, loop.r, current))
+    assert np.allclose(system.basisField(points).evaluate(currents), scaled.evaluate(points), rtol=1e-12)
+    grouped = system.basisField(points, groups=[loops[:2], loops[2:]])
+    assert np.allclose(grouped.evaluate(), system.evaluate(points), rtol=1e-12)
@@ -0,0 +1,57 @@
+import math
+import numpy as np
+from EMPY.Electrostatics.System import ContinuousSystem
+from EMPY.Electrostatics import Distributions
+
+
+# Charges and positions the builders placed with one Charge object per sample.
+def scalarLineCharge(pX, pY, l, density, Q):
+    return [(Q / density, [pX(i / density), pY(i / density)]) for i in range(int(l * density))]
+
+
+def scalarPlate(dim, vertex, density, Q):
+    sigma = Q / (dim[0] * dim[1] * density ** 2)
+    return [(sigma, [i / density + vertex[0], j / density + vertex[1]])
+            for i in range(int(dim[0] * density)) for j in range(int(dim[1] * density))]
+
+
+def assertCharges(system, charges):
+    assert np.allclose(system.packedCharges.getCharges(), [q for q, pos in charges])
+    assert np.allclose(system.packedCharges.getPositions(), [pos for q, pos in charges])
+
+
+def test_line_charge_matches_the_scalar_loop():
+    for pX, pY in [(lambda t: np.cos(t), lambda t: 2 * t), (math.cos, math.sin),
+                   (lambda t: t if t < 0.5 else 0.5, lambda t: 0.)]:
+        system = ContinuousSystem()
+        system.line_charge(pX, pY, 1., 10, 1.)
+        assertCharges(system, scalarLineCharge(pX, pY, 1., 10, 1.))
+
+
+def test_plate_matches_the_scalar_loop():
+    system = ContinuousSystem()
+    system.plate([2., 1.5], [-1., 0.5], 4, 3.)
+    assertCharges(system, scalarPlate([2., 1.5], [-1., 0.5], 4, 3.))
+
+
+def test_sample_parametric_calls_scalar_functions_per_sample():
+    t = np.linspace(0, 1, 5)
+    assert np.allclose(Distributions.sampleParametric(lambda s: 1. if s > 0.5 else -1., t), [-1, -1, -1, 1, 1])
+    assert np.allclose(Distributions.sampleParametric(lambda s: 2., t), 2.)
+    assert np.allclose(Distributions.sampleParametric(math.exp, t), np.exp(t))
+
+
+def test_builders_spread_their_total_charge():
+    samples = [Distributions.line([0, 0, 0], [1, 2, 3], 7), Distributions.ring([0, 0, 0], 2., 9, [1, 0, 1]),
+               Distributions.helix([0, 0, 0], 1., 0.5, 3, 40), Distributions.disk([0, 0, 0], 1., 0.1),
+               Distributions.rectangle([0, 0, 0], [1, 0, 0], [0, 1, 1], 3, 4), Distributions.sphereShell([1, 0, 0], 2., 50),
+               Distributions.cylinder([0, 0, 0], 1., 2., 8, 5), Distributions.box([0, 0, 0], [1, 2, 1], 0.25)]
+    for weights, positions in samples:
+        assert np.isclose(weights.sum(), 1.) and len(weights) == len(positions)
+
+
+def test_ring_lies_on_its_circle():
+    weights, positions = Distributions.ring([1, 2, 3], 2., 12, [0, 1, 1])
+    offsets = positions - [1, 2, 3]
+    assert np.allclose(np.linalg.norm(offsets, axis=1), 2.)
+    assert np.allclose(offsets @ np.array([0, 1, 1]), 0.)
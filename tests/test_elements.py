@@ -0,0 +1,50 @@
+import numpy as np
+from EMPY.Electrostatics.System import ContinuousSystem
+
+
+def far(n=200):
+    angle = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return 6 * np.cos(angle), 6 * np.sin(angle)
+
+
+def assertClose(analytic, discrete, rtol):
+    for a, d in zip(analytic.EV_Total(far()), discrete.EV_Total(far())):
+        assert np.sqrt(np.mean((a - d) ** 2)) < rtol * np.sqrt(np.mean(d ** 2))
+
+
+def build(builder, *args):
+    analytic, discrete = ContinuousSystem(), ContinuousSystem()
+    getattr(analytic, builder)(*args, analytic=True)
+    getattr(discrete, builder)(*args)
+    return analytic, discrete
+
+
+def test_analytic_straight_wire_matches_the_discretized_wire():
+    assertClose(*build('straightWire', [0., -0.5], [2., 0.5], 40, 2.), 0.02)
+
+
+def test_analytic_circular_wire_matches_the_discretized_wire():
+    assertClose(*build('circularWire', [0.5, 0.], 1.5, 20, 1.), 0.02)
+
+
+def test_analytic_plate_matches_the_discretized_plate():
+    assertClose(*build('plate', [2., 1.], [-1., -0.5], 20, 3.), 0.02)
+
+
+def test_analytic_line_charge_matches_the_discretized_line_charge():
+    assertClose(*build('line_charge', lambda t: t - 1., lambda t: 0.3 * t * t, 2., 30, 1.), 0.02)
+
+
+def test_analytic_3D_elements_match_the_discretized_builders():
+    from EMPY.Electrostatics.System3D import ContinuousSystem3D
+    from EMPY.Electrostatics.Elements3D import Segment3D, Arc3D, Panel3D
+    points = tuple(np.random.default_rng(0).normal(size=(3, 200)) * 4 + 6)
+    pairs = [(Segment3D(2., [0., 0., 0.], [1., 2., 0.]), ('line', [0., 0., 0.], [1., 2., 0.], 400, 2.)),
+             (Arc3D(-1., [0., 1., 0.], 1.5), ('ring', [0., 1., 0.], 1.5, 400, -1.)),
+             (Panel3D(3., [0., 0., 0.], [1., 0., 0.], [0., 2., 1.]), ('plate', [0., 0., 0.], [1., 0., 0.], [0., 2., 1.], 40, 80, 3.))]
+    for element, (builder, *args) in pairs:
+        analytic, discrete = ContinuousSystem3D(), ContinuousSystem3D()
+        analytic.add_Element(element)
+        getattr(discrete, builder)(*args)
+        for a, d in zip(analytic.EV_Total(points), discrete.EV_Total(points)):
+            assert np.sqrt(np.mean((a - d) ** 2)) < 0.01 * np.sqrt(np.mean(d ** 2))
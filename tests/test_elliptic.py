@@ -0,0 +1,33 @@
+import numpy as np
+from EMPY.Magnetostatics.Elliptic import EllipticTable, referenceIntegrals
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+
+
+def test_table_stays_within_its_tolerance():
+    for tolerance in (1e-6, 1e-10):
+        table = EllipticTable(tolerance)
+        x = np.concatenate([np.linspace(0., 1., 10001), np.exp(np.linspace(np.log(table.xMin) - 3., 0., 10001))])
+        for value, reference in zip(table.evaluate(x.reshape(2, -1)), referenceIntegrals(x.reshape(2, -1))):
+            finite = np.isfinite(reference)
+            assert np.max(np.abs(value[finite] - reference[finite]) / reference[finite]) < tolerance
+        assert table.accuracy()['K_max'] < tolerance
+
+
+def test_table_clips_rounding_below_zero():
+    E, K = EllipticTable().evaluate(np.array([-1e-17, 0.]))
+    assert np.all(E == 1.) and np.all(np.isinf(K))
+
+
+def test_table_mode_matches_scipy_and_refreshes_live_fields():
+    system = LoopSystem()
+    for k in range(5):
+        system.addLoop(Loop([0.1 * k, 0., 0.3 * k], [0., 0.2 * k, 1.], 1. + 0.1 * k, 1. - 0.3 * k))
+    points = np.random.default_rng(0).normal(size=(1000, 3)) * 2
+    live = system.liveField(points)
+    system.addLoop(Loop([0., 0., -1.], [1., 0., 0.], 0.5, 2.))
+    reference = system.evaluate(points)
+    assert live.updates == 1
+    system.setEllipticMode('table')
+    assert live.updates == 0
+    assert np.allclose(system.evaluate(points), reference, rtol=1e-6, atol=1e-12)
+    assert np.array_equal(live.get(), system.evaluate(points))
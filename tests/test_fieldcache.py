@@ -0,0 +1,88 @@
+import numpy as np
+from EMPY.Core.FieldCache import FieldCache, arrayKey
+from EMPY.Electrostatics.Charge import Charge
+from EMPY.Electrostatics.Charge3D import Charge3D
+from EMPY.Electrostatics.System import System
+from EMPY.Electrostatics.System3D import System3D
+from EMPY.Electrostatics.Elements import Segment
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+from EMPY.Magnetostatics.MagneticElements import Segment as CurrentSegment
+from EMPY.Magnetostatics.MSystem import MSystem
+
+grid = np.meshgrid(np.linspace(-1, 1, 9), np.linspace(-1, 1, 7))
+
+
+def test_cache_serves_repeats_and_returns_copies():
+    system = System()
+    system.add_Charge(Charge(1., [0.2, 0.3]))
+    V = system.V_Total(grid)
+    V[...] = 0.
+    assert np.any(system.V_Total(np.meshgrid(np.linspace(-1, 1, 9), np.linspace(-1, 1, 7))) != 0.)
+    assert system.fieldCache.hits == 1
+    system.EV_Total(grid)
+    system.E_Total(grid)
+    assert system.fieldCache.stats()['hits'] == 2
+
+
+def test_adding_and_removing_sources_invalidates_the_cache():
+    system = System()
+    charge, element = Charge(1., [0.2, 0.3]), Segment(1., [0., -1.], [1., -1.])
+    system.add_Charge(charge)
+    before = system.EV_Total(grid)
+    for add, remove in ((system.add_Charge, system.remove_Charge), (system.add_Element, system.remove_Element)):
+        source = Charge(-2., [0.5, 0.5]) if add == system.add_Charge else element
+        add(source)
+        assert not np.allclose(system.EV_Total(grid)[2], before[2])
+        remove(source)
+        assert np.allclose(system.EV_Total(grid), before)
+    system.add_Charges([1., 1.], [[0., 0.], [0.1, 0.1]])
+    assert not np.allclose(system.V_Total(grid), before[2])
+
+
+def test_3D_and_magnetic_systems_invalidate_their_caches():
+    points = tuple(np.random.default_rng(0).random((3, 20)))
+    system = System3D([Charge3D(1., [0., 0., 0.])])
+    V = system.V_Total(points)
+    charge = Charge3D(1., [1., 1., 1.])
+    system.add_Charge3D(charge)
+    assert not np.allclose(system.V_Total(points), V)
+    system.remove_Charge3D(charge)
+    assert np.allclose(system.V_Total(points), V)
+
+    p = np.array(points).T
+    loops = LoopSystem()
+    loops.addLoop(Loop([0, 0, 0], [0, 0, 1], 1., 1.))
+    B = loops.evaluate(p)
+    loop = Loop([0, 0, 1], [1, 0, 0], 0.5, 2.)
+    loops.addLoop(loop)
+    assert not np.allclose(loops.evaluate(p), B)
+    loops.removeLoop(loop)
+    assert np.allclose(loops.evaluate(p), B)
+
+    msystem = MSystem()
+    msystem.addSource(CurrentSegment(1., [0, 0, -1], [0, 0, 1]))
+    B = msystem.getB(p)
+    source = CurrentSegment(1., [1, 0, -1], [1, 0, 1])
+    msystem.addSource(source)
+    assert not np.allclose(msystem.getB(p), B)
+    msystem.removeSource(source)
+    assert np.allclose(msystem.getB(p), B)
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = FieldCache(maxBytes=3 * 800)
+    for k in range(3):
+        cache.put(k, np.zeros(100))
+    cache.get(0)
+    cache.put(3, np.zeros(100))
+    assert 1 not in cache and 0 in cache and 3 in cache and cache.nbytes == 2400
+    cache.put(4, np.zeros(1000))
+    assert 4 not in cache
+    cache.setMaxBytes(800)
+    assert len(cache) == 1 and 3 in cache
+
+
+def test_array_key_depends_on_contents():
+    a = np.linspace(0, 1, 5)
+    assert arrayKey(a) == arrayKey(a.copy()) and arrayKey(a) != arrayKey(a + 1e-12)
+    assert arrayKey(a) != arrayKey(a.reshape(5, 1))
@@ -0,0 +1,62 @@
+import numpy as np
+import scipy.special
+from EMPY.Core.FieldLines import traceFieldLines
+from EMPY.Core.Tiling import Grid
+from EMPY.Electrostatics.System import System
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+
+
+# Flux function rho A_phi of a unit loop of radius a around the z axis, constant along its field lines.
+def loopFlux(rho, z, a=1.):
+    m = 4. * a * rho / ((a + rho) ** 2 + z ** 2)
+    k = np.sqrt(m)
+    return rho * np.sqrt(a / rho) / k * ((1. - m / 2.) * scipy.special.ellipk(m) - scipy.special.ellipe(m))
+
+
+def test_point_charge_lines_are_radial():
+    system = System()
+    system.add_Charges([1.], [[0.2, -0.1]])
+    angles = np.linspace(0., 2. * np.pi, 12, endpoint=False)
+    seeds = np.array([0.2 + 0.5 * np.cos(angles), -0.1 + 0.5 * np.sin(angles)])
+    lines = system.fieldLines(seeds, bounds=[(-2., 2.), (-2., 2.)])
+    assert len(lines) == 12
+    assert np.all(lines.stopReasons() == [['source', 'boundary']])
+    for line, seed in zip(lines, seeds.T - [[0.2, -0.1]]):
+        r = line - np.array([[0.2], [-0.1]])
+        assert np.max(np.abs(r[0] * seed[1] - r[1] * seed[0]) / np.linalg.norm(r, axis=0)) < 1e-9
+        # Outward along the field from the charge to the boundary
+        assert np.all(np.diff(np.linalg.norm(r, axis=0)) > 0)
+
+
+def test_loop_lines_close_on_constant_flux():
+    system = LoopSystem()
+    system.addLoop(Loop([0., 0., 0.], [0., 0., 1.], 1., 1.))
+    seeds = np.array([[1.2, 0., 0.], [1.5, 0., 0.2], [0.5, 0., 0.]])
+    lines = system.fieldLines(seeds, bounds=[(-4., 4.)] * 3, direction='forward')
+    assert np.all(lines.stopReasons()[:, 0] == 'closed')
+    for line, seed in zip(lines, seeds):
+        assert np.max(np.abs(line[1])) < 1e-12
+        flux = loopFlux(np.hypot(line[0], line[1]), line[2])
+        assert np.max(np.abs(flux / loopFlux(np.hypot(seed[0], seed[1]), seed[2]) - 1.)) < 1e-4
+
+
+def test_sampled_lines_follow_the_exact_lines():
+    system = LoopSystem()
+    system.addLoop(Loop([0., 0., 0.], [0., 0., 1.], 1., 1.))
+    grid = Grid([(-2.5, 2.5), (-0.5, 0.5), (-2.5, 2.5)], (81, 5, 81))
+    sampler = system.sampler(grid, exclusionRadius=0.1)
+    seed = np.array([[1.5, 0., 0.]])
+    exact = system.fieldLines(seed, direction='forward', bounds=grid.bounds).line(0)
+    sampled = system.fieldLines(seed, direction='forward', sampler=sampler).line(0)
+    flux = loopFlux(np.abs(sampled[0]), sampled[2])
+    assert np.max(np.abs(flux / loopFlux(1.5, 0.) - 1.)) < 3e-3
+    assert abs(np.ptp(sampled[2]) / np.ptp(exact[2]) - 1.) < 1e-3
+
+
+def test_tracing_stops_at_nulls_and_after_max_steps():
+    uniform = lambda points: np.vstack([np.ones(points.shape[1]), np.zeros(points.shape[1])])
+    lines = traceFieldLines(uniform, np.array([[0., 0.5], [0., 0.]]), [(-1., 1.), (-1., 1.)], step=0.1, maxSteps=3)
+    assert list(lines.stopReasons()[0]) == ['steps', 'steps']
+    assert np.allclose(lines.line(0)[0], np.linspace(-0.3, 0.3, 7))
+    null = traceFieldLines(lambda points: np.zeros(points.shape), np.zeros((2, 1)), [(-1., 1.), (-1., 1.)])
+    assert list(null.stopReasons()[0]) == ['null', 'null']
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from EMPY.Core.Tiling import Grid
+from EMPY.Electrostatics.System import System
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+
+rng = np.random.default_rng(0)
+
+
+def loopSystem():
+    system = LoopSystem()
+    system.addLoop(Loop([0., 0., -0.5], [0., 0., 1.], 1., 1.))
+    system.addLoop(Loop([0.2, 0., 0.5], [0.3, 0., 1.], 0.8, -0.5))
+    return system
+
+
+def relativeError(sampled, exact):
+    return np.abs(sampled - exact).max() / np.abs(exact).max()
+
+
+def test_loop_sampler_interpolates_the_exact_field():
+    system = loopSystem()
+    grid = Grid([(-0.5, 0.5), (-0.5, 0.5), (-0.3, 0.3)], (21, 21, 13))
+    points = rng.random((3, 2000)) * np.array([[0.9], [0.9], [0.5]]) - np.array([[0.45], [0.45], [0.25]])
+    exact = system.evaluate(points.T).T
+    cubic = relativeError(system.sampler(grid).sample(points), exact)
+    linear = relativeError(system.sampler(grid, order=1).sample(points), exact)
+    assert cubic < 1e-4 and cubic < linear / 10 and linear < 1e-2
+    with pytest.raises(ValueError):
+        system.sampler(grid, order=2)
+
+
+def test_refinement_meets_the_tolerance_near_the_wires():
+    system = loopSystem()
+    grid = Grid([(-1.5, 1.5), (-1.5, 1.5), (-1., 1.)], (13, 13, 9))
+    points = rng.random((3, 3000)) * np.array([[3.], [3.], [2.]]) - np.array([[1.5], [1.5], [1.]])
+    exact = system.evaluate(points.T).T
+    coarse = system.sampler(grid, exclusionRadius=0.2)
+    refined = system.sampler(grid, tolerance=1e-3, maxLevel=3, exclusionRadius=0.2)
+    error = np.abs(refined.sample(points) - exact).max(axis=0)
+    assert refined.refinement()['refined'] > 0
+    assert np.sqrt(np.mean(error ** 2)) < np.sqrt(np.mean(np.abs(coarse.sample(points) - exact).max(axis=0) ** 2))
+    assert np.median(error / np.linalg.norm(exact, axis=0)) < 1e-3
+
+
+def test_points_off_the_grid_and_near_sources_are_exact():
+    system = System()
+    system.add_Charges([1., -2., 0.5], [[0., 0.], [1., 0.3], [0.4, 0.8]])
+    grid = Grid([(-1., 2.), (-1., 2.)], (61, 61))
+    sampler = system.sampler(grid, exclusionRadius=0.05, potential=True)
+    points = np.array([[3., -2., 0.01, 1.02, 0.5], [0.5, 0.2, 0.02, 0.31, 0.5]])
+    E = system.E_Total(tuple(points))
+    V = system.V_Total(tuple(points))
+    sampled = sampler.sample(points)
+    assert sampled.shape == (3, 5)
+    assert np.array_equal(sampled[:, :4], np.vstack([E, V])[:, :4])
+    assert np.allclose(sampled[:, 4], np.vstack([E, V])[:, 4], rtol=1e-3)
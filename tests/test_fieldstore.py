@@ -0,0 +1,38 @@
+import json
+import os
+import numpy as np
+from EMPY.Core.Tiling import Grid
+from EMPY.Core.FieldStore import openField
+from EMPY.Electrostatics.System import System
+from EMPY.Electrostatics.System3D import System3D
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+
+rng = np.random.default_rng(0)
+
+
+def test_2D_field_on_disk_matches_a_single_pass(tmp_path):
+    system = System()
+    system.add_Charges(rng.normal(size=20), rng.random((20, 2)))
+    grid = Grid([(-1, 2), (0, 1)], (31, 13))
+    stored = system.evaluateToDisk(str(tmp_path), grid, memoryBudget=8 * 7 * 50)
+    for name, values in zip(('Ex', 'Ey', 'V'), system.EV_Total(tuple(grid.meshgrid()))):
+        assert isinstance(stored[name], np.memmap) and np.allclose(stored[name], values)
+    assert stored.complete and stored.grid.shape == grid.shape
+    with open(os.path.join(str(tmp_path), 'grid.json')) as f:
+        assert json.load(f)['complete']
+
+
+def test_3D_and_loop_fields_on_disk_reopen(tmp_path):
+    system = System3D.fromArrays(rng.normal(size=20), rng.random((20, 3)))
+    grid = Grid([(-1, 2), (-1, 2), (0, 1)], (6, 7, 8))
+    system.evaluateToDisk(str(tmp_path / 'charges'), grid, memoryBudget=8 * 9 * 40, field=False)
+    stored = openField(str(tmp_path / 'charges'))
+    assert stored.names == ['V'] and np.allclose(stored['V'], system.V_Total(tuple(grid.meshgrid())))
+    x, y, z = stored.coordinates((slice(1, 3), slice(None), slice(None)))
+    assert np.array_equal(x, grid.meshgrid()[0][1:3])
+
+    loops = LoopSystem()
+    loops.addLoop(Loop([0.5, 0.5, 0.5], [1, 0, 0], 0.3, 1.))
+    stored = loops.evaluateToDisk(str(tmp_path / 'loops'), grid, memoryBudget=8 * 40 * 60)
+    B = loops.evaluate(np.array([c.ravel() for c in grid.meshgrid()]).T).reshape(grid.shape + (3,))
+    assert np.allclose(np.stack([stored['Bx'], stored['By'], stored['Bz']], axis=-1), B)
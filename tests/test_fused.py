@@ -0,0 +1,64 @@
+import numpy as np
+from EMPY.Electrostatics.Charge import Charge
+from EMPY.Electrostatics.Charge3D import Charge3D
+from EMPY.Electrostatics.System import System
+from EMPY.Electrostatics.System3D import System3D
+from EMPY.Electrostatics.Elements import Segment
+from EMPY.Electrostatics.Elements3D import Arc3D
+
+rng = np.random.default_rng(0)
+charges2D = [Charge(q, pos) for q, pos in zip(rng.normal(size=50), rng.random((50, 2)).tolist())]
+charges3D = [Charge3D(q, pos) for q, pos in zip(rng.normal(size=50), rng.random((50, 3)).tolist())]
+grid2D = np.meshgrid(np.linspace(-1, 2, 15), np.linspace(-1, 2, 12))
+grid3D = tuple(rng.random((3, 4, 5, 6)) * 3 - 1)
+
+
+def system2D():
+    system = System()
+    for charge in charges2D:
+        system.add_Charge(charge)
+    system.add_Element(Segment(2., [0., -0.5], [1., -0.5]))
+    return system
+
+
+def system3D():
+    system = System3D(charges3D)
+    system.add_Element(Arc3D(1., [0.5, 0.5, -0.5], 0.7))
+    return system
+
+
+def test_fused_2D_evaluation_matches_separate_passes():
+    Ex, Ey, V, magnitude = system2D().EV_Total(grid2D, magnitude=True)
+    E = system2D().E_Total(grid2D)
+    assert np.allclose((Ex, Ey), E) and np.allclose(V, system2D().V_Total(grid2D))
+    assert np.allclose(magnitude, np.hypot(*E))
+
+
+def test_fused_3D_evaluation_matches_separate_passes():
+    Ex, Ey, Ez, V, magnitude = system3D().EV_Total(grid3D, magnitude=True)
+    E = system3D().E_Total(grid3D)
+    assert np.allclose((Ex, Ey, Ez), E) and np.allclose(V, system3D().V_Total(grid3D))
+    assert np.allclose(magnitude, np.sqrt(E[0] ** 2 + E[1] ** 2 + E[2] ** 2))
+
+
+def test_packed_charges_match_the_per_charge_sum():
+    system = System()
+    for charge in charges2D:
+        system.add_Charge(charge)
+    Ex, Ey, V = system.EV_Total(grid2D)
+    assert np.allclose(Ex, sum(c.electricField(grid2D)[0] for c in charges2D))
+    assert np.allclose(Ey, sum(c.electricField(grid2D)[1] for c in charges2D))
+    assert np.allclose(V, sum(c.electricPot(grid2D) for c in charges2D))
+    Ex, Ey, Ez, V = System3D(charges3D).EV_Total(grid3D)
+    assert np.allclose(V, sum(c.potentialField(grid3D) for c in charges3D))
+    assert np.allclose(Ez, sum(c.electricField(grid3D)[2] for c in charges3D))
+
+
+def test_charge_fused_evaluation_matches_separate_calls():
+    for charge in (charges2D[0], charges3D[0]):
+        fieldPos = grid2D if len(charge.pos) == 2 else grid3D
+        fused = charge.electricFieldPot(fieldPos, magnitude=True)
+        E = charge.electricField(fieldPos)
+        V = charge.electricPot(fieldPos) if len(charge.pos) == 2 else charge.potentialField(fieldPos)
+        assert np.allclose(fused[:-2], E) and np.allclose(fused[-2], V)
+        assert np.allclose(fused[-1], np.sqrt(sum(Ek ** 2 for Ek in E)))
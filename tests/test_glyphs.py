@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.collections import EllipseCollection, LineCollection, PolyCollection
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from EMPY.Electrostatics.System import DiscreteSystem, ContinuousSystem
+from EMPY.Electrostatics.Elements import Segment, Panel
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+from EMPY.Magnetostatics.Wire import Wire
+
+
+# Keep the figure of a plotting method instead of showing it, and return it.
+@pytest.fixture
+def figure(monkeypatch):
+    figures = []
+    monkeypatch.setattr(plt, 'show', lambda *args, **kwargs: figures.append(plt.gcf()))
+    yield figures
+    plt.close('all')
+
+
+def collections(fig, kind):
+    return [c for ax in fig.axes for c in ax.collections if isinstance(c, kind)]
+
+
+def test_charges_are_one_collection(figure):
+    system = DiscreteSystem()
+    g = np.mgrid[-1:1:20j, -1:1:20j].reshape(2, -1).T
+    system.add_Charges(np.full(len(g), 1e-3), g)
+    system.plot_VectField([-2, 2], [-2, 2], resolution=30)
+    discs = collections(figure[0], EllipseCollection)
+    assert len(discs) == 1 and len(discs[0].get_offsets()) == 400
+    assert len(figure[0].axes[0].patches) < 400
+
+
+def test_elements_are_one_collection_each(figure):
+    system = ContinuousSystem()
+    system.add_Charges(np.ones(3), np.array([[0., 1.], [0.5, 1.], [1., 1.]]))
+    for y in (-0.5, -1.):
+        system.add_Element(Segment(1., [-1, y], [1, y]))
+    system.add_Element(Panel(1., [0.5, 0.5], [-1.5, 0.]))
+    system.add_Element(Panel(1., [0.5, 0.5], [1., 0.]))
+    system.plot_VectField([-2, 2], [-2, 2], resolution=30)
+    assert len(collections(figure[0], PolyCollection)) == 1
+    assert len(collections(figure[0], LineCollection)) >= 1
+
+
+def test_loop_markers_do_not_grow_with_loops(figure):
+    system = LoopSystem()
+    for k in range(10):
+        system.addLoop(Loop([k, 0, 0], [1, 0, 0], 1, 1))
+    system.plotBField(-2, 11, 20, -2, 2, 20)
+    assert len(figure[0].axes[0].lines) == 4
+
+
+def test_wire_is_one_surface(figure):
+    Wire(0.2, [0.5, 0]).plotBField3D([-1, 1], [-1, 1], [-1, 1], 4)
+    assert len(collections(figure[0], Poly3DCollection)) == 1
@@ -0,0 +1,25 @@
+import numpy as np
+from EMPY.Magnetostatics.MagneticElements import Helix, Segment, biotSavart
+from EMPY.Magnetostatics.MSystem import MSystem
+
+
+def points(n=500):
+    return np.random.default_rng(0).normal(size=(n, 3)) * 2 + [0., 0., 1.]
+
+
+def test_helix_summing_every_chord_matches_its_segments():
+    for turns in (6.4, -3.5):
+        helix = Helix(1.5, 0.8, 0.3, turns, pos=[0.2, 0., 0.], normal=[1., 1., 0.], opening=np.inf)
+        assert np.allclose(helix.getB(points()), biotSavart(*helix.getSegments(), points()), rtol=1e-10, atol=1e-20)
+
+
+def test_far_turns_of_a_helix_are_evaluated_as_loops():
+    helix = Helix(1., 1., 0.1, 20)
+    exact = biotSavart(*helix.getSegments(), points())
+    error = np.linalg.norm(helix.getB(points()) - exact, axis=1)
+    assert np.sqrt(np.mean(error ** 2)) < 0.02 * np.sqrt(np.mean(np.sum(exact ** 2, axis=1)))
+
+
+def test_msystem_adds_helices_to_its_packed_segments():
+    helix, segment = Helix(1., 1., 0.2, 5.5), Segment(2., [-1., 0., 0.], [1., 0., 3.])
+    assert np.allclose(MSystem([helix, segment]).getB(points()), helix.getB(points()) + segment.getB(points()))
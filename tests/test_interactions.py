@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from EMPY.Electrostatics.Interactions import pairInteractions
+from EMPY.Electrostatics.Charge import Charge
+from EMPY.Electrostatics.System import System
+from EMPY.Electrostatics.System3D import System3D
+from EMPY.Electrostatics.Elements import Segment
+
+rng = np.random.default_rng(0)
+
+
+# Energy, forces and potentials from the double sum over every ordered pair.
+def bruteForce(q, sourcePos):
+    energy, F, phi = 0., np.zeros(sourcePos.shape), np.zeros(len(q))
+    for i in range(len(q)):
+        for j in range(len(q)):
+            if i != j:
+                d = sourcePos[i] - sourcePos[j]
+                r = np.sqrt(d.dot(d))
+                phi[i] += q[j] / r
+                F[i] += q[i] * q[j] * d / r ** 3
+                if i < j:
+                    energy += q[i] * q[j] / r
+    return energy, F, phi
+
+
+@pytest.mark.parametrize('dim', [2, 3])
+@pytest.mark.parametrize('workers, blockSize', [(1, 256), (1, 7), (3, 16)])
+def test_pair_interactions_match_the_double_sum(dim, workers, blockSize):
+    q = rng.normal(size=150)
+    sourcePos = rng.random((150, dim)) * 10 - 5
+    energy, F, phi = bruteForce(q, sourcePos)
+    result = pairInteractions(q, sourcePos, workers=workers, blockSize=blockSize)
+    assert np.isclose(result[0], energy, rtol=1e-12)
+    assert np.allclose(result[1], F, rtol=1e-10, atol=1e-12 * np.abs(F).max())
+    assert np.allclose(result[2], phi, rtol=1e-12, atol=1e-12 * np.abs(phi).max())
+    assert pairInteractions(q, sourcePos, forces=False, blockSize=blockSize)[1] is None
+
+
+def test_system_interactions_add_the_elements_and_follow_the_charges():
+    q = rng.normal(size=40)
+    sourcePos = rng.random((40, 2)) * 4 - 2
+    system = System()
+    system.add_Charges(q, sourcePos)
+    segment = Segment(3., [-1., -2.5], [1., -2.5])
+    system.add_Element(segment)
+    alone = System()
+    alone.add_Element(segment)
+    Ee = np.array(alone.E_Total(tuple(sourcePos.T)))
+    Ve = alone.V_Total(tuple(sourcePos.T))
+
+    energy, F, phi = bruteForce(q, sourcePos)
+    result = system.interactions()
+    assert np.isclose(result[0], energy + q.dot(Ve), rtol=1e-12)
+    assert np.allclose(result[1], F + q[:, np.newaxis] * Ee.T, rtol=1e-10)
+    assert np.allclose(result[2], phi + Ve, rtol=1e-12)
+    hits = system.fieldCache.hits
+    assert np.array_equal(system.interactions()[2], result[2]) and system.fieldCache.hits == hits + 1
+
+    system.add_Charge(Charge(1., [0.5, 0.5]))
+    assert not np.isclose(system.interactions()[0], result[0])
+
+
+def test_system3D_interactions_match_the_double_sum():
+    q = rng.normal(size=60)
+    sourcePos = rng.random((60, 3))
+    energy, F, phi = bruteForce(q, sourcePos)
+    result = System3D.fromArrays(q, sourcePos).interactions(workers=2)
+    assert np.isclose(result[0], energy, rtol=1e-12)
+    assert np.allclose(result[1], F, rtol=1e-10)
+    assert np.allclose(result[2], phi, rtol=1e-12)
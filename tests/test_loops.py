@@ -0,0 +1,65 @@
+import numpy as np
+import scipy.special
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+
+
+# The field of a single loop as evaluated loop by loop before the loops were batched.
+def baselineLoop(p, loop, lengthUnits = 1.):
+    epsilon = np.finfo(np.float64).eps
+    r_vect = (p - loop.p) * lengthUnits
+    z = r_vect.dot(loop.n.T)
+    rho_vect = r_vect - np.outer(z, loop.n)
+    rho = np.linalg.norm(rho_vect, axis=1)
+    rho_vect[rho > epsilon] = (rho_vect[rho > epsilon].T / rho[rho > epsilon]).T
+    a = loop.r * lengthUnits
+    alpha2 = a * a + rho * rho + z * z - 2. * a * rho
+    beta2 = a * a + rho * rho + z * z + 2. * a * rho
+    beta = np.sqrt(beta2)
+    c = 4.e-7 * loop.i
+    a2b2 = alpha2 / beta2
+    Ek2 = scipy.special.ellipe(1. - a2b2)
+    Kk2 = scipy.special.ellipkm1(a2b2)
+    denom = 2. * alpha2 * beta * rho
+    numer = c * z * ((a * a + rho * rho + z * z) * Ek2 - alpha2 * Kk2)
+    sw = np.abs(denom) > epsilon
+    Brho = np.zeros(numer.shape)
+    Brho[sw] = numer[sw] / denom[sw]
+    Bz = c * ((a * a - rho * rho - z * z) * Ek2 + alpha2 * Kk2) / (2. * alpha2 * beta)
+    return (Brho * rho_vect.T).T + np.outer(Bz, loop.n)
+
+
+def makeLoops(**units):
+    system = LoopSystem(**units)
+    for k in range(6):
+        system.addLoop(Loop([0.2 * k, -0.1 * k, 0.4 * k], [0.3 * k, 1., 1. - 0.1 * k], 0.5 + 0.2 * k, 1.5 - 0.4 * k))
+    return system
+
+
+def test_batched_loops_match_the_loop_by_loop_sum():
+    points = np.random.default_rng(0).normal(size=(2000, 3)) * 2
+    for units in ({}, {'length_units': 1e-2, 'field_units': 1e-4}):
+        system = makeLoops(**units)
+        reference = sum(baselineLoop(points, loop, units.get('length_units', 1.)) for loop in system.loops)
+        reference /= units.get('field_units', 1.)
+        assert np.allclose(system.evaluate(points), reference, rtol=1e-10, atol=1e-12 * np.abs(reference).max())
+
+
+def test_table_loops_match_the_loop_by_loop_sum():
+    points = np.random.default_rng(1).normal(size=(2000, 3)) * 2
+    system = makeLoops()
+    system.setEllipticMode('table', 1e-10)
+    reference = sum(baselineLoop(points, loop) for loop in system.loops)
+    error = np.linalg.norm(system.evaluate(points) - reference, axis=1)
+    assert np.max(error / np.linalg.norm(reference, axis=1)) < 1e-7
+
+
+def test_single_point_and_axis_are_handled_like_a_single_loop():
+    loop = Loop([0., 0., 0.], [0., 0., 1.], 1., 2.)
+    system = LoopSystem()
+    system.addLoop(loop)
+    onAxis = np.array([[0., 0., 0.5]])
+    B = system.evaluate(onAxis[0])
+    assert B.shape == (3,)
+    assert np.allclose(B, baselineLoop(onAxis, loop)[0], rtol=1e-12)
+    # mu0 I a^2 / (2 (a^2 + z^2)^(3/2)) with mu0 = 4 pi 1e-7
+    assert np.isclose(B[2], 4e-7 * np.pi * 2. / (2. * 1.25 ** 1.5), rtol=1e-12)
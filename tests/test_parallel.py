@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from EMPY.Core import Parallel
+from EMPY.Core.Parallel import parallelEvaluate, parallel, getDefaultWorkers
+from EMPY.Electrostatics.System3D import System3D
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+from EMPY.Magnetostatics.MagneticElements import Helix
+from EMPY.Magnetostatics.MSystem import MSystem
+
+rng = np.random.default_rng(0)
+
+
+def kernel(points):
+    return np.sin(points).sum(axis=0), None, np.cumsum(points, axis=0)
+
+
+@pytest.mark.parametrize('workers, backend', [(3, 'thread'), (2, 'process')])
+def test_parallel_tiles_match_a_single_pass(workers, backend):
+    points = rng.random((3, 1000))
+    serial = parallelEvaluate(kernel, points, workers=1, tilePoints=1000)
+    tiled = parallelEvaluate(kernel, points, workers=workers, backend=backend, tilePoints=97)
+    assert tiled[1] is None
+    assert np.array_equal(tiled[0], serial[0]) and np.array_equal(tiled[2], serial[2])
+
+
+def test_systems_give_the_same_results_on_any_number_of_workers():
+    points = rng.random((3 * Parallel.DEFAULT_TILE_POINTS + 5, 3)) * 4 - 2
+    system = System3D.fromArrays(rng.normal(size=20), rng.random((20, 3)))
+    serial = np.array(system.EV_Total(tuple(points.T), workers=1))
+    system.fieldCache.clear()
+    # tiles change the summation blocking, so only rounding may differ
+    assert np.allclose(np.array(system.EV_Total(tuple(points.T), workers=3)), serial, rtol=1e-12, atol=1e-12)
+
+    loops = LoopSystem()
+    for k in range(4):
+        loops.addLoop(Loop([0, 0, k], [0, 1, 1], 1., 1.))
+    serial = loops.evaluate(points, workers=1)
+    loops.fieldCache.clear()
+    with parallel(2, 'process'):
+        assert getDefaultWorkers() == (2, 'process')
+        assert np.allclose(loops.evaluate(points), serial, rtol=1e-12, atol=1e-12)
+    assert getDefaultWorkers() == (1, 'thread')
+
+    msystem = MSystem([Helix(1., 1., 0.2, 1.5, tolerance=0.05)])
+    serial = msystem.getB(points, workers=1)
+    msystem.fieldCache.clear()
+    assert np.allclose(msystem.getB(points, workers=4), serial, rtol=1e-12, atol=1e-12)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        Parallel.setDefaultWorkers(2, 'gpu')
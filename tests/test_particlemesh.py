@@ -0,0 +1,30 @@
+import warnings
+import numpy as np
+from EMPY.Electrostatics.System import ContinuousSystem
+
+
+def plate(**mode):
+    system = ContinuousSystem()
+    system.plate([2, 2], [-1, -1], 10, 1.)
+    system.setEvaluationMode('pm', **mode)
+    return system
+
+
+def test_mesh_grows_to_cover_plot_points():
+    system = plate()
+    x, y = np.meshgrid(np.linspace(-5, 5, 40), np.linspace(-5, 5, 40))
+    system.E_Total([x, y])
+    points = np.array([x.ravel(), y.ravel()])
+    assert system.getMesh().inside(points).all()
+    # Far from the charges the mesh field is accurate
+    far = [np.linspace(3, 5, 20), np.full(20, 4.)]
+    assert system.meshError(far)['E_max'] < 0.05
+
+
+def test_fixed_bounds_warn_when_most_points_are_outside():
+    system = plate(meshBounds=([-1, -1], [1, 1]))
+    x, y = np.meshgrid(np.linspace(-5, 5, 40), np.linspace(-5, 5, 40))
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        system.E_Total([x, y])
+    assert any('outside the particle mesh' in str(w.message) for w in caught)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+import matplotlib
+matplotlib.use('Agg')
+from EMPY.Core.Render import renderTo
+from EMPY.Electrostatics.Charge import Charge
+from EMPY.Electrostatics.System import DiscreteSystem, ContinuousSystem
+from EMPY.Electrostatics.Elements import Segment
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+from EMPY.Magnetostatics.Wire import Wire, WireSystem
+from EMPY.Magnetostatics.MSystem import MSystem
+from EMPY.Magnetostatics.MagneticElements import Circular, Line
+
+
+def discreteSystem():
+    system = DiscreteSystem()
+    system.add_Charge(Charge(1, [0.5, 0.2]))
+    system.add_Charge(Charge(-1, [-0.5, -0.3]))
+    return system
+
+
+def continuousSystem():
+    system = ContinuousSystem()
+    system.add_Charges(np.full(20, 0.05), np.column_stack([np.linspace(-1, 1, 20), np.full(20, 0.5)]))
+    system.add_Element(Segment(-1., [-1, -0.5], [1, -0.5]))
+    return system
+
+
+def loopSystem():
+    system = LoopSystem()
+    system.addLoop(Loop([0, 0, 0], [1, 0, 0], 1, 1))
+    system.addLoop(Loop([1, 0, 0], [1, 0, 0], 1, 1))
+    return system
+
+
+def wireSystem():
+    system = WireSystem()
+    system.addWire([0, 0], 1., radius=0.1)
+    system.addWire([0.5, 0.5], -1.)
+    return system
+
+
+def mSystem():
+    return MSystem([Circular(1., 2.), Line(1., [[-2, 0, -2], [2, 0, 2]])])
+
+
+# (name of the figure written, call drawing it)
+PLOTS = [
+    ('plot_VectField', lambda: Charge(1, [0, 0]).plot_VectField([-1, 1], [-1, 1], showEPot=True, resolution=30)),
+    ('plotPotential3D', lambda: Charge(1, [0, 0]).plotPotential3D([-1, 1], [-1, 1], 4, resolution=30)),
+    ('plot_VectField', lambda: discreteSystem().plot_VectField([-1, 1], [-1, 1], showEPot=True, resolution=30)),
+    ('plotPotential3D', lambda: discreteSystem().plotPotential3D([-1, 1], [-1, 1], 4, resolution=30)),
+    ('plot_VectField', lambda: continuousSystem().plot_VectField([-2, 2], [-2, 2], showEPot=True, resolution=30)),
+    ('plotBField', lambda: loopSystem().plotBField(-2, 3, 20, -2, 2, 20)),
+    ('plotBField2D', lambda: Wire(0.2, [0.5, 0]).plotBField2D([-1, 1], [-1, 1])),
+    ('plotBField3D', lambda: Wire(0.2, [0.5, 0]).plotBField3D([-1, 1], [-1, 1], [-1, 1], 4)),
+    ('plotBField2D', lambda: wireSystem().plotBField2D([-1, 1], [-1, 1], 30)),
+    ('displaySystem', lambda: mSystem().displaySystem([-3, 3, 15])),
+]
+
+
+@pytest.mark.parametrize('name, plot', PLOTS)
+def test_plot_renders_to_file(tmp_path, name, plot):
+    with renderTo(str(tmp_path), ('png', 'npz')):
+        plot()
+    for extension in ('png', 'npz'):
+        path = tmp_path / (name + '.' + extension)
+        assert path.exists() and path.stat().st_size > 0
+
+
+def test_mayavi_plots_render_to_file(tmp_path):
+    pytest.importorskip('mayavi')
+    from EMPY.Electrostatics.Charge3D import Charge3D
+    from EMPY.Electrostatics.System3D import DiscreteSystem3D
+    with renderTo(str(tmp_path), ('png',)):
+        Charge3D(1, (0, 0, 0)).plotField([-1, 1], [-1, 1], [-1, 1], resolution=4)
+        DiscreteSystem3D([Charge3D(1, (0, 0, 0)), Charge3D(-1, (1, 0, 0))]).plotField([-1, 1], [-1, 1], [-1, 1], resolution=4)
+    assert (tmp_path / 'plotField.png').exists() and (tmp_path / 'plotField_1.png').exists()
@@ -0,0 +1,41 @@
+import warnings
+import numpy as np
+from EMPY.Electrostatics.Charge3D import Charge3D
+from EMPY.Electrostatics.System3D import System3D
+from EMPY.Electrostatics.SourceIndex import SourceIndex, duplicateMask
+
+
+# Charges on a line, each 0.8 from the next, so only neighbours are within the tolerance of 1.
+CHAIN = np.column_stack([0.8 * np.arange(5), np.zeros(5), np.zeros(5)])
+
+
+def quietly(build):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return build()
+
+
+def test_chain_keeps_the_same_charges_in_bulk_and_one_at_a_time():
+    single = quietly(lambda: System3D([Charge3D(1., p) for p in CHAIN], dupTolerance=1.))
+    bulk = quietly(lambda: System3D.fromArrays(np.ones(len(CHAIN)), CHAIN, dupTolerance=1.))
+    assert len(single.packedCharges) == 3
+    assert np.array_equal(single.packedCharges.getPositions(), bulk.packedCharges.getPositions())
+
+
+def test_chain_against_existing_charges():
+    system = quietly(lambda: System3D.fromArrays(np.ones(2), CHAIN[:2], dupTolerance=1.))
+    quietly(lambda: system.add_Charges3D(np.ones(3), CHAIN[2:]))
+    assert np.array_equal(system.packedCharges.getPositions(), CHAIN[[0, 2, 4]])
+
+
+def test_duplicate_mask_matches_source_index():
+    rng = np.random.default_rng(0)
+    q = rng.integers(0, 2, 500).astype(float)
+    pos = np.round(rng.uniform(0, 1, (500, 3)), 1) + rng.normal(0, 0.02, (500, 3))
+    index = SourceIndex(0.05)
+    expected = []
+    for qi, p in zip(q, pos):
+        expected.append(index.contains(qi, p))
+        if not expected[-1]:
+            index.add(qi, p)
+    assert np.array_equal(duplicateMask(q, pos, 0.05), expected)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from EMPY.Electrostatics.Charge import Charge
+from EMPY.Electrostatics.Charge3D import Charge3D
+from EMPY.Electrostatics.System import System
+from EMPY.Electrostatics.System3D import System3D
+
+
+def test_charge_list_is_read_only_and_follows_added_charges():
+    system = System()
+    system.add_Charges([1., -1.], [[0., 0.], [1., 0.]])
+    V = system.V_Total((np.array([0.5]), np.array([1.])))
+    assert isinstance(system.chargeLists, tuple) and len(system.chargeLists) == 2
+    with pytest.raises(AttributeError):
+        system.chargeLists.append(Charge(1., [2., 2.]))
+    charge = Charge(2., [0.5, 0.])
+    system.add_Charge(charge)
+    assert system.chargeLists[-1] is charge
+    assert not np.allclose(system.V_Total((np.array([0.5]), np.array([1.]))), V)
+    system.remove_Charge(charge)
+    assert len(system.chargeLists) == 2
+    assert np.allclose(system.V_Total((np.array([0.5]), np.array([1.]))), V)
+
+
+def test_charge3D_list_is_read_only_and_follows_added_charges():
+    system = System3D([Charge3D(1., [0., 0., 0.])])
+    assert isinstance(system.charge3DLists, tuple)
+    with pytest.raises(AttributeError):
+        system.charge3DLists.append(Charge3D(1., [1., 1., 1.]))
+    charge = Charge3D(-1., [1., 0., 0.])
+    system.add_Charge3D(charge)
+    assert system.get_Charge3DList() == system.charge3DLists
+    assert len(system.packedCharges) == len(system.charge3DLists) == 2
+    system.remove_Charge3D(charge)
+    assert len(system.packedCharges) == len(system.charge3DLists) == 1
+
+
+def test_live_field_follows_the_active_backend():
+    rng = np.random.default_rng(0)
+    system = System3D.fromArrays(rng.choice([-1., 1.], 500), rng.random((500, 3)))
+    fieldPos = tuple(rng.random((3, 50)) * 3 - 1)
+    system.setEvaluationMode('tree', theta=0.8)
+    live = system.liveField(fieldPos)
+    system.add_Charge3D(Charge3D(1., [0.5, 0.5, 2.]))
+    assert live.updates == 0
+    assert np.allclose(live.get(), system.EV_Total(fieldPos))
+    system.setEvaluationMode('direct')
+    assert np.allclose(live.get(), system.EV_Total(fieldPos))
+    system.add_Charge3D(Charge3D(-1., [0.5, 0.5, -1.]))
+    assert live.updates == 1
+    assert np.allclose(live.get(), system.EV_Total(fieldPos))
@@ -0,0 +1,46 @@
+import numpy as np
+from EMPY.Core.Tiling import Grid
+from EMPY.Electrostatics.System import System
+from EMPY.Electrostatics.System3D import System3D
+from EMPY.Magnetostatics.Loops import Loop, LoopSystem
+
+rng = np.random.default_rng(0)
+
+
+def test_tiles_cover_the_grid_once_within_budget():
+    grid = Grid([(0, 1), (-1, 1), (2, 3)], (7, 5, 11))
+    count = np.zeros(grid.shape, dtype=int)
+    shape = grid.tileShape(memoryBudget=8 * 23)
+    assert np.prod(shape) <= 23
+    for tile in grid.tiles(shape):
+        count[tile] += 1
+        assert grid.tilePoints(tile).shape == (3, np.prod(grid.sliceShape(tile)))
+    assert np.all(count == 1)
+    tile = (slice(2, 4), slice(0, 5), slice(3, 9))
+    assert np.array_equal(grid.tilePoints(tile), np.array([c[tile].ravel() for c in grid.meshgrid()]))
+
+
+def test_streamed_2D_field_matches_a_single_pass():
+    system = System()
+    system.add_Charges(rng.normal(size=30), rng.random((30, 2)))
+    grid = Grid([(-1, 2), (-1, 2)], (23, 17))
+    Ex, Ey, V = system.EV_Total(tuple(grid.meshgrid()))
+    tiles = list(system.iterField(grid, memoryBudget=8 * 7 * 40))
+    assert len(tiles) > 1
+    for tile, E, V_tile in tiles:
+        assert np.allclose(E[0], Ex[tile]) and np.allclose(E[1], Ey[tile]) and np.allclose(V_tile, V[tile])
+
+
+def test_streamed_3D_and_loop_fields_match_a_single_pass():
+    system = System3D.fromArrays(rng.normal(size=30), rng.random((30, 3)))
+    grid = Grid([(-1, 2), (-1, 2), (0, 1)], (9, 8, 7))
+    Ex, Ey, Ez, V = system.EV_Total(tuple(grid.meshgrid()))
+    for tile, E, V_tile in system.iterField(grid, memoryBudget=8 * 9 * 60, potential=False):
+        assert V_tile is None and np.allclose(E, np.array([Ex[tile], Ey[tile], Ez[tile]]))
+    loops = LoopSystem()
+    loops.addLoop(Loop([0.5, 0.5, 0.5], [0, 1, 1], 0.4, 2.))
+    B = loops.evaluate(np.array([c.ravel() for c in grid.meshgrid()]).T).reshape(grid.shape + (3,))
+    tiles = list(loops.iterField(grid, memoryBudget=8 * 40 * 100))
+    assert len(tiles) > 1
+    for tile, B_tile in tiles:
+        assert np.allclose(B_tile, B[tile])
@@ -0,0 +1,39 @@
+import numpy as np
+from EMPY.Electrostatics.System3D import System3D
+from EMPY.Electrostatics.Octree import Octree
+from EMPY.Electrostatics.Kernels import pointKernel
+
+
+def cloud(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n), rng.random((n, 3)), rng.random((3, 400)) * 3 - 1
+
+
+def rms(error, reference):
+    return np.sqrt(np.mean(error ** 2)) / np.sqrt(np.mean(reference ** 2))
+
+
+def test_tree_converges_to_direct_summation_as_theta_shrinks():
+    q, sourcePos, points = cloud()
+    E_direct, V_direct = pointKernel(q, sourcePos, points, True, True)
+    errors = []
+    for theta in (0.8, 0.5, 0.3):
+        E, V = Octree(q, sourcePos, theta=theta, leafSize=8).evaluate(points)
+        errors.append((rms(E - E_direct, E_direct), rms(V - V_direct, V_direct)))
+    assert errors[-1][0] < 1e-2 and errors[-1][1] < 2e-3
+    assert errors[0][0] > errors[1][0] > errors[2][0] and errors[0][1] > errors[1][1] > errors[2][1]
+    E, V = Octree(q, sourcePos, theta=1e-3, leafSize=8).evaluate(points)
+    assert np.allclose(E, E_direct) and np.allclose(V, V_direct)
+
+
+def test_tree_mode_of_a_system_matches_its_octree():
+    q, sourcePos, points = cloud(1000, seed=1)
+    system = System3D.fromArrays(q, sourcePos)
+    direct = system.EV_Total(tuple(points))
+    system.setEvaluationMode('tree', theta=0.4, leafSize=16)
+    E, V = Octree(q, sourcePos, theta=0.4, leafSize=16).evaluate(points)
+    assert np.allclose(system.EV_Total(tuple(points)), tuple(E) + (V,))
+    error = system.treeError(tuple(points), nSample=400)
+    assert error['nSample'] == 400 and error['E_rms'] < 0.05
+    system.setEvaluationMode('direct')
+    assert np.array_equal(np.array(system.EV_Total(tuple(points))), np.array(direct))
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from EMPY.Magnetostatics.Wire import Wire, WireSystem, MU0
+
+
+def test_wire_field_is_centred_on_its_position():
+    wire = Wire(0.1, [1., 2.], 3.)
+    bx, by = wire.calculateB(np.array([1., 3.]), np.array([4., 2.]))
+    # mu_0 I / (2 pi r) counterclockwise about the wire, at distance 2 from it
+    B = MU0 * 3. / (2 * np.pi * 2.)
+    assert np.allclose(bx, [-B, 0.]) and np.allclose(by, [0., B])
+
+
+def test_wire_matches_a_wire_system_of_one_wire():
+    wire = Wire(0.2, [0.5, -0.5], -2.)
+    system = WireSystem()
+    system.addWire([0.5, -0.5], -2., radius=0.2)
+    x, y = np.meshgrid(np.linspace(-1, 1, 7), np.linspace(-1, 1, 7))
+    assert np.allclose(wire.calculateB(x, y), system.calculateB(x, y))
+
+
+def test_wires_are_removed_by_their_record():
+    system = WireSystem()
+    system.addWire([0., 0.], 1.)
+    system.addWire([1., 0.], 2., direction=[0, 1, 1], radius=0.1)
+    system.addWire([0., 1.], -1.)
+    system.removeWire([0., 0.], 1.)
+    system.removeWire([1., 0.], 2., direction=[0, 1, 1], radius=0.1)
+    assert np.array_equal(system.currents, [-1.]) and np.array_equal(system.positions, [[0., 1., 0.]])
+    with pytest.raises(ValueError):
+        system.removeWire([0., 0.], 1.)